@@ -0,0 +1,347 @@
+"""
+Draw pipeline benchmark running on stand-in maya modules.
+
+Every scenario builds CameraHUD nodes, computes all ui elements once and
+plays a frame range through PluginOverride, timing compute, prepareForDraw
+and addUIDrawables per frame. Compute runs on first played frame only, as attributes
+don't change during playback, --compute requests it on every frame. Allocations are counted as stand-in maya objects created
+per frame and python memory allocated per frame (tracemalloc pass).
+--budget sets global draw budget, reported level is degradation level
+reached at the end of playback. Json results also carry node statistics
+as returned by CameraHUD -stats command. --loops plays frame range
+repeatedly as looped playback does, text hit column is expanded text cache
+hit rate and last loop column is per frame time of final loop. Played
+frame count times frame dependent item count should fit --text-cache size,
+cache entries are dropped before reuse otherwise. Text of upcoming frames
+is prefetched on background thread, benchmark waits for it between frames
+outside of timed phases as playback does, CAMERAHUD_PREFETCH_FRAMES=0
+disables prefetch.
+
+    python benchmarks/bench_draw.py
+    python benchmarks/bench_draw.py --scenario text-heavy --frames 200
+    python benchmarks/bench_draw.py --budget 1.0
+    python benchmarks/bench_draw.py --scenario text-heavy --frames 200 --loops 3 --text-cache 40000
+    python benchmarks/bench_draw.py --scenario many-node --frames 10 --no-memory --trace trace.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import maya_stub
+maya_stub.install()
+
+from camerahudlib import constants
+from camerahudlib.private.plugin_command import PluginCommand
+from camerahudlib.private.plugin_override import PluginOverride
+from camerahudlib.private.plugin_prefetch import PluginPrefetch
+from camerahudlib.private.plugin_scheduler import PluginScheduler
+from camerahudlib.private.plugin_trace import PluginTrace
+from camerahudlib.private.plugin_text_cache import PluginTextCache
+
+
+def textHeavy(scene):
+
+    """
+    one node with many token expanding text items
+    """
+
+    node = scene.createNode()
+    node.values["uiResolution"] = (1920.0, 1080.0)
+    for index in range(200):
+        node.setItem(
+            index,
+            uiType=constants.kText,
+            draw=True,
+            text="$CAMERA $FILE_SHORT frame $FRAME of $FRAME_COUNT [$FOCAL_LENGHT mm] " + str(index),
+            region=(20.0, 3.0),
+            regionPosition=(float(index % 5) * 20.0, -float(index // 5) * 2.5),
+            regionDraw=index % 4 == 0,
+            position=[(0.0, 0.0)],
+        )
+
+    return [node]
+
+
+def pointHeavy(scene):
+
+    """
+    one node with point items of many positions
+    """
+
+    node = scene.createNode()
+    node.values["uiResolution"] = (1920.0, 1080.0)
+    for index in range(20):
+        node.setItem(
+            index,
+            uiType=constants.kPoint,
+            draw=True,
+            region=(100.0, 100.0),
+            radius=2.0,
+            position=[(float(n % 100), float(n // 100) * 20.0) for n in range(500)],
+        )
+
+    return [node]
+
+
+def lineHeavy(scene):
+
+    """
+    one node with line items of many positions
+    """
+
+    node = scene.createNode()
+    node.values["uiResolution"] = (1920.0, 1080.0)
+    for index in range(20):
+        node.setItem(
+            index,
+            uiType=constants.kLine,
+            draw=True,
+            gateDraw=index == 0,
+            region=(100.0, 100.0),
+            lineStyle=constants.kLineDashed if index % 2 else constants.kLineSolid,
+            position=[(float(n % 100), float((n * 7) % 100)) for n in range(500)],
+        )
+
+    return [node]
+
+
+def manyNode(scene):
+
+    """
+    many nodes with few mixed items
+    """
+
+    nodes = []
+    types = (constants.kText, constants.kPoint, constants.kCircle, constants.kLine)
+    for node_index in range(100):
+        node = scene.createNode()
+        node.values["uiResolution"] = (1920.0, 1080.0)
+        for index in range(8):
+            ui_type = types[index % len(types)]
+            node.setItem(
+                index,
+                uiType=ui_type,
+                draw=True,
+                text="$CAMERA $FRAME",
+                region=(10.0, 5.0),
+                regionPosition=(float(index) * 10.0, 0.0),
+                position=[(float(n) * 10.0, float(n % 2) * 10.0) for n in range(1 if ui_type == constants.kText else 8)],
+            )
+
+        nodes.append(node)
+
+    return nodes
+
+
+kScenarios = {
+    "text-heavy": textHeavy,
+    "point-heavy": pointHeavy,
+    "line-heavy": lineHeavy,
+    "many-node": manyNode,
+}
+
+
+def playFrames(scene, nodes, frames, frame_context, compute_every_frame=False, compute_first_frame=True, viewport=None):
+
+    """
+    play frame range, compute is requested on first frame or every frame,
+    overrides and draw data are kept in viewport dictionary between calls
+    as maya keeps them between played loops
+
+    :return - phase durations in seconds, painter calls (tuple)
+    """
+
+    timings = {"compute": 0.0, "prepareForDraw": 0.0, "draw": 0.0}
+    if viewport is None:
+        viewport = {}
+
+    previous_data = viewport.setdefault("data", {})
+    overrides = viewport.setdefault("overrides", dict((node.name, PluginOverride(node.mobject)) for node in nodes))
+    painter = maya_stub.CountingPainter()
+
+    for frame_index, frame in enumerate(frames):
+        scene.time = float(frame)
+
+        if (frame_index == 0 and compute_first_frame) or compute_every_frame:
+            start = time.perf_counter()
+            for node in nodes:
+                node.compute()
+
+            timings["compute"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        data_list = []
+        for node in nodes:
+            data = overrides[node.name].prepareForDraw(node.path, scene.camera, frame_context, previous_data.get(node.name))
+            previous_data[node.name] = data
+            data_list.append((node, data))
+
+        timings["prepareForDraw"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for node, data in data_list:
+            overrides[node.name].addUIDrawables(node.path, painter, frame_context, data)
+
+        timings["draw"] += time.perf_counter() - start
+
+        # playback leaves idle time between frames, prefetch thread works in it
+        PluginPrefetch.wait()
+
+    return timings, painter.calls
+
+
+def runScenario(name, frame_count, measure_memory=True, compute_every_frame=False, loop_count=1):
+
+    """
+    run benchmark scenario
+
+    :param name - scenario name (str)
+    :param frame_count - played frame count (int)
+    :param measure_memory - run extra tracemalloc pass (bool)
+    :param compute_every_frame - request compute on every frame (bool)
+    :param loop_count - played frame range repeat count (int)
+
+    :return - scenario result (dict)
+    """
+
+    scene = maya_stub.newScene()
+    nodes = kScenarios[name](scene)
+    frame_context = maya_stub.FrameContext(1920, 1080)
+    frames = [int(scene.animationStart) + n for n in range(frame_count)]
+
+    # warm up caches and managers
+    playFrames(scene, nodes, frames[:2], frame_context, compute_every_frame)
+
+    for node in nodes:
+        node.instance.drawManager().textCache().clear()
+
+    maya_stub.allocations.clear()
+    viewport = {}
+    timings, calls = playFrames(scene, nodes, frames, frame_context, compute_every_frame, True, viewport)
+    loop_timings = timings
+    for _ in range(loop_count - 1):
+        loop_timings, loop_calls = playFrames(scene, nodes, frames, frame_context, compute_every_frame, False, viewport)
+        for phase in timings:
+            timings[phase] += loop_timings[phase]
+
+        for key in loop_calls:
+            calls[key] += loop_calls[key]
+
+    objects = dict(maya_stub.allocations)
+    frame_count *= loop_count
+
+    text_hits = sum(node.instance.drawManager().textCache().hits() for node in nodes)
+    text_misses = sum(node.instance.drawManager().textCache().misses() for node in nodes)
+
+    result = {
+        "scenario": name,
+        "nodes": len(nodes),
+        "frames": frame_count,
+        "ms": dict((phase, value * 1000.0 / frame_count) for phase, value in timings.items()),
+        "objects": dict((key, value // frame_count) for key, value in objects.items()),
+        "painterCalls": sum(calls.values()) // frame_count,
+        "level": max(node.instance.drawManager().scheduler().level() for node in nodes),
+        "textHitRate": text_hits / float(text_hits + text_misses) if text_hits + text_misses else None,
+        "lastLoopMs": sum(loop_timings.values()) * 1000.0 / len(frames),
+    }
+    result["ms"]["total"] = sum(result["ms"].values())
+    result["stats"] = json.loads(PluginCommand().statsData([node.name for node in nodes[:1]]))
+
+    if measure_memory:
+        tracemalloc.start()
+        snapshot_start = tracemalloc.take_snapshot()
+        playFrames(scene, nodes, frames, frame_context, compute_every_frame)
+        snapshot_end = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        allocated = 0
+        count = 0
+        for stat in snapshot_end.compare_to(snapshot_start, "filename"):
+            allocated += max(stat.size_diff, 0)
+            count += max(stat.count_diff, 0)
+
+        result["retainedBytes"] = allocated
+        result["retainedBlocks"] = count
+
+    return result
+
+
+def main(argv=None):
+
+    """
+    run benchmark scenarios from command line
+
+    :return - exit code (int)
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark CameraHUD draw pipeline on stand-in maya modules.")
+    parser.add_argument("--scenario", action="append", choices=sorted(kScenarios), help="scenario to run, all by default")
+    parser.add_argument("--frames", type=int, default=100, help="played frame count")
+    parser.add_argument("--compute", action="store_true", help="request compute on every frame")
+    parser.add_argument("--loops", type=int, default=1, help="played frame range repeat count")
+    parser.add_argument("--text-cache", type=int, default=0, help="expanded text cache size, default when 0")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc pass")
+    parser.add_argument("--budget", type=float, default=0.0, help="global draw budget in milliseconds, 0 disables")
+    parser.add_argument("--trace", help="write chrome trace of played frames to file")
+    parser.add_argument("--json", action="store_true", help="print results as json")
+    arguments = parser.parse_args(argv)
+
+    PluginScheduler.setGlobalBudget(arguments.budget)
+    if arguments.text_cache > 0:
+        os.environ[PluginTextCache.kTextSizeVariable] = str(arguments.text_cache)
+
+    if arguments.trace:
+        PluginTrace.start(arguments.trace, 1000000)
+
+    results = []
+    for name in arguments.scenario or ["text-heavy", "point-heavy", "line-heavy", "many-node"]:
+        results.append(runScenario(
+            name,
+            max(arguments.frames, 1),
+            not arguments.no_memory,
+            arguments.compute,
+            max(arguments.loops, 1)
+        ))
+
+    PluginTrace.stop()
+
+    if arguments.json:
+        print(json.dumps(results, indent=4, sort_keys=True))
+        return 0
+
+    print("%-12s %6s %10s %10s %10s %10s %10s %8s %8s %8s %6s %9s %10s" % (
+        "scenario", "nodes", "compute", "prepare", "draw", "total", "last loop",
+        "MPoint", "MColor", "calls", "level", "text hit", "retained"
+    ))
+    for result in results:
+        text_hit_rate = "-"
+        if result["textHitRate"] is not None:
+            text_hit_rate = "%.1f%%" % (result["textHitRate"] * 100.0)
+
+        print("%-12s %6d %8.3fms %8.3fms %8.3fms %8.3fms %8.3fms %8d %8d %8d %6d %9s %10s" % (
+            result["scenario"],
+            result["nodes"],
+            result["ms"]["compute"],
+            result["ms"]["prepareForDraw"],
+            result["ms"]["draw"],
+            result["ms"]["total"],
+            result["lastLoopMs"],
+            result["objects"].get("MPoint", 0),
+            result["objects"].get("MColor", 0),
+            result["painterCalls"],
+            result["level"],
+            text_hit_rate,
+            result.get("retainedBytes", "-"),
+        ))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Plugin load benchmark running on stand-in maya modules.
+
+Every run starts fresh python process, registers stand-in maya modules and
+times import of camerahud.py and initializePlugin, as mayapy batch sessions
+do when plugin is loaded but never draws. System fonts are enumerated on
+first load only, later loads read font list cache. Modules which should be
+imported on first legacy draw only are reported when loaded, exit code is
+non-zero in that case.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --importtime
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+
+# modules not needed before first legacy viewport draw
+kLazyModules = (
+    "camerahudlib.private.glpainter",
+    "camerahudlib.private.qtpainter",
+    "camerahudlib.private.qt.Qt",
+    "cProfile",
+    "pstats",
+)
+
+kChildScript = """
+import sys
+import json
+import time
+sys.path.insert(0, %(benchmarks)r)
+
+import maya_stub
+maya_stub.install(initialize=False)
+modules = set(sys.modules)
+
+start = time.perf_counter()
+import camerahud
+import_time = time.perf_counter() - start
+
+start = time.perf_counter()
+camerahud.initializePlugin(maya_stub.MObject())
+initialize_time = time.perf_counter() - start
+
+print(json.dumps({
+    "import": import_time * 1000.0,
+    "initialize": initialize_time * 1000.0,
+    "fontListCalls": maya_stub.MUIDrawManager.fontListCalls,
+    "modules": sorted(set(sys.modules) - modules),
+}))
+"""
+
+
+def runOnce(import_time=False):
+
+    """
+    load plugin in fresh process
+
+    :param import_time - print python -X importtime report to stderr (bool)
+
+    :return - load result (dict)
+    """
+
+    benchmarks = os.path.dirname(os.path.abspath(__file__))
+    command = [sys.executable]
+    if import_time:
+        command += ["-X", "importtime"]
+
+    command += ["-c", kChildScript % {"benchmarks": benchmarks}]
+    output = subprocess.check_output(command, cwd=os.path.dirname(benchmarks))
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+
+def main(argv=None):
+
+    """
+    run plugin load benchmark from command line
+
+    :return - exit code (int)
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark CameraHUD plugin load on stand-in maya modules.")
+    parser.add_argument("--runs", type=int, default=10, help="measured process count")
+    parser.add_argument("--importtime", action="store_true", help="print import time report of one extra run")
+    parser.add_argument("--json", action="store_true", help="print results as json")
+    arguments = parser.parse_args(argv)
+
+    results = [runOnce() for _ in range(max(arguments.runs, 1))]
+    if arguments.importtime:
+        runOnce(True)
+
+    import_times = sorted(result["import"] for result in results)
+    initialize_times = sorted(result["initialize"] for result in results)
+    modules = results[-1]["modules"]
+    loaded_lazy_modules = [name for name in kLazyModules if name in modules]
+
+    summary = {
+        "runs": len(results),
+        "importMedian": import_times[len(import_times) // 2],
+        "initializeMedian": initialize_times[len(initialize_times) // 2],
+        "moduleCount": len(modules),
+        "fontEnumerations": sum(result["fontListCalls"] for result in results),
+        "lazyModulesLoaded": loaded_lazy_modules,
+    }
+
+    if arguments.json:
+        print(json.dumps(summary, indent=4, sort_keys=True))
+
+    else:
+        print("runs %d, import %.2fms, initializePlugin %.2fms, %d modules imported, fonts enumerated %d times" % (
+            summary["runs"],
+            summary["importMedian"],
+            summary["initializeMedian"],
+            summary["moduleCount"],
+            summary["fontEnumerations"],
+        ))
+        for name in loaded_lazy_modules:
+            print("imported at load: " + name)
+
+    return 1 if loaded_lazy_modules else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Burn-in process pool check running on stand-in maya modules.
+
+Renders frame range through PluginBurnIn.render with worker process pool and
+serially, renderer writes expanded text of every frame instead of image as no
+qt binding is needed here. Exit code is non-zero when pool output differs from
+serial output, when worker entry points can't be pickled by reference, as
+python 2 pickles functions by module and name only, or when rendering starts
+playback prefetch thread.
+
+    python benchmarks/burnin_pool.py
+    python benchmarks/burnin_pool.py --processes 4 --frames 40
+"""
+
+import os
+import sys
+import shutil
+import pickle
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import maya_stub
+maya_stub.install()
+
+from camerahudlib import constants
+from camerahudlib.private import plugin_burnin
+from camerahudlib.private.plugin_burnin import PluginBurnIn
+from camerahudlib.private.plugin_draw_manager import PluginDrawManager
+from camerahudlib.private.plugin_prefetch import PluginPrefetch
+
+
+class TextPainter(maya_stub.CountingPainter):
+
+    """
+    painter collecting drawn text
+    """
+
+    def __init__(self):
+
+        maya_stub.CountingPainter.__init__(self)
+        self.text = []
+
+    def text2d(self, position, text, *args):
+
+        self.text.append(text)
+
+
+class TextBurnIn(PluginBurnIn):
+
+    """
+    burn-in renderer writing expanded text of frame
+    """
+
+    def renderFrame(self, frame):
+
+        self.prepareFrame(frame)
+        painter = TextPainter()
+        PluginDrawManager.draw(painter, None, self._data)
+
+        path = PluginBurnIn.framePath(self._options["output"], frame)
+        obj = open(path, "w")
+        obj.write("\n".join(painter.text))
+        obj.close()
+        return path
+
+
+def burnInOptions(output, frames):
+
+    """
+    get burn-in options with frame dependent text
+
+    :param output - output file pattern (str)
+    :param frames - frame numbers (list)
+
+    :return - burn-in options (dict)
+    """
+
+    return {
+        "preset": {"ui": {"0": {
+            "uiType": constants.kText,
+            "text": "$FRAME/$FRAME_COUNT $CAMERA $FILE_SHORT",
+            "draw": True,
+            "region": (50.0, 10.0),
+        }}},
+        "camera": {"name": "shotCam"},
+        "frames": frames,
+        "animationStart": frames[0],
+        "animationEnd": frames[-1],
+        "output": output,
+        "input": None,
+        "width": 640,
+        "height": 360,
+        "resolutionWidth": 640,
+        "resolutionHeight": 360,
+        "sceneFile": "/project/shot_v001.ma",
+        "creationTime": 0.0,
+    }
+
+
+def readFrames(paths):
+
+    """
+    read written frame text
+
+    :return - frame text list (list)
+    """
+
+    result = []
+    for path in paths:
+        if path is None:
+            result.append(None)
+            continue
+
+        obj = open(path, "r")
+        result.append(obj.read())
+        obj.close()
+
+    return result
+
+
+def main(argv=None):
+
+    """
+    check burn-in process pool from command line
+
+    :return - exit code (int)
+    """
+
+    parser = argparse.ArgumentParser(description="Check CameraHUD burn-in process pool.")
+    parser.add_argument("--processes", type=int, default=2, help="worker process count")
+    parser.add_argument("--frames", type=int, default=12, help="rendered frame count")
+    arguments = parser.parse_args(argv)
+
+    failed = []
+    for function in (plugin_burnin.initializeWorker, plugin_burnin.renderWorkerFrame):
+        if getattr(plugin_burnin, function.__name__, None) is not function:
+            failed.append(function.__name__ + " isn't module function")
+            continue
+
+        try:
+            pickle.loads(pickle.dumps(function, 2))
+
+        except Exception as exception_data:
+            failed.append(function.__name__ + " " + repr(exception_data))
+
+    frames = list(range(1001, 1001 + max(arguments.frames, 2)))
+    directory = tempfile.mkdtemp(prefix="camerahud_burnin_")
+    try:
+        serial = TextBurnIn(burnInOptions(os.path.join(directory, "serial.####.txt"), frames))
+        serial_text = readFrames(serial.render(frames, 1))
+        if PluginPrefetch.__thread__ is not None:
+            failed.append("serial render started prefetch thread")
+
+        pool = TextBurnIn(burnInOptions(os.path.join(directory, "pool.####.txt"), frames))
+        pool_text = readFrames(pool.render(frames, max(arguments.processes, 2), 2))
+
+    finally:
+        shutil.rmtree(directory)
+
+    if None in pool_text:
+        failed.append("pool frames not written")
+
+    elif pool_text != serial_text:
+        failed.append("pool frames differ from serial frames")
+
+    print("frames %d, processes %d, first frame text: %s" % (len(frames), max(arguments.processes, 2), pool_text[0]))
+    if failed:
+        print("failed: " + ", ".join(failed))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
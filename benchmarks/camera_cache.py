@@ -0,0 +1,91 @@
+"""
+Camera parameter cache check running on stand-in maya modules.
+
+Cached camera parameters are read through PluginCamera.fromPath while camera
+is deleted and created again at same path, renamed and replaced without
+delete callback. Exit code is non-zero when stale parameters are returned or
+callbacks of dropped cameras stay registered.
+
+    python benchmarks/camera_cache.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import maya_stub
+maya_stub.install()
+
+from camerahudlib.private.plugin_camera import PluginCamera
+
+
+def callbackCount(node):
+
+    """
+    get callback count registered on stand-in node
+
+    :return - callback count (int)
+    """
+
+    return sum(1 for callback in maya_stub.MMessage.callbacks.values() if callback[1] is node)
+
+
+def main():
+
+    """
+    check camera parameter cache from command line
+
+    :return - exit code (int)
+    """
+
+    failed = []
+
+    def expect(name, value, expected):
+        state = "ok" if value == expected else "failed"
+        print("%-36s %-10s %-10s %s" % (name, value, expected, state))
+        if value != expected:
+            failed.append(name)
+
+    scene = maya_stub.newScene()
+    PluginCamera.release()
+
+    # delete and create camera at same path
+    old_node = scene.cameraNode
+    expect("initial focal length", PluginCamera.fromPath(scene.camera).focalLength, 35.0)
+    scene.deleteCamera()
+    expect("deleted camera callbacks", callbackCount(old_node), 0)
+    scene.createCamera(focalLength=50.0)
+    expect("recreated focal length", PluginCamera.fromPath(scene.camera).focalLength, 50.0)
+
+    # camera replaced at same path without delete message, such as reference reload
+    old_node = scene.cameraNode
+    old_node.alive = False
+    scene.createCamera(focalLength=85.0)
+    expect("replaced focal length", PluginCamera.fromPath(scene.camera).focalLength, 85.0)
+    expect("replaced camera callbacks", callbackCount(old_node), 0)
+
+    # rename drops entry, new camera may take previous path
+    old_node = scene.cameraNode
+    old_transform = scene.cameraTransform
+    scene.renameCamera("oldCam")
+    expect("renamed camera callbacks", callbackCount(old_node) + callbackCount(old_transform), 0)
+    scene.createCamera(focalLength=24.0)
+    expect("camera at previous path", PluginCamera.fromPath(scene.camera).focalLength, 24.0)
+
+    # attribute change still invalidates cached parameters
+    scene.setCameraAttribute("focalLength", 28.0)
+    expect("changed focal length", PluginCamera.fromPath(scene.camera).focalLength, 28.0)
+
+    PluginCamera.release()
+    expect("released callbacks", callbackCount(scene.cameraNode), 0)
+
+    if failed:
+        print("failed: " + ", ".join(failed))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
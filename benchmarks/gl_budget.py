@@ -0,0 +1,168 @@
+"""
+Legacy viewport gl call budgets.
+
+Benchmark scenarios are drawn through PluginDrawManager.draw with GlPainter
+on a recording gl function table. Calls per frame are compared with budgets
+derived from drawn items, exit code is non-zero when any budget is exceeded,
+so painter or draw loop changes can't silently bring back per primitive state
+churn.
+
+    python benchmarks/gl_budget.py
+    python benchmarks/gl_budget.py --report
+"""
+
+import os
+import sys
+import json
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import maya_stub
+import bench_draw
+maya_stub.installGlPainter()
+
+from camerahudlib import constants
+from camerahudlib.private.glpainter import GlPainter
+from camerahudlib.private.plugin_draw_manager import PluginDrawManager
+
+
+# per frame budgets are derived from drawn scene, not from recorded counts, so
+# they hold while scenarios change and are loose enough for painter tweaks:
+#   gl section - drawn ui item or its region / gate outline, painter wraps each
+#                one in beginGL / endGL and restores state once at its end
+#   glBegin - one per item position plus one per section, more means primitives
+#             are split, so no headroom is added
+#   glPushAttrib - one per section with 25% headroom
+#   stateChanges - 10 per section, measured 6 - 9 for shared color, width, blend
+#                  and stipple setup, per primitive state churn adds thousands
+#   writeColorBuffer - one text image per text item, more means text is drawn twice
+#   writeColorBufferBytes - 64 KiB per text item, 256 x 64 rgba image, measured
+#                           48 - 57 KiB for benchmark text
+kSectionHeadroom = 1.25
+kStateChangesPerSection = 10
+kTextImageBytes = 256 * 64 * 4
+
+
+def sceneShape(nodes):
+
+    """
+    count drawn scene parts budgets are derived from
+
+    :param nodes - drawn stand-in nodes (list)
+
+    :return - gl section, position and text item counts (dict)
+    """
+
+    shape = {"sections": 0, "positions": 0, "texts": 0}
+    for node in nodes:
+        for item in node.values["ui"].values():
+            if not item.get("draw"):
+                continue
+
+            shape["sections"] += 1 + int(bool(item.get("regionDraw"))) + int(bool(item.get("gateDraw")))
+            shape["positions"] += len(item.get("position", []))
+            if item.get("uiType") == constants.kText:
+                shape["texts"] += 1
+
+    return shape
+
+
+def frameBudgets(shape):
+
+    """
+    get maximum calls per frame of drawn scene
+
+    :param shape - scene shape (dict)
+
+    :return - maximum calls by name (dict)
+    """
+
+    return {
+        "glBegin": shape["positions"] + shape["sections"],
+        "glPushAttrib": int(shape["sections"] * kSectionHeadroom),
+        "stateChanges": shape["sections"] * kStateChangesPerSection,
+        "writeColorBuffer": shape["texts"],
+        "writeColorBufferBytes": shape["texts"] * kTextImageBytes,
+    }
+
+
+def recordScenario(name, frame_count=3):
+
+    """
+    record gl calls of scenario drawn in legacy viewport
+
+    :param name - scenario name (str)
+    :param frame_count - played frame count (int)
+
+    :return - calls per frame by name, scene shape (tuple)
+    """
+
+    scene = maya_stub.newScene()
+    nodes = bench_draw.kScenarios[name](scene)
+    for node in nodes:
+        node.compute()
+
+    view = maya_stub.M3dView.active3dView()
+    previous_data = {}
+    maya_stub.gl_recorder.reset()
+
+    for frame in range(frame_count):
+        scene.time = scene.animationStart + frame
+        for node in nodes:
+            data = PluginDrawManager.prepareForDraw(node.path, scene.camera, None, previous_data.get(node.name), constants.kLegacyViewport)
+            previous_data[node.name] = data
+
+            painter = GlPainter(view)
+            PluginDrawManager.draw(painter, None, data)
+
+    result = maya_stub.gl_recorder.budget()
+    return dict((key, value // frame_count) for key, value in result.items()), sceneShape(nodes)
+
+
+def main(argv=None):
+
+    """
+    check gl call budgets from command line
+
+    :return - exit code (int)
+    """
+
+    parser = argparse.ArgumentParser(description="Check CameraHUD legacy viewport gl call budgets.")
+    parser.add_argument("--scenario", action="append", choices=sorted(bench_draw.kScenarios), help="scenario to check, all by default")
+    parser.add_argument("--report", action="store_true", help="print all recorded calls as json")
+    arguments = parser.parse_args(argv)
+
+    failed = []
+    report = {}
+    for name in arguments.scenario or sorted(bench_draw.kScenarios):
+        calls, shape = recordScenario(name)
+        report[name] = calls
+
+        for key, budget in sorted(frameBudgets(shape).items()):
+            value = calls.get(key, 0)
+            state = "ok"
+            if value > budget:
+                state = "over budget"
+                failed.append(name + "." + key)
+
+            print("%-12s %-22s %10d / %-10d %s" % (name, key, value, budget, state))
+
+        # begin and end must stay paired
+        for begin, end in (("glBegin", "glEnd"), ("glPushAttrib", "glPopAttrib"), ("glPushMatrix", "glPopMatrix")):
+            if calls.get(begin, 0) != calls.get(end, 0):
+                print("%-12s %s/%s unpaired" % (name, begin, end))
+                failed.append(name + "." + begin)
+
+    if arguments.report:
+        print(json.dumps(report, indent=4, sort_keys=True))
+
+    if failed:
+        print("failed: " + ", ".join(failed))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
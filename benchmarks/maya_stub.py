@@ -0,0 +1,1609 @@
+"""
+Lightweight stand-in for the parts of maya used by the draw pipeline.
+
+install() registers maya.api.OpenMaya, maya.api.OpenMayaRender,
+maya.api.OpenMayaUI, maya.api.OpenMayaAnim, maya.OpenMayaRender and
+maya.cmds modules, so PluginDrawManager.compute, prepareForDraw and draw
+run outside of Maya. Scene creates CameraHUD nodes with attribute values
+kept in plain dictionaries, node time input follows Scene.time through
+time1 connection, FrameContext and CountingPainter replace viewport objects.
+"""
+
+import os
+import sys
+import types
+import tempfile
+import collections
+
+
+# stand-in object allocations by class name
+allocations = collections.Counter()
+
+
+class MPoint(object):
+
+    __slots__ = ("x", "y", "z", "w")
+
+    def __init__(self, *args):
+
+        allocations["MPoint"] += 1
+        if len(args) == 1:
+            other = args[0]
+            if isinstance(other, (list, tuple)):
+                args = tuple(other)
+
+            else:
+                args = (other.x, other.y, other.z, getattr(other, "w", 1.0))
+
+        values = list(args) + [0.0, 0.0, 0.0, 1.0][len(args):]
+        self.x, self.y, self.z, self.w = [float(value) for value in values[:4]]
+
+    def __repr__(self):
+
+        return "MPoint(%s, %s, %s, %s)" % (self.x, self.y, self.z, self.w)
+
+
+class MVector(object):
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, *args):
+
+        allocations["MVector"] += 1
+        if len(args) == 1:
+            other = args[0]
+            if isinstance(other, (list, tuple)):
+                args = tuple(other)
+
+            else:
+                args = (other.x, other.y, other.z)
+
+        values = list(args) + [0.0, 0.0, 0.0][len(args):]
+        self.x, self.y, self.z = [float(value) for value in values[:3]]
+
+
+MVector.kYaxisVector = MVector(0.0, 1.0, 0.0)
+
+
+class MColor(object):
+
+    __slots__ = ("r", "g", "b", "a")
+
+    def __init__(self, values=(0.0, 0.0, 0.0), *args):
+
+        allocations["MColor"] += 1
+        if args:
+            values = (values,) + args
+
+        values = list(values) + [0.0, 0.0, 0.0, 1.0][len(values):]
+        self.r, self.g, self.b, self.a = [float(value) for value in values[:4]]
+
+
+class MTime(object):
+
+    kFilm = 6
+
+    def __init__(self, value=0.0, unit=kFilm):
+
+        self.value = float(value)
+
+    def asUnits(self, unit):
+
+        return self.value
+
+    @staticmethod
+    def uiUnit():
+
+        return MTime.kFilm
+
+
+class MTypeId(object):
+
+    def __init__(self, value):
+
+        self.value = value
+
+
+class MObject(object):
+
+    """
+    node or attribute handle
+    """
+
+    def __init__(self, node=None):
+
+        self.node = node
+
+    def isNull(self):
+
+        return self.node is None
+
+
+class Attribute(MObject):
+
+    """
+    attribute created by MFn*Attribute.create
+    """
+
+    def __init__(self, name, short_name, default=None):
+
+        MObject.__init__(self, self)
+        self.name = name
+        self.shortName = short_name
+        self.default = default
+        self.writable = True
+        self.cached = True
+
+    def __repr__(self):
+
+        return "Attribute(%s)" % self.name
+
+
+class _AttributeFn(object):
+
+    def __init__(self):
+
+        self._attribute = None
+
+    def __setattr__(self, key, value):
+
+        object.__setattr__(self, key, value)
+        if key in ("default", "writable", "cached") and self._attribute is not None:
+            setattr(self._attribute, key, value)
+
+    def _create(self, name, short_name, default=None):
+
+        self._attribute = Attribute(name, short_name, default)
+        return self._attribute
+
+    def setMin(self, value):
+
+        pass
+
+    def setMax(self, value):
+
+        pass
+
+    def setSoftMin(self, value):
+
+        pass
+
+    def setSoftMax(self, value):
+
+        pass
+
+
+class MFnNumericData(object):
+
+    kBoolean = 1
+    kShort = 2
+    kInt = 3
+    kFloat = 4
+    kDouble = 5
+    k2Double = 6
+    k3Float = 7
+
+
+class MFnData(object):
+
+    kString = 4
+
+
+class MFnNumericAttribute(_AttributeFn):
+
+    def create(self, name, short_name, data_type, default=None):
+
+        if default is None:
+            default = {MFnNumericData.k2Double: (0.0, 0.0), MFnNumericData.k3Float: (0.0, 0.0, 0.0)}.get(data_type, 0)
+
+        return self._create(name, short_name, default)
+
+
+class MFnEnumAttribute(_AttributeFn):
+
+    def create(self, name, short_name, default=0):
+
+        return self._create(name, short_name, default)
+
+    def addField(self, name, value):
+
+        pass
+
+
+class MFnTypedAttribute(_AttributeFn):
+
+    def create(self, name, short_name, data_type, default=None):
+
+        return self._create(name, short_name, default)
+
+
+class MFnCompoundAttribute(_AttributeFn):
+
+    def create(self, name, short_name):
+
+        return self._create(name, short_name)
+
+    def addChild(self, attribute):
+
+        pass
+
+
+class MFnUnitAttribute(_AttributeFn):
+
+    kTime = 3
+
+    def create(self, name, short_name, unit_type, default=0.0):
+
+        return self._create(name, short_name, default)
+
+
+class MFnStringData(object):
+
+    def create(self, value):
+
+        return value
+
+
+class MFnCamera(object):
+
+    kFillFilmFit = 0
+    kHorizontalFilmFit = 1
+    kVerticalFilmFit = 2
+    kOverscanFilmFit = 3
+
+    def __init__(self, camera_path):
+
+        self.__dict__.update(camera_path.parameters)
+
+
+class MObjectHandle(object):
+
+    def __init__(self, mobject):
+
+        self._node = mobject.node
+
+    def isValid(self):
+
+        return self._node is not None and getattr(self._node, "alive", True)
+
+    def __eq__(self, other):
+
+        return isinstance(other, MObjectHandle) and self._node is other._node
+
+    def __ne__(self, other):
+
+        return not self.__eq__(other)
+
+
+class MDagPath(object):
+
+    def __init__(self, full_path_name, node=None, parameters=None, transform=None):
+
+        self._full_path_name = full_path_name
+        self._node = MObject(node)
+        self._transform = MObject(transform)
+        self.parameters = parameters or {}
+
+    def fullPathName(self):
+
+        return self._full_path_name
+
+    def partialPathName(self):
+
+        return self._full_path_name.rsplit("|", 1)[-1]
+
+    def node(self):
+
+        return self._node
+
+    def transform(self):
+
+        return self._transform
+
+
+class MMessage(object):
+
+    """
+    callback registry shared by message classes
+    """
+
+    callbacks = {}
+    next_id = [1]
+
+    @staticmethod
+    def add(kind, target, function, client_data=None):
+
+        callback_id = MMessage.next_id[0]
+        MMessage.next_id[0] += 1
+        MMessage.callbacks[callback_id] = (kind, target, function, client_data)
+        return callback_id
+
+    @staticmethod
+    def removeCallback(callback_id):
+
+        MMessage.callbacks.pop(callback_id, None)
+
+    @staticmethod
+    def emit(kind, target, *args):
+
+        """
+        call callbacks registered for message kind and target
+        """
+
+        for callback_kind, callback_target, function, client_data in list(MMessage.callbacks.values()):
+            if callback_kind == kind and callback_target == target:
+                function(*(args + (client_data,)))
+
+
+class MNodeMessage(MMessage):
+
+    kConnectionMade = 0x01
+    kConnectionBroken = 0x02
+    kAttributeEval = 0x04
+    kAttributeSet = 0x08
+
+    @staticmethod
+    def addAttributeChangedCallback(node, function, client_data=None):
+
+        return MMessage.add("attributeChanged", node.node, function, client_data)
+
+    @staticmethod
+    def addNodeAboutToDeleteCallback(node, function, client_data=None):
+
+        return MMessage.add("nodeAboutToDelete", node.node, function, client_data)
+
+    @staticmethod
+    def addNameChangedCallback(node, function, client_data=None):
+
+        return MMessage.add("nameChanged", node.node, function, client_data)
+
+
+class MDGMessage(MMessage):
+
+    @staticmethod
+    def addNodeAddedCallback(function, node_type="dependNode", client_data=None):
+
+        return MMessage.add("nodeAdded", node_type, function, client_data)
+
+
+class MSceneMessage(MMessage):
+
+    kBeforeNew = 2
+    kAfterNew = 3
+    kBeforeOpen = 6
+    kAfterOpen = 7
+    kAfterSave = 10
+
+    @staticmethod
+    def addCallback(message, function, client_data=None):
+
+        return MMessage.add("scene", message, function, client_data)
+
+
+class MEventMessage(MMessage):
+
+    @staticmethod
+    def addEventCallback(event, function, client_data=None):
+
+        return MMessage.add("event", event, function, client_data)
+
+
+class MFn(object):
+
+    kPluginLocatorNode = 449
+
+
+class MItDependencyNodes(object):
+
+    """
+    iterator over CameraHUD nodes of current scene
+    """
+
+    def __init__(self, filter_type=None):
+
+        self._nodes = [node.mobject for node in _scene.nodes.values()]
+        self._index = 0
+
+    def isDone(self):
+
+        return self._index >= len(self._nodes)
+
+    def thisNode(self):
+
+        return self._nodes[self._index]
+
+    def next(self):
+
+        self._index += 1
+
+
+class MDGModifier(object):
+
+    """
+    modifier connecting plugs immediately, destination plug reads source value
+    """
+
+    def connect(self, source_plug, destination_plug):
+
+        destination_plug._node.node.connections[destination_plug._attribute.name] = source_plug
+
+    def doIt(self):
+
+        pass
+
+
+class MFileIO(object):
+
+    @staticmethod
+    def isNewFile():
+
+        return not _scene.sceneName
+
+    @staticmethod
+    def currentFile():
+
+        return _scene.sceneName
+
+
+class MAnimControl(object):
+
+    @staticmethod
+    def animationStartTime():
+
+        return MTime(_scene.animationStart)
+
+    @staticmethod
+    def animationEndTime():
+
+        return MTime(_scene.animationEnd)
+
+
+class MFnDependencyNode(object):
+
+    def __init__(self, node):
+
+        self._node = node
+
+    @property
+    def typeId(self):
+
+        return getattr(self._node.node, "typeId", None)
+
+    def findPlug(self, name, want_networked=False):
+
+        plug = MPlug(self._node, Attribute(name, name))
+        plug.isDestination = plug.isDestination or name in getattr(self._node.node, "animated", ())
+        return plug
+
+    def userNode(self):
+
+        return self._node.node.instance
+
+
+class MSelectionList(object):
+
+    """
+    selection list resolving node names of current scene
+    """
+
+    def __init__(self):
+
+        self._nodes = []
+
+    def add(self, name):
+
+        if name == _scene.timeNode.name:
+            self._nodes.append(_scene.timeNode.mobject)
+
+        else:
+            self._nodes.append(_scene.nodes[name].mobject)
+
+        return self
+
+    def getDependNode(self, index):
+
+        return self._nodes[index]
+
+
+class MUserData(object):
+
+    def __init__(self, delete_after_use=False):
+
+        pass
+
+
+class MPxNode(object):
+
+    kLocatorNode = 1
+    kParallel = 0
+    kSerial = 1
+    kGloballySerial = 2
+    kUntrusted = 3
+
+    @staticmethod
+    def addAttribute(attribute):
+
+        pass
+
+    # source attribute names by affected attribute name
+    affects = collections.defaultdict(list)
+
+    @staticmethod
+    def attributeAffects(source, target):
+
+        MPxNode.affects[target.name].append(source.name)
+
+    def __init__(self):
+
+        self._mobject = None
+
+    def thisMObject(self):
+
+        return self._mobject
+
+    def setDoNotWrite(self, value):
+
+        pass
+
+
+class MPxCommand(object):
+
+    def __init__(self):
+
+        pass
+
+
+class MPlug(object):
+
+    """
+    plug reading and writing node attribute dictionary
+    """
+
+    def __init__(self, node=None, attribute=None):
+
+        allocations["MPlug"] += 1
+        self._node = node
+        self._attribute = attribute
+        self.isNull = node is None
+        self.isDestination = attribute is not None and attribute.name in getattr(getattr(node, "node", None), "connections", {})
+
+    def _values(self):
+
+        return self._node.node.values
+
+    def _value(self):
+
+        node = self._node.node
+        source = getattr(node, "connections", {}).get(self._attribute.name)
+        if source is not None:
+            return source._value()
+
+        # output attribute is computed when affecting inputs changed since last read
+        if not self._attribute.writable and hasattr(node, "instance"):
+            name = self._attribute.name
+            key = None
+            if self._attribute.cached:
+                key = tuple(node.inputValue(source) for source in MPxNode.affects[name])
+                if name in node.outputs and node.outputs[name][0] == key:
+                    return node.outputs[name][1]
+
+            values = node._datablockValues()
+            node.instance.compute(self, MDataBlock(values))
+            value = values.get(name, self._attribute.default)
+            if key is not None:
+                node.outputs[name] = (key, value)
+
+            return value
+
+        return self._values().get(self._attribute.name, self._attribute.default)
+
+    def attribute(self):
+
+        return self._attribute
+
+    def asInt(self):
+
+        return int(self._values().get(self._attribute.name, self._attribute.default))
+
+    def asShort(self):
+
+        return self.asInt()
+
+    def asDouble(self):
+
+        return float(self._value())
+
+    def asBool(self):
+
+        return bool(self._values().get(self._attribute.name, self._attribute.default))
+
+    def asString(self):
+
+        return self._values().get(self._attribute.name, self._attribute.default)
+
+    def asMTime(self):
+
+        return MTime(self._value())
+
+    def setInt(self, value):
+
+        self._values()[self._attribute.name] = int(value)
+
+    def setDouble(self, value):
+
+        self._values()[self._attribute.name] = float(value)
+
+    def setBool(self, value):
+
+        self._values()[self._attribute.name] = bool(value)
+
+    def setString(self, value):
+
+        self._values()[self._attribute.name] = value
+
+    def setMTime(self, value):
+
+        self._values()[self._attribute.name] = value.value
+
+
+class UIElementPlug(object):
+
+    """
+    plug of ui[index] compound element as passed to compute
+    """
+
+    def __init__(self, index):
+
+        self.index = index
+        self.isNull = False
+        self.isElement = True
+        self.isChild = False
+        self.isCompound = True
+
+    def array(self):
+
+        return UIArrayPlug()
+
+    def logicalIndex(self):
+
+        return self.index
+
+    def attribute(self):
+
+        return MObject()
+
+
+class UIArrayPlug(object):
+
+    """
+    plug of ui compound array
+    """
+
+    isNull = False
+    isElement = False
+    isChild = False
+    isCompound = True
+
+    def partialName(self, *args):
+
+        return "ui"
+
+
+class MDataHandle(object):
+
+    def __init__(self, value, children=None):
+
+        self._value = value
+        self._children = children
+        self._output = None
+
+    def setClean(self):
+
+        pass
+
+    def asShort(self):
+
+        return int(self._value)
+
+    def asInt(self):
+
+        return int(self._value)
+
+    def asDouble(self):
+
+        return float(self._value)
+
+    def asFloat(self):
+
+        return float(self._value)
+
+    def asBool(self):
+
+        return bool(self._value)
+
+    def asString(self):
+
+        return self._value
+
+    def asDouble2(self):
+
+        return tuple(self._value)
+
+    def asFloat3(self):
+
+        return tuple(self._value)
+
+    def setDouble(self, value):
+
+        self._value = float(value)
+        if self._output is not None:
+            self._output[0][self._output[1]] = self._value
+
+    def asTime(self):
+
+        return MTime(self._value)
+
+    def child(self, attribute):
+
+        value = self._children.get(attribute.name, attribute.default)
+        return MDataHandle(value)
+
+
+class MArrayDataHandle(object):
+
+    def __init__(self, handle_or_elements):
+
+        if isinstance(handle_or_elements, MDataHandle):
+            handle_or_elements = handle_or_elements._value or []
+            if handle_or_elements and not isinstance(handle_or_elements[0], (list, tuple, dict)):
+                handle_or_elements = [handle_or_elements]
+
+        self._elements = handle_or_elements
+        self._current = 0
+
+    def __len__(self):
+
+        return len(self._elements)
+
+    def jumpToPhysicalElement(self, index):
+
+        self._current = index
+
+    def jumpToLogicalElement(self, index):
+
+        self._current = index
+
+    def inputValue(self):
+
+        element = self._elements[self._current]
+        if isinstance(element, dict):
+            return MDataHandle(None, element)
+
+        return MDataHandle(element)
+
+    def setClean(self):
+
+        pass
+
+
+class MDataBlock(object):
+
+    """
+    datablock over node attribute dictionary
+    """
+
+    def __init__(self, values):
+
+        self._values = values
+
+    def inputValue(self, attribute):
+
+        return MDataHandle(self._values.get(attribute.name, attribute.default))
+
+    def outputValue(self, attribute):
+
+        handle = self.inputValue(attribute)
+        handle._output = (self._values, attribute.name)
+        return handle
+
+    def inputArrayValue(self, attribute):
+
+        return MArrayDataHandle(self._values.get(attribute.name, {}))
+
+
+class MFnPlugin(object):
+
+    def __init__(self, *args):
+
+        pass
+
+    def registerNode(self, *args):
+
+        # maya runs node initializer on registration
+        if len(args) > 3:
+            args[3]()
+
+    def deregisterNode(self, *args):
+
+        pass
+
+    def registerCommand(self, *args):
+
+        pass
+
+    def deregisterCommand(self, *args):
+
+        pass
+
+
+class MSyntax(object):
+
+    kString = 1
+    kLong = 2
+    kNoArg = 0
+    kStringObjects = 1
+
+    def addFlag(self, *args):
+
+        pass
+
+    def setObjectType(self, *args):
+
+        pass
+
+
+class MGlobal(object):
+
+    @staticmethod
+    def apiVersion():
+
+        return 20200000
+
+
+class MUIDrawManager(object):
+
+    kLeft = 0
+    kCenter = 1
+    kRight = 2
+
+    kInclineNormal = 0
+    kInclineItalic = 1
+
+    kWeightLight = 25
+    kWeightBold = 75
+
+    kLineOverline = 1
+    kLineUnderline = 2
+    kLineStrikeoutLine = 3
+
+    kSolid = 0
+    kShortDotted = 1
+    kShortDashed = 2
+    kDashed = 3
+    kDotted = 4
+
+    kDefaultFontSize = 12
+    kStretchUnstretched = 100
+
+    # system font enumeration count
+    fontListCalls = 0
+
+    @staticmethod
+    def getFontList():
+
+        MUIDrawManager.fontListCalls += 1
+        return ["Arial", "Courier New", "Helvetica", "Times New Roman"]
+
+
+class MPxDrawOverride(object):
+
+    def __init__(self, obj, callback=None, always_dirty=True):
+
+        self._obj = obj
+
+
+class MRenderer(object):
+
+    kOpenGL = 1
+    kDirectX11 = 2
+    kOpenGLCoreProfile = 4
+
+
+class MDrawRegistry(object):
+
+    @staticmethod
+    def registerDrawOverrideCreator(*args):
+
+        pass
+
+    @staticmethod
+    def deregisterDrawOverrideCreator(*args):
+
+        pass
+
+
+class MPxLocatorNode(MPxNode):
+
+    pass
+
+
+class M3dView(object):
+
+    """
+    legacy viewport with fixed port size, gl calls are recorded by gl_recorder
+    """
+
+    kWidth = 1920
+    kHeight = 1080
+
+    @staticmethod
+    def active3dView():
+
+        return M3dView()
+
+    def portWidth(self):
+
+        return M3dView.kWidth
+
+    def portHeight(self):
+
+        return M3dView.kHeight
+
+    def beginGL(self):
+
+        gl_recorder.calls["beginGL"] += 1
+
+    def endGL(self):
+
+        gl_recorder.calls["endGL"] += 1
+
+    def writeColorBuffer(self, image, x=0, y=0):
+
+        gl_recorder.calls["writeColorBuffer"] += 1
+        gl_recorder.calls["writeColorBufferBytes"] += image.byteCount
+
+
+class MImage(object):
+
+    def __init__(self):
+
+        self.byteCount = 0
+
+    def setPixels(self, pixels, width, height):
+
+        self.byteCount = len(pixels)
+
+    def verticalFlip(self):
+
+        pass
+
+    def setRGBA(self, value):
+
+        pass
+
+
+class GlFunctionTable(object):
+
+    """
+    gl function table counting calls by entry point name
+    """
+
+    def __init__(self):
+
+        self.calls = collections.Counter()
+
+    def __getattr__(self, name):
+
+        if not name.startswith("gl"):
+            raise AttributeError(name)
+
+        calls = self.calls
+
+        def call(*args):
+            calls[name] += 1
+
+        self.__dict__[name] = call
+        return call
+
+    def reset(self):
+
+        """
+        clear recorded calls
+        """
+
+        self.calls.clear()
+
+    def budget(self):
+
+        """
+        get recorded calls with derived state change counters
+
+        :return - call counts by name (dict)
+        """
+
+        result = dict(self.calls)
+        result["stateChanges"] = sum(
+            count for name, count in self.calls.items()
+            if name in ("glEnable", "glDisable", "glLineWidth", "glPointSize", "glLineStipple", "glColor4f", "glBlendFunc")
+        )
+        return result
+
+
+# gl calls of legacy viewport painter
+gl_recorder = GlFunctionTable()
+
+
+class MHardwareRenderer(object):
+
+    @staticmethod
+    def theRenderer():
+
+        return MHardwareRenderer()
+
+    def glFunctionTable(self):
+
+        return gl_recorder
+
+
+class FrameContext(object):
+
+    """
+    viewport 2.0 frame context
+    """
+
+    def __init__(self, width=1920, height=1080):
+
+        self.width = width
+        self.height = height
+
+    def getViewportDimensions(self):
+
+        return 0, 0, self.width, self.height
+
+
+class CountingPainter(object):
+
+    """
+    painter counting calls by method name
+    """
+
+    def __init__(self):
+
+        self.calls = collections.Counter()
+
+    def __getattr__(self, name):
+
+        # viewport 2.0 draw manager has no legacy painter text prefetch
+        if name == "prefetchText":
+            raise AttributeError(name)
+
+        calls = self.calls
+
+        def call(*args, **kwargs):
+            calls[name] += 1
+
+        self.__dict__[name] = call
+        return call
+
+    def total(self):
+
+        return sum(self.calls.values())
+
+
+class Cmds(object):
+
+    """
+    maya.cmds subset backed by Scene
+    """
+
+    def __init__(self, scene):
+
+        self._scene = scene
+
+    def ls(self, type=None, **kwargs):
+
+        return list(self._scene.nodes.keys())
+
+    def getAttr(self, attribute, **kwargs):
+
+        name, attribute_name = attribute.split(".", 1)
+        node = self._scene.nodes[name]
+        if attribute_name in ("hudi", "hudIndex"):
+            return node.values.get("hudIndex", -1)
+
+        return node.values.get(attribute_name)
+
+    def objExists(self, name):
+
+        return name in self._scene.nodes
+
+    def file(self, q=False, sn=False, **kwargs):
+
+        return self._scene.sceneName
+
+    def currentTime(self, q=False, **kwargs):
+
+        return self._scene.time
+
+    def playbackOptions(self, q=False, ast=False, aet=False, **kwargs):
+
+        if ast:
+            return self._scene.animationStart
+
+        return self._scene.animationEnd
+
+
+class Node(object):
+
+    """
+    scene node holding plugin instance and attribute values
+    """
+
+    def __init__(self, name, instance):
+
+        self.name = name
+        self.instance = instance
+        self.values = {"ui": {}}
+        self.connections = {}
+        self.outputs = {}
+        self.typeId = None
+        self.mobject = MObject(self)
+        self.path = MDagPath("|" + name + "|" + name + "Shape", self)
+
+    def setItem(self, index, **values):
+
+        """
+        set ui[index] attribute values by long attribute name
+        """
+
+        self.values["ui"].setdefault(index, {}).update(values)
+
+    def inputValue(self, name):
+
+        """
+        get input attribute value, connected inputs read source plug
+        """
+
+        source = self.connections.get(name)
+        if source is not None:
+            return source._value()
+
+        return self.values.get(name)
+
+    def compute(self, index=None):
+
+        """
+        compute ui[index] element, all elements if None
+        """
+
+        indexes = sorted(self.values["ui"]) if index is None else [index]
+        datablock = MDataBlock(self._datablockValues())
+        for element_index in indexes:
+            self.instance.compute(UIElementPlug(element_index), datablock)
+
+    def _datablockValues(self):
+
+        values = dict(self.values)
+        values["ui"] = _ElementList(self.values["ui"])
+        for name, source_plug in self.connections.items():
+            values[name] = source_plug._value()
+
+        return values
+
+
+class _ElementList(object):
+
+    """
+    logical index to element dictionary used by MArrayDataHandle
+    """
+
+    def __init__(self, elements):
+
+        self._elements = elements
+
+    def __len__(self):
+
+        return len(self._elements)
+
+    def __getitem__(self, index):
+
+        return self._elements[index]
+
+
+class TimeNode(object):
+
+    """
+    time node with output following scene time
+    """
+
+    def __init__(self, scene_data):
+
+        self.name = "time1"
+        self.mobject = MObject(self)
+        self._scene = scene_data
+
+    @property
+    def values(self):
+
+        return {"outTime": self._scene.time}
+
+
+class CameraNode(object):
+
+    """
+    camera shape node with driven attribute names
+    """
+
+    def __init__(self, name):
+
+        self.name = name
+        self.animated = set()
+        self.alive = True
+
+
+class Scene(object):
+
+    """
+    scene with CameraHUD nodes, camera and time
+    """
+
+    def __init__(self):
+
+        self.nodes = collections.OrderedDict()
+        self.sceneName = "/projects/show/shot/scenes/shot_v001.ma"
+        self.time = 1001.0
+        self.animationStart = 1001.0
+        self.animationEnd = 1100.0
+        self.timeNode = TimeNode(self)
+        self.createCamera()
+
+    def createCamera(self, name="shotCam", **parameters):
+
+        """
+        create camera, replaces current camera, node at same path is new node
+        """
+
+        self.cameraNode = CameraNode(name + "Shape")
+        self.cameraTransform = CameraNode(name)
+        self.camera = MDagPath("|%s|%sShape" % (name, name), self.cameraNode, {
+            "panZoomEnabled": False,
+            "zoom": 1.0,
+            "horizontalPan": 0.0,
+            "verticalPan": 0.0,
+            "lensSqueezeRatio": 1.0,
+            "horizontalFilmAperture": 1.41732,
+            "verticalFilmAperture": 0.94488,
+            "focalLength": 35.0,
+            "focusDistance": 5.0,
+            "filmFit": MFnCamera.kFillFilmFit,
+            "overscan": 1.0,
+        }, self.cameraTransform)
+        self.camera.parameters.update(parameters)
+        return self.camera
+
+    def deleteCamera(self):
+
+        """
+        delete current camera, about to delete callbacks are called first
+        """
+
+        MMessage.emit("nodeAboutToDelete", self.cameraNode, MObject(self.cameraNode), None)
+        self.cameraNode.alive = False
+        self.cameraTransform.alive = False
+
+    def renameCamera(self, name):
+
+        """
+        rename current camera transform, path of current camera changes
+        """
+
+        previous_name = self.cameraTransform.name
+        self.cameraTransform.name = name
+        self.camera._full_path_name = "|%s|%s" % (name, self.cameraNode.name)
+        MMessage.emit("nameChanged", self.cameraTransform, MObject(self.cameraTransform), previous_name)
+
+    def setCameraAttribute(self, name, value):
+
+        """
+        set camera attribute and notify attribute changed callbacks
+        """
+
+        self.camera.parameters[name] = value
+        MMessage.emit("attributeChanged", self.cameraNode, MNodeMessage.kAttributeSet, None, None)
+
+    def setCameraAnimated(self, name, animated=True):
+
+        """
+        connect or disconnect camera attribute driver
+        """
+
+        if animated:
+            self.cameraNode.animated.add(name)
+
+        else:
+            self.cameraNode.animated.discard(name)
+
+        message = MNodeMessage.kConnectionMade if animated else MNodeMessage.kConnectionBroken
+        MMessage.emit("attributeChanged", self.cameraNode, message, None, None)
+
+    def createNode(self, name=None):
+
+        """
+        create CameraHUD node
+        """
+
+        from camerahudlib import constants
+        from camerahudlib.private.plugin import Plugin
+
+        name = name or "CameraHUD%d" % (len(self.nodes) + 1)
+        node = Node(name, Plugin.creator())
+        node.typeId = constants.kId
+        node.instance._mobject = node.mobject
+        self.nodes[name] = node
+        node.instance.postConstructor()
+        MMessage.emit("nodeAdded", constants.kName, node.mobject)
+
+        return node
+
+
+class _QtNamespace(object):
+
+    AlignLeft = 0x0001
+    AlignRight = 0x0002
+    AlignHCenter = 0x0004
+    AlignVCenter = 0x0080
+    transparent = 19
+
+
+class _QFont(object):
+
+    Light = 25
+    Bold = 75
+
+    def __init__(self, name="Arial"):
+
+        self.pixelSize = 12
+
+    def setPixelSize(self, size):
+
+        self.pixelSize = size
+
+    def __getattr__(self, name):
+
+        if name.startswith("set"):
+            return lambda *args: None
+
+        raise AttributeError(name)
+
+
+class _QFontMetrics(object):
+
+    def __init__(self, font):
+
+        self._size = max(font.pixelSize, 1)
+
+    def width(self, text):
+
+        return int(len(text) * self._size * 0.6)
+
+    def height(self):
+
+        return int(self._size * 1.2)
+
+
+class _QImage(object):
+
+    Format_RGBA8888 = 17
+
+    def __init__(self, width, height, image_format=None):
+
+        gl_recorder.calls["QImage"] += 1
+        self._width = int(width)
+        self._height = int(height)
+
+    def width(self):
+
+        return self._width
+
+    def height(self):
+
+        return self._height
+
+    def byteCount(self):
+
+        return self._width * self._height * 4
+
+    def bits(self):
+
+        return bytes(self.byteCount())
+
+    def fill(self, color):
+
+        pass
+
+
+class _QPainter(object):
+
+    Antialiasing = 1
+
+    def __getattr__(self, name):
+
+        return lambda *args: None
+
+
+class _QtCore(object):
+
+    Qt = _QtNamespace
+
+
+class _QtGui(object):
+
+    QFont = _QFont
+    QFontMetrics = _QFontMetrics
+    QImage = _QImage
+    QPainter = _QPainter
+    QColor = staticmethod(lambda *args: args)
+    QPen = staticmethod(lambda *args: args)
+    QBrush = staticmethod(lambda *args: args)
+
+
+def installGlPainter():
+
+    """
+    use text rasterizing stand-ins in GlPainter when no qt binding is available
+    """
+
+    from camerahudlib.private.qt import Qt
+    from camerahudlib.private import glpainter
+
+    if Qt.__binding__ == "None":
+        glpainter.QtCore = _QtCore
+        glpainter.QtGui = _QtGui
+
+
+_scene = None
+
+
+def scene():
+
+    """
+    get current scene
+    """
+
+    return _scene
+
+
+def newScene():
+
+    """
+    replace current scene, drawing managers of previous scene are dropped
+    """
+
+    global _scene
+    MMessage.emit("scene", MSceneMessage.kBeforeNew)
+    _scene = Scene()
+    sys.modules["maya.cmds"]._bind(_scene)
+    MMessage.emit("scene", MSceneMessage.kAfterNew)
+
+    from camerahudlib.private.plugin_draw_manager import PluginDrawManager
+    PluginDrawManager.__cache__.clear()
+
+    return _scene
+
+
+def _module(name, members):
+
+    module = types.ModuleType(name)
+    module.__dict__.update(members)
+    sys.modules[name] = module
+    return module
+
+
+def install(initialize=True):
+
+    """
+    register stand-in maya modules and initialize plugin attributes
+
+    :param initialize - import and initialize plugin, only modules are registered if False (bool)
+    """
+
+    if "maya.api.OpenMaya" in sys.modules and getattr(sys.modules["maya"], "__stub__", False):
+        return
+
+    # Qt.py fallback binding, painters using Qt are not exercised here
+    os.environ.setdefault("QT_PREFERRED_BINDING", "None")
+
+    # keep font list cache out of user maya directory
+    os.environ.setdefault("CAMERAHUD_FONT_CACHE", os.path.join(tempfile.gettempdir(), "camerahud_stub_fonts.json"))
+
+    open_maya = _module("maya.api.OpenMaya", dict(
+        MPoint=MPoint,
+        MVector=MVector,
+        MColor=MColor,
+        MTypeId=MTypeId,
+        MObject=MObject,
+        MTime=MTime,
+        MFnNumericData=MFnNumericData,
+        MFnData=MFnData,
+        MFnNumericAttribute=MFnNumericAttribute,
+        MFnEnumAttribute=MFnEnumAttribute,
+        MFnTypedAttribute=MFnTypedAttribute,
+        MFnUnitAttribute=MFnUnitAttribute,
+        MFnCompoundAttribute=MFnCompoundAttribute,
+        MFnStringData=MFnStringData,
+        MFnCamera=MFnCamera,
+        MDagPath=MDagPath,
+        MObjectHandle=MObjectHandle,
+        MUserData=MUserData,
+        MMessage=MMessage,
+        MNodeMessage=MNodeMessage,
+        MSceneMessage=MSceneMessage,
+        MDGMessage=MDGMessage,
+        MEventMessage=MEventMessage,
+        MFn=MFn,
+        MItDependencyNodes=MItDependencyNodes,
+        MDGModifier=MDGModifier,
+        MFileIO=MFileIO,
+        MFnDependencyNode=MFnDependencyNode,
+        MSelectionList=MSelectionList,
+        MPxNode=MPxNode,
+        MPxCommand=MPxCommand,
+        MPlug=MPlug,
+        MDataHandle=MDataHandle,
+        MArrayDataHandle=MArrayDataHandle,
+        MDataBlock=MDataBlock,
+        MFnPlugin=MFnPlugin,
+        MSyntax=MSyntax,
+        MImage=MImage,
+        MGlobal=MGlobal,
+    ))
+    open_maya_render = _module("maya.api.OpenMayaRender", dict(
+        MUIDrawManager=MUIDrawManager,
+        MPxDrawOverride=MPxDrawOverride,
+        MRenderer=MRenderer,
+        MDrawRegistry=MDrawRegistry,
+        MFrameContext=FrameContext,
+    ))
+    open_maya_ui = _module("maya.api.OpenMayaUI", dict(
+        MPxLocatorNode=MPxLocatorNode,
+        M3dView=M3dView,
+    ))
+    open_maya_anim = _module("maya.api.OpenMayaAnim", dict(MAnimControl=MAnimControl))
+    open_maya_render_old = _module("maya.OpenMayaRender", dict(MHardwareRenderer=MHardwareRenderer))
+    for index, name in enumerate((
+        "MGL_ALL_ATTRIB_BITS", "MGL_BLEND", "MGL_CULL_VERTEX_EXT", "MGL_LINES", "MGL_LINE_LOOP",
+        "MGL_LINE_STIPPLE", "MGL_MODELVIEW", "MGL_ONE_MINUS_SRC_ALPHA", "MGL_POINTS", "MGL_POLYGON",
+        "MGL_PROJECTION", "MGL_SRC_ALPHA"
+    )):
+        setattr(open_maya_render_old, name, index + 1)
+
+    cmds = _module("maya.cmds", {})
+    cmds._bind = lambda scene_data: cmds.__dict__.update(
+        (name, getattr(Cmds(scene_data), name)) for name in dir(Cmds) if not name.startswith("_")
+    )
+
+    api = _module("maya.api", dict(
+        OpenMaya=open_maya,
+        OpenMayaRender=open_maya_render,
+        OpenMayaUI=open_maya_ui,
+        OpenMayaAnim=open_maya_anim
+    ))
+    _module("maya", dict(api=api, cmds=cmds, OpenMayaRender=open_maya_render_old, __stub__=True))
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    if not initialize:
+        return None
+
+    from camerahudlib.private.plugin import Plugin
+    Plugin.initialize()
+
+    from camerahudlib.private.plugin_camera import PluginCamera
+    PluginCamera.initializeCallbacks()
+
+    from camerahudlib.private.plugin_scene import PluginScene
+    PluginScene.initializeCallbacks()
+
+    newScene()
@@ -3,8 +3,13 @@ import maya.api.OpenMayaRender as OpenMayaRender
 from camerahudlib import constants
 from camerahudlib.private.logger import logger
 from camerahudlib.private.plugin import Plugin
+from camerahudlib.private.plugin_camera import PluginCamera
 from camerahudlib.private.plugin_override import PluginOverride
+from camerahudlib.private.plugin_prefetch import PluginPrefetch
 from camerahudlib.private.plugin_command import PluginCommand
+from camerahudlib.private.plugin_profiler import PluginProfiler
+from camerahudlib.private.plugin_scene import PluginScene
+from camerahudlib.private.plugin_trace import PluginTrace
 
 
 def maya_useNewAPI():
@@ -60,6 +65,29 @@ def initializePlugin(obj):
         logger.error("can`t register command")
         raise
 
+    try:
+        PluginCamera.initializeCallbacks()
+
+    except Exception as exception_data:
+        logger.error(repr(exception_data))
+        logger.error("can`t register camera callbacks")
+        raise
+
+    try:
+        PluginScene.initializeCallbacks()
+
+    except Exception as exception_data:
+        logger.error(repr(exception_data))
+        logger.error("can`t register scene callbacks")
+        raise
+
+    try:
+        PluginTrace.initialize()
+
+    except Exception as exception_data:
+        logger.error(repr(exception_data))
+        logger.error("can`t start trace")
+
 
 def uninitializePlugin(obj):
 
@@ -69,6 +97,37 @@ def uninitializePlugin(obj):
 
     plugin = OpenMaya.MFnPlugin(obj)
 
+    try:
+        PluginTrace.stop()
+        PluginProfiler.stop()
+
+    except Exception as exception_data:
+        logger.error(repr(exception_data))
+        logger.error("can`t write trace or profile")
+
+    try:
+        PluginPrefetch.stop()
+
+    except Exception as exception_data:
+        logger.error(repr(exception_data))
+        logger.error("can`t stop prefetch thread")
+
+    try:
+        PluginCamera.uninitializeCallbacks()
+
+    except Exception as exception_data:
+        logger.error(repr(exception_data))
+        logger.error("can`t unregister camera callbacks")
+        raise
+
+    try:
+        PluginScene.uninitializeCallbacks()
+
+    except Exception as exception_data:
+        logger.error(repr(exception_data))
+        logger.error("can`t unregister scene callbacks")
+        raise
+
     try:
         plugin.deregisterNode(constants.kId)
 
@@ -0,0 +1,6 @@
+import sys
+from camerahudlib.private.plugin_burnin import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,28 @@ kCircle = 2
 kLine = 3
 kNone = 100
 
+# text tokens changing every frame, animation range tokens change per shot
+kFrameTokens = ("$FRAME_REAL", "$FRAME")
+kAnimationRangeTokens = ("$FRAME_AST", "$FRAME_AET", "$FRAME_COUNT")
+
+# text tokens changing with drawing camera, expanded on draw
+kCameraTokens = ("$CAMERA", "$FOCAL_LENGHT", "$FOCUS_DISTANCE")
+
+# draw priority, low priority items are skipped first when draw budget is exceeded
+kPriorityLow = 0
+kPriorityNormal = 1
+kPriorityHigh = 2
+
+# draw degradation level, applied in order while draw budget is exceeded
+kDegradeNone = 0
+kDegradeSkipRegions = 1
+kDegradeReuseText = 2
+kDegradeCircleDetail = 3
+kDegradeSkipLowPriority = 4
+
+# circle segment count used by lowered circle detail
+kDegradeCircleSegments = 8
+
 # draw alignment
 kAttachHorizontalLeft = 0
 kAttachHorizontalRight = 1
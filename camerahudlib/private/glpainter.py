@@ -4,10 +4,16 @@ import maya.OpenMayaRender as OpenMayaRender_old
 from camerahudlib import constants
 from camerahudlib.private.qt import Qt
 from camerahudlib.private.qt.Qt import QtCore, QtGui
+from camerahudlib.private.plugin_prefetch import PluginPrefetch
+from camerahudlib.private.plugin_text_cache import PluginTextCache
+from camerahudlib.private.plugin_trace import PluginTrace
 
 
 class GlPainter(object):
 
+    # upcoming frame count rasterized ahead, kept low as images stay in shared texture cache
+    kPrefetchImages = 2
+
     def __init__(self, view):
 
         """
@@ -31,6 +37,15 @@ class GlPainter(object):
         self._font_name = "Arial"
         self._font_metric = QtGui.QFontMetrics(self._font)
 
+        # maximum circle segment count, 0 is unlimited
+        self._circle_segments = 0
+
+        # current color, part of rasterized text cache key
+        self._color = (0.0, 0.0, 0.0, 1.0)
+
+        # text rasterized on draw, cached and prefetched text isn't counted
+        self._rasterizations = 0
+
         q_color = QtGui.QColor(0.0, 0.0, 0.0)
         self._pen = QtGui.QPen(q_color)
         self._brush = QtGui.QBrush(q_color)
@@ -136,6 +151,7 @@ class GlPainter(object):
 
         if self.isBegin():
             self._gl_function_table.glColor4f(color.r, color.g, color.b, color.a)
+            self._color = (color.r, color.g, color.b, color.a)
             q_color = QtGui.QColor(color.r * 255, color.g * 255, color.b * 255, color.a * 255)
             self._pen = QtGui.QPen(q_color)
             self._brush = QtGui.QBrush(q_color)
@@ -304,6 +320,26 @@ class GlPainter(object):
             else:
                 self._gl_function_table.glDisable(OpenMayaRender_old.MGL_LINE_STIPPLE)
 
+    def rasterizations(self):
+
+        """
+        get count of text rasterized by this painter on draw
+
+        :return - rasterized text count (int)
+        """
+
+        return self._rasterizations
+
+    def setCircleSegments(self, count):
+
+        """
+        set maximum circle segment count
+
+        :param count - maximum segment count, 0 is unlimited (int)
+        """
+
+        self._circle_segments = count
+
     def line2d(self, from_point, to_point):
 
         """
@@ -388,6 +424,9 @@ class GlPainter(object):
             elif segment_count < 8:
                 segment_count = 8
 
+            if 0 < self._circle_segments < segment_count:
+                segment_count = self._circle_segments
+
             i = 0
             while i < segment_count:
                 angle = 2.0 * math.pi * i / float(segment_count)
@@ -398,87 +437,249 @@ class GlPainter(object):
 
             self._gl_function_table.glEnd()
 
-    def text2d(self, position, text, alignment=constants.kLeft, backgroundSize=None, backgroundColor=None, dynamic=False):
+    def textLayout(self, position, text, alignment, backgroundSize):
 
         """
-        draw text 2d
+        calculate text image placement
 
         :param position - text position (OpenMaya.MPoint)
         :param text - text (str)
         :param alignment - text (OpenMayaRender.MUIDrawManager.TextAlignment)
+        :param backgroundSize - text background size, text size if None (list)
+
+        :return - x, y, width, height, qt alignment, text x offset, text y offset and background size (tuple)
+        """
+
+        if not backgroundSize:
+            backgroundSize = [self._font_metric.width(text), self._font_metric.height()]
+
+        # calculate position.
+        alignment_offset = 0.0
+        if alignment == constants.kLeft:
+            alignment = QtCore.Qt.AlignLeft
+
+        else:
+            if alignment == constants.kRight:
+                alignment = QtCore.Qt.AlignRight
+                alignment_offset = backgroundSize[0]
+
+            elif alignment == constants.kCenter:
+                alignment = QtCore.Qt.AlignHCenter
+                alignment_offset = backgroundSize[0] * 0.5
+
+            else:
+                alignment = QtCore.Qt.AlignLeft
+
+            text_width = self._font_metric.width(text)
+            if text_width >= backgroundSize[0]:
+                alignment = QtCore.Qt.AlignLeft
+
+        alignment |= QtCore.Qt.AlignVCenter
+
+        # calculate position and size
+        width, height = backgroundSize[0], backgroundSize[1]
+        x = int(position.x - alignment_offset)
+        y = int(position.y)
+        x_offset = 0
+        y_offset = 0
+        if x < 0:
+            x_offset = x
+            width += x_offset
+            x = 0
+
+        if y < 0:
+            y_offset = y
+            height += y_offset
+            y = 0
+
+        return x, y, width, height, alignment, x_offset, y_offset, backgroundSize
+
+    def textKey(self, text, alignment, backgroundSize, backgroundColor, x_offset, y_offset):
+
+        """
+        get rasterized text cache key, rasterized text is reused while text, font,
+        colors and clipping stay the same
+
+        :param text - text (str)
+        :param alignment - qt text alignment (int)
+        :param backgroundSize - text background size (list)
+        :param backgroundColor - text background color (OpenMaya.MColor)
+        :param x_offset - text x offset (int)
+        :param y_offset - text y offset (int)
+
+        :return - cache key (tuple)
+        """
+
+        return (
+            text,
+            self._font_name,
+            self._font_size,
+            self._font_stretch,
+            self._font_weight,
+            self._font_incline,
+            self._font_line,
+            self._color,
+            None if backgroundColor is None else (backgroundColor.r, backgroundColor.g, backgroundColor.b, backgroundColor.a),
+            int(alignment),
+            backgroundSize[0],
+            backgroundSize[1],
+            x_offset,
+            y_offset
+        )
+
+    @staticmethod
+    def rasterizeText(painter, pen, brush, font, text, width, height, alignment, x_offset, y_offset, backgroundSize, backgroundColor):
+
+        """
+        paint text into image, doesn't use viewport so it runs on prefetch thread too
+
+        :param painter - painter used for image (QtGui.QPainter)
+        :param pen - text pen (QtGui.QPen)
+        :param brush - text brush (QtGui.QBrush)
+        :param font - text font (QtGui.QFont)
+        :param text - text (str)
+        :param width - image width (int)
+        :param height - image height (int)
+        :param alignment - qt text alignment (int)
+        :param x_offset - text x offset (int)
+        :param y_offset - text y offset (int)
+        :param backgroundSize - text background size (list)
+        :param backgroundColor - text background color (OpenMaya.MColor)
+
+        :return - rasterized text (QtGui.QImage)
+        """
+
+        # create image.
+        q_image = QtGui.QImage(width, height, QtGui.QImage.Format_RGBA8888)
+        q_image.fill(QtCore.Qt.transparent)
+        painter.begin(q_image)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+
+        painter.setPen(pen)
+        painter.setBrush(brush)
+        painter.setFont(font)
+
+        # fill background color.
+        if backgroundColor is not None:
+            painter.fillRect(0, 0, width, height, QtGui.QColor(backgroundColor.r * 255, backgroundColor.g * 255, backgroundColor.b * 255, backgroundColor.a * 255))
+
+        # paint text
+        painter.drawText(x_offset, y_offset, backgroundSize[0], backgroundSize[1], alignment, text)
+        painter.end()
+
+        return q_image
+
+    @staticmethod
+    def prefetchImage(key, pen, brush, font, text, width, height, alignment, x_offset, y_offset, backgroundSize, backgroundColor):
+
+        """
+        rasterize text on prefetch thread and cache it, image is converted and uploaded on draw
+
+        :param key - rasterized text cache key (tuple)
+        """
+
+        texture_cache = PluginTextCache.textures()
+        if texture_cache.contains(key):
+            return None
+
+        q_image = GlPainter.rasterizeText(
+            QtGui.QPainter(), pen, brush, font, text, width, height, alignment, x_offset, y_offset, backgroundSize, backgroundColor
+        )
+        texture_cache.set(key, q_image)
+
+    def prefetchText(self, position, texts, alignment=constants.kLeft, backgroundSize=None, backgroundColor=None):
+
+        """
+        rasterize text of upcoming frames on prefetch thread with current font and colors,
+        text2d then only uploads ready images
+
+        :param position - text position (OpenMaya.MPoint)
+        :param texts - upcoming text (list)
+        :param alignment - text (OpenMayaRender.MUIDrawManager.TextAlignment)
         :param backgroundSize - text background size (int)
         :param backgroundColor - text background color (OpenMaya.MColor)
-        :param dynamic - text is dynamic (bool)
         """
 
-        if self.isBegin():
-            # generate texture with QtGui.QPainter
-            if not backgroundSize:
-                backgroundSize = [self._font_metric.width(text), self._font_metric.height()]
+        if not self.isBegin():
+            return None
+
+        texture_cache = PluginTextCache.textures()
+        font = None
+        for text in texts[:GlPainter.kPrefetchImages]:
+            x, y, width, height, text_alignment, x_offset, y_offset, size = self.textLayout(position, text, alignment, backgroundSize)
+            if width <= 0 or height <= 0:
+                continue
+
+            key = self.textKey(text, text_alignment, size, backgroundColor, x_offset, y_offset)
+            if texture_cache.contains(key):
+                continue
+
+            # font is changed in place by setters, prefetch thread gets its own copy
+            if font is None:
+                font = QtGui.QFont(self._font)
+
+            PluginPrefetch.submit(
+                ("image",) + key,
+                GlPainter.prefetchImage,
+                key,
+                self._pen,
+                self._brush,
+                font,
+                text,
+                width,
+                height,
+                text_alignment,
+                x_offset,
+                y_offset,
+                size,
+                backgroundColor
+            )
 
-            # calculate position.
-            alignment_offset = 0.0
-            if alignment == constants.kLeft:
-                alignment = QtCore.Qt.AlignLeft
+    def text2d(self, position, text, alignment=constants.kLeft, backgroundSize=None, backgroundColor=None, dynamic=False):
 
-            else:
-                if alignment == constants.kRight:
-                    alignment = QtCore.Qt.AlignRight
-                    alignment_offset = backgroundSize[0]
+        """
+        draw text 2d
 
-                elif alignment == constants.kCenter:
-                    alignment = QtCore.Qt.AlignHCenter
-                    alignment_offset = backgroundSize[0] * 0.5
+        :param position - text position (OpenMaya.MPoint)
+        :param text - text (str)
+        :param alignment - text (OpenMayaRender.MUIDrawManager.TextAlignment)
+        :param backgroundSize - text background size (int)
+        :param backgroundColor - text background color (OpenMaya.MColor)
+        :param dynamic - text is dynamic (bool)
+        """
 
-                else:
-                    alignment = QtCore.Qt.AlignLeft
-
-                text_width = self._font_metric.width(text)
-                if text_width >= backgroundSize[0]:
-                    alignment = QtCore.Qt.AlignLeft
-
-            alignment |= QtCore.Qt.AlignVCenter
-
-            # calculate position and size
-            width, height = backgroundSize[0], backgroundSize[1]
-            x = int(position.x - alignment_offset)
-            y = int(position.y)
-            x_offset = 0
-            y_offset = 0
-            if x < 0:
-                x_offset = x
-                width += x_offset
-                x = 0
-
-            if y < 0:
-                y_offset = y
-                height += y_offset
-                y = 0
+        if self.isBegin():
+            x, y, width, height, alignment, x_offset, y_offset, backgroundSize = self.textLayout(position, text, alignment, backgroundSize)
 
             if width > 0 and height > 0:
-                # create image.
-                q_image = QtGui.QImage(width, height, QtGui.QImage.Format_RGBA8888)
-                q_image.fill(QtCore.Qt.transparent)
-                self._painter.begin(q_image)
-                self._painter.setRenderHint(QtGui.QPainter.Antialiasing)
+                key = self.textKey(text, alignment, backgroundSize, backgroundColor, x_offset, y_offset)
+                texture_cache = PluginTextCache.textures()
+                m_image = texture_cache.get(key)
 
-                self._painter.setPen(self._pen)
-                self._painter.setBrush(self._brush)
-                self._painter.setFont(self._font)
+                # image rasterized by prefetch thread, converted once
+                if isinstance(m_image, QtGui.QImage):
+                    m_image = self.qimage_to_mimage(m_image)
+                    texture_cache.set(key, m_image)
 
-                # fill background color.
-                if backgroundColor is not None:
-                    self._painter.fillRect(0, 0, width, height, QtGui.QColor(backgroundColor.r * 255, backgroundColor.g * 255, backgroundColor.b * 255, backgroundColor.a * 255))
+                if m_image is not None:
+                    self._view.writeColorBuffer(m_image, x, y)
+                    return None
 
-                # paint text
-                self._painter.drawText(x_offset, y_offset, backgroundSize[0], backgroundSize[1], alignment, text)
-                self._painter.end()
+                PluginTrace.begin("rasterizeText", width=width, height=height)
+
+                self._rasterizations += 1
+                q_image = GlPainter.rasterizeText(
+                    self._painter, self._pen, self._brush, self._font, text, width, height, alignment, x_offset, y_offset, backgroundSize, backgroundColor
+                )
 
                 # generate MImage texture object and write it to color buffer
                 m_image = self.qimage_to_mimage(q_image)
                 if m_image:
+                    texture_cache.set(key, m_image)
                     self._view.writeColorBuffer(m_image, x, y)
 
+                PluginTrace.end("rasterizeText")
+
     @staticmethod
     def qimage_to_mimage(q_image):
 
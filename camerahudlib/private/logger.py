@@ -1,9 +1,110 @@
+import time
 import logging
 
 
-logging.basicConfig(
-    level=logging.WARNING,
-    format="%(asctime)s - %(message)s"
-)
-
+# plugin logger, configured here instead of root logger so host application logging is untouched
 logger = logging.getLogger("camerahud.log")
+logger.setLevel(logging.WARNING)
+logger.propagate = False
+
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("CameraHUD: %(message)s"))
+    logger.addHandler(handler)
+
+
+class RateLimitedLogger(object):
+
+    # seconds between two records of same message
+    kInterval = 5.0
+
+    # maximum tracked message count
+    kMaxMessages = 256
+
+    def __init__(self, target):
+
+        """
+        initialize logger for per frame code, repeated messages are
+        suppressed and reported as count with next record
+
+        :param target - logger receiving records (logging.Logger)
+        """
+
+        self._target = target
+
+        # deduplication key -> [last record time, suppressed count]
+        self._messages = {}
+
+    def log(self, level, message, key=None):
+
+        """
+        log message unless it was logged less than kInterval ago
+
+        :param level - logging level (int)
+        :param message - message (str)
+        :param key - deduplication key of messages with changing values, message if None (str)
+        """
+
+        if not self._target.isEnabledFor(level):
+            return None
+
+        if key is None:
+            key = message
+
+        now = time.time()
+        entry = self._messages.get(key)
+        if entry is not None:
+            if now - entry[0] < RateLimitedLogger.kInterval:
+                entry[1] += 1
+                return None
+
+            if entry[1]:
+                message = "%s (repeated %d times)" % (message, entry[1])
+
+            entry[0] = now
+            entry[1] = 0
+
+        else:
+            if len(self._messages) >= RateLimitedLogger.kMaxMessages:
+                self._messages.clear()
+
+            self._messages[key] = [now, 0]
+
+        self._target.log(level, message)
+
+    def info(self, message, key=None):
+
+        """
+        log info message
+
+        :param message - message (str)
+        :param key - deduplication key, message if None (str)
+        """
+
+        self.log(logging.INFO, message, key)
+
+    def warning(self, message, key=None):
+
+        """
+        log warning message
+
+        :param message - message (str)
+        :param key - deduplication key, message if None (str)
+        """
+
+        self.log(logging.WARNING, message, key)
+
+    def error(self, message, key=None):
+
+        """
+        log error message
+
+        :param message - message (str)
+        :param key - deduplication key, message if None (str)
+        """
+
+        self.log(logging.ERROR, message, key)
+
+
+# logger for draw path, compute and other per frame code
+frame_logger = RateLimitedLogger(logger)
@@ -4,8 +4,12 @@ import maya.api.OpenMayaUI as OpenMayaUI
 import maya.api.OpenMayaRender as OpenMayaRender
 from camerahudlib import constants
 from camerahudlib.private.logger import logger
-from camerahudlib.private.glpainter import GlPainter
 from camerahudlib.private.plugin_draw_manager import PluginDrawManager
+from camerahudlib.private.plugin_fonts import PluginFonts
+from camerahudlib.private.plugin_profiler import PluginProfiler
+from camerahudlib.private.plugin_scheduler import PluginScheduler
+from camerahudlib.private.plugin_stats import PluginStats
+from camerahudlib.private.plugin_trace import PluginTrace
 
 
 class Plugin(OpenMayaUI.MPxLocatorNode):
@@ -68,6 +72,30 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
     # render resolution attribute
     aResolution = None
 
+    # draw scheduling attribute
+    aPriority = None
+    aDrawBudget = None
+
+    # scene state inputs, time is connected to time1, others are written by scene callbacks
+    aTime = None
+    aAnimationStart = None
+    aAnimationEnd = None
+    aSceneName = None
+
+    # frame of expanded text, evaluated before draw so time changes recompute time dependent text only
+    aFrameState = None
+
+    # read only statistics attributes, rolling averages of node cost
+    aStatComputeTime = None
+    aStatPrepareTime = None
+    aStatDrawTime = None
+    aStatPainterCalls = None
+    aStatTextCommands = None
+    aStatTextRasterizations = None
+
+    # statistics attribute and measured value name pairs
+    aStatList = []
+
     # initialize data
     uiFontStyleList = []
 
@@ -91,6 +119,7 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
         enumerate_attribute = OpenMaya.MFnEnumAttribute()
         numeric_attribute = OpenMaya.MFnNumericAttribute()
         typed_attribute = OpenMaya.MFnTypedAttribute()
+        unit_attribute = OpenMaya.MFnUnitAttribute()
 
         # create unique ui manager index attribute
         Plugin.aHudIndex = numeric_attribute.create(
@@ -120,6 +149,70 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
         numeric_attribute.default = (256.0, 256.0)
         OpenMaya.MPxNode.addAttribute(Plugin.aResolution)
 
+        # add draw budget attribute, 0 uses global budget
+        Plugin.aDrawBudget = numeric_attribute.create(
+            "drawBudget",
+            "dbdg",
+            OpenMaya.MFnNumericData.kDouble,
+            0.0
+        )
+        numeric_attribute.setMin(0.0)
+        OpenMaya.MPxNode.addAttribute(Plugin.aDrawBudget)
+
+        # add scene state inputs, draw and compute never query scene
+        Plugin.aTime = unit_attribute.create("time", "tm", OpenMaya.MFnUnitAttribute.kTime, 0.0)
+        unit_attribute.hidden = True
+        unit_attribute.storable = False
+        OpenMaya.MPxNode.addAttribute(Plugin.aTime)
+
+        Plugin.aAnimationStart = unit_attribute.create("animationStart", "ast", OpenMaya.MFnUnitAttribute.kTime, 0.0)
+        unit_attribute.hidden = True
+        unit_attribute.storable = False
+        OpenMaya.MPxNode.addAttribute(Plugin.aAnimationStart)
+
+        Plugin.aAnimationEnd = unit_attribute.create("animationEnd", "aet", OpenMaya.MFnUnitAttribute.kTime, 0.0)
+        unit_attribute.hidden = True
+        unit_attribute.storable = False
+        OpenMaya.MPxNode.addAttribute(Plugin.aAnimationEnd)
+
+        Plugin.aSceneName = typed_attribute.create("sceneName", "scn", OpenMaya.MFnData.kString, OpenMaya.MFnStringData().create(""))
+        typed_attribute.hidden = True
+        typed_attribute.storable = False
+        OpenMaya.MPxNode.addAttribute(Plugin.aSceneName)
+
+        Plugin.aFrameState = numeric_attribute.create("frameState", "fst", OpenMaya.MFnNumericData.kDouble, 0.0)
+        numeric_attribute.hidden = True
+        numeric_attribute.writable = False
+        numeric_attribute.storable = False
+        OpenMaya.MPxNode.addAttribute(Plugin.aFrameState)
+        OpenMaya.MPxNode.attributeAffects(Plugin.aTime, Plugin.aFrameState)
+        OpenMaya.MPxNode.attributeAffects(Plugin.aAnimationStart, Plugin.aFrameState)
+        OpenMaya.MPxNode.attributeAffects(Plugin.aAnimationEnd, Plugin.aFrameState)
+
+        # add statistics attributes, not cached so every query reads current values
+        Plugin.aStatList = []
+        for long_name, short_name, stat_name in (
+            ("statComputeTime", "stct", PluginStats.kComputeTime),
+            ("statPrepareTime", "stpt", PluginStats.kPrepareTime),
+            ("statDrawTime", "stdt", PluginStats.kDrawTime),
+            ("statPainterCalls", "stpc", PluginStats.kPainterCalls),
+            ("statTextCommands", "sttc", PluginStats.kTextCommands),
+            ("statTextRasterizations", "sttr", PluginStats.kTextRasterizations),
+        ):
+            attribute = numeric_attribute.create(long_name, short_name, OpenMaya.MFnNumericData.kDouble, 0.0)
+            numeric_attribute.writable = False
+            numeric_attribute.storable = False
+            numeric_attribute.cached = False
+            OpenMaya.MPxNode.addAttribute(attribute)
+            Plugin.aStatList.append((attribute, stat_name))
+
+        Plugin.aStatComputeTime = Plugin.aStatList[0][0]
+        Plugin.aStatPrepareTime = Plugin.aStatList[1][0]
+        Plugin.aStatDrawTime = Plugin.aStatList[2][0]
+        Plugin.aStatPainterCalls = Plugin.aStatList[3][0]
+        Plugin.aStatTextCommands = Plugin.aStatList[4][0]
+        Plugin.aStatTextRasterizations = Plugin.aStatList[5][0]
+
         # create ui type attribute
         Plugin.aUIType = enumerate_attribute.create(
             "uiType",
@@ -388,15 +481,8 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
             2.0
         )
 
-        # create text font style attribute
-        try:
-            Plugin.uiFontStyleList = OpenMayaRender.MUIDrawManager.getFontList()
-
-        except Exception as exception_data:
-            Plugin.uiFontStyleList = []
-            logger.error(repr(exception_data))
-            logger.error("can`t read font list")
-
+        # create text font style attribute, font list is cached between plugin loads
+        Plugin.uiFontStyleList = PluginFonts.fontList()
         if len(Plugin.uiFontStyleList) == 0:
             logger.error("no available font founded")
 
@@ -446,6 +532,16 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
         enumerate_attribute.addField("Dotted", constants.kLineDotted)
         enumerate_attribute.addField("Dashed", constants.kLineDashed)
 
+        # create draw priority attribute
+        Plugin.aPriority = enumerate_attribute.create(
+            "priority",
+            "pri",
+            constants.kPriorityNormal
+        )
+        enumerate_attribute.addField("Low", constants.kPriorityLow)
+        enumerate_attribute.addField("Normal", constants.kPriorityNormal)
+        enumerate_attribute.addField("High", constants.kPriorityHigh)
+
         # create ui list attribute
         Plugin.aUI = compound_attribute.create(
             "ui",
@@ -489,6 +585,7 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
         compound_attribute.addChild(Plugin.aFontStyleStretch)
         compound_attribute.addChild(Plugin.aColor)
         compound_attribute.addChild(Plugin.aTransparency)
+        compound_attribute.addChild(Plugin.aPriority)
 
         compound_attribute.usesArrayDataBuilder = True
         OpenMaya.MPxNode.addAttribute(Plugin.aUI)
@@ -527,6 +624,8 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
         OpenMaya.MPxNode.attributeAffects(Plugin.aColor, Plugin.aUI)
         OpenMaya.MPxNode.attributeAffects(Plugin.aTransparency, Plugin.aUI)
         OpenMaya.MPxNode.attributeAffects(Plugin.aResolution, Plugin.aUI)
+        OpenMaya.MPxNode.attributeAffects(Plugin.aPriority, Plugin.aUI)
+        OpenMaya.MPxNode.attributeAffects(Plugin.aSceneName, Plugin.aUI)
 
     def __init__(self):
 
@@ -539,6 +638,23 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
         # cache previously used data
         self.__previous_data = None
 
+        # drawing manager of hud index, resolved again after hud index change
+        self._manager = None
+
+        # rolling averages of node cost
+        self._stats = PluginStats()
+
+    def schedulingType(self):
+
+        """
+        node scheduling type used by evaluation manager, compute reads datablock only
+        and publishes drawing requests with single reference swap
+
+        :return - scheduling type (OpenMaya.MPxNode.SchedulingType)
+        """
+
+        return OpenMaya.MPxNode.kParallel
+
     def excludeAsLocator(self):
 
         """
@@ -560,6 +676,7 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
         plug = OpenMaya.MPlug(node, Plugin.aHudIndex)
         manager = PluginDrawManager()
         plug.setInt(manager.index())
+        self._manager = manager
 
         # set creation time
         plug = OpenMaya.MPlug(node, Plugin.aCreationUnixTime)
@@ -568,6 +685,45 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
         # disable node saving
         self.setDoNotWrite(True)
 
+    def drawManager(self):
+
+        """
+        get drawing manager of node hud index
+
+        :return - drawing manager or None if hud index is not assigned (PluginDrawManager)
+        """
+
+        if self._manager is None:
+            hud_index = OpenMaya.MPlug(self.thisMObject(), Plugin.aHudIndex).asInt()
+            if hud_index < 0:
+                return None
+
+            self._manager = PluginDrawManager(hud_index)
+
+        return self._manager
+
+    def stats(self):
+
+        """
+        get node statistics
+
+        :return - rolling averages of node cost (PluginStats)
+        """
+
+        return self._stats
+
+    def setDependentsDirty(self, plug, plug_array):
+
+        """
+        attribute is dirty, drops drawing manager reference on hud index change
+
+        :param plug - dirty attribute plug (OpenMaya.MPlug)
+        :param plug_array - affected attribute plugs (OpenMaya.MPlugArray)
+        """
+
+        if plug.attribute() == Plugin.aHudIndex:
+            self._manager = None
+
     def compute(self, plug, datablock):
 
         """
@@ -577,7 +733,27 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
         :param datablock - attribute data handle (OpenMaya.MDataBlock)
         """
 
-        return PluginDrawManager.compute(self, plug, datablock)
+        # statistics attributes
+        attribute = plug.attribute()
+        for stat_attribute, stat_name in Plugin.aStatList:
+            if attribute == stat_attribute:
+                data_handle = datablock.outputValue(stat_attribute)
+                data_handle.setDouble(self._stats.average(stat_name))
+                data_handle.setClean()
+                return None
+
+        start_time = PluginScheduler.now()
+        PluginTrace.begin("compute")
+        if attribute == Plugin.aFrameState:
+            result = PluginDrawManager.computeFrame(self, datablock)
+
+        else:
+            result = PluginDrawManager.compute(self, plug, datablock)
+
+        PluginTrace.end("compute")
+        self._stats.add(PluginStats.kComputeTime, PluginScheduler.now() - start_time)
+
+        return result
 
     def isTransparent(self):
 
@@ -628,9 +804,41 @@ class Plugin(OpenMayaUI.MPxLocatorNode):
         camera_path = view.getCamera()
 
         # prepare for draw
-        data = PluginDrawManager.prepareForDraw(path, camera_path, None, self.__previous_data, constants.kLegacyViewport)
-        self.__previous_data = data
+        PluginTrace.frame(path.fullPathName())
+        # profiler and trace phases are closed even when prepare or draw raises
+        PluginProfiler.begin()
+        try:
+            start_time = PluginScheduler.now()
+            PluginTrace.begin("prepareForDraw")
+            try:
+                manager = self.drawManager()
+                if manager is not None:
+                    PluginDrawManager.updateBudget(manager, node)
+
+                data = PluginDrawManager.prepareForDraw(path, camera_path, None, self.__previous_data, constants.kLegacyViewport, manager)
+                self.__previous_data = data
+
+            finally:
+                PluginTrace.end("prepareForDraw")
+
+            self._stats.add(PluginStats.kPrepareTime, PluginScheduler.now() - start_time)
+
+            # legacy painter pulls qt and api 1.0 modules, imported on first legacy draw only
+            from camerahudlib.private.glpainter import GlPainter
+
+            # request draw
+            start_time = PluginScheduler.now()
+            PluginTrace.begin("draw")
+            try:
+                painter = GlPainter(view)
+                counts = PluginDrawManager.draw(painter, style, data)
+
+            finally:
+                PluginTrace.end("draw")
+
+            self._stats.addDraw(PluginScheduler.now() - start_time, counts, painter.rasterizations())
+
+        finally:
+            PluginProfiler.end()
 
-        # request draw
-        painter = GlPainter(view)
-        PluginDrawManager.draw(painter, style, data)
+        PluginProfiler.draw()
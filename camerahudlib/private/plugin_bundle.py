@@ -0,0 +1,322 @@
+import os
+import mmap
+import json
+import struct
+from camerahudlib.private.logger import logger
+
+
+class PluginBundle(object):
+
+    # bundle layout: header, json index of name -> [offset, size], preset blobs
+    kMagic = b"CHUDBNDL"
+    kVersion = 1
+    kHeader = struct.Struct("<8sII")
+
+    __cache__ = {}
+
+    @staticmethod
+    def open(filename):
+
+        """
+        get opened bundle, reused while file on disk is unchanged
+
+        :param filename - bundle file path (str)
+
+        :return - opened bundle or None (PluginBundle)
+        """
+
+        if not os.path.isfile(filename):
+            logger.error("bundle not found: " + filename)
+            return None
+
+        filename = os.path.abspath(filename)
+        stat = os.stat(filename)
+        stamp = (stat.st_mtime, stat.st_size)
+
+        bundle = PluginBundle.__cache__.get(filename)
+        if bundle is not None:
+            if bundle.stamp() == stamp:
+                return bundle
+
+            bundle.close()
+            del PluginBundle.__cache__[filename]
+
+        bundle = PluginBundle(filename, stamp)
+        if not bundle.isValid():
+            bundle.close()
+            return None
+
+        PluginBundle.__cache__[filename] = bundle
+        return bundle
+
+    @staticmethod
+    def release(filename=None):
+
+        """
+        close cached bundle
+
+        :param filename - bundle file path, all bundles if None (str)
+        """
+
+        if filename is None:
+            filename_list = list(PluginBundle.__cache__.keys())
+
+        else:
+            filename_list = [os.path.abspath(filename)]
+
+        for cache_filename in filename_list:
+            bundle = PluginBundle.__cache__.pop(cache_filename, None)
+            if bundle is not None:
+                bundle.close()
+
+    @staticmethod
+    def replace(source, target):
+
+        """
+        rename file over target, python 2 on windows can't rename over existing file and removes target first
+
+        :param source - renamed file path (str)
+        :param target - replaced file path (str)
+        """
+
+        if hasattr(os, "replace"):
+            os.replace(source, target)
+            return None
+
+        try:
+            os.rename(source, target)
+
+        except OSError:
+            if not os.path.isfile(target):
+                raise
+
+            os.remove(target)
+            os.rename(source, target)
+
+    @staticmethod
+    def write(filename, presets):
+
+        """
+        write bundle
+
+        :param filename - bundle file path (str)
+        :param presets - preset name to preset data (dict) or encoded preset data (bytes)
+        """
+
+        names = sorted(presets.keys())
+        blobs = []
+        for name in names:
+            blob = presets[name]
+            if isinstance(blob, dict):
+                blob = json.dumps(blob)
+
+            if not isinstance(blob, bytes):
+                blob = blob.encode("utf-8")
+
+            blobs.append(blob)
+
+        # index offsets depend on index size, so grow index until stable
+        index_data = b""
+        while True:
+            offset = PluginBundle.kHeader.size + len(index_data)
+            index = {}
+            for name, blob in zip(names, blobs):
+                index[name] = [offset, len(blob)]
+                offset += len(blob)
+
+            encoded_index = json.dumps(index, sort_keys=True).encode("utf-8")
+            if len(encoded_index) == len(index_data):
+                index_data = encoded_index
+                break
+
+            index_data = encoded_index
+
+        # write next to bundle and rename, failed write keeps previous bundle and readers never map partial file
+        temp_filename = "%s.%d.tmp" % (filename, os.getpid())
+        try:
+            obj = open(temp_filename, "wb")
+            try:
+                obj.write(PluginBundle.kHeader.pack(PluginBundle.kMagic, PluginBundle.kVersion, len(index_data)))
+                obj.write(index_data)
+                for blob in blobs:
+                    obj.write(blob)
+
+            finally:
+                obj.close()
+
+            # close mapping before replacing file, windows can't replace mapped file
+            PluginBundle.release(filename)
+            PluginBundle.replace(temp_filename, filename)
+
+        except Exception:
+            if os.path.isfile(temp_filename):
+                os.remove(temp_filename)
+
+            raise
+
+    def __init__(self, filename, stamp=None):
+
+        """
+        initialize bundle, only header index is decoded
+
+        :param filename - bundle file path (str)
+        :param stamp - file modification stamp (tuple)
+        """
+
+        self._filename = filename
+        self._stamp = stamp
+        self._file = None
+        self._map = None
+        self._index = {}
+
+        try:
+            self._file = open(filename, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        except Exception as exception_data:
+            logger.error(repr(exception_data))
+            logger.error("can`t map bundle: " + filename)
+            self.close()
+            return
+
+        header_size = PluginBundle.kHeader.size
+        if len(self._map) < header_size:
+            logger.error("bundle header is truncated: " + filename)
+            self.close()
+            return
+
+        magic, version, index_size = PluginBundle.kHeader.unpack(self._map[:header_size])
+        if magic != PluginBundle.kMagic or version != PluginBundle.kVersion:
+            logger.error("unsupported bundle format: " + filename)
+            self.close()
+            return
+
+        try:
+            self._index = json.loads(self._map[header_size:header_size + index_size].decode("utf-8"))
+
+        except Exception as exception_data:
+            logger.error(repr(exception_data))
+            logger.error("can`t load bundle index: " + filename)
+            self.close()
+
+    def isValid(self):
+
+        """
+        is valid
+
+        :return - bundle is mapped (bool)
+        """
+
+        return self._map is not None
+
+    def close(self):
+
+        """
+        close bundle mapping
+        """
+
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        self._index = {}
+
+    def stamp(self):
+
+        """
+        get file modification stamp
+
+        :return - modification time and size (tuple)
+        """
+
+        return self._stamp
+
+    def names(self):
+
+        """
+        get preset names
+
+        :return - preset name list (list)
+        """
+
+        return sorted(self._index.keys())
+
+    def __contains__(self, name):
+
+        """
+        bundle contains preset
+
+        :param name - preset name (str)
+
+        :return - preset exists (bool)
+        """
+
+        return name in self._index
+
+    def __len__(self):
+
+        """
+        get preset count
+
+        :return - preset count (int)
+        """
+
+        return len(self._index)
+
+    def raw(self, name):
+
+        """
+        get encoded preset data without decoding
+
+        :param name - preset name (str)
+
+        :return - encoded preset data (bytes)
+        """
+
+        if self._map is None or name not in self._index:
+            return None
+
+        offset, size = self._index[name]
+        return self._map[offset:offset + size]
+
+    def preset(self, name):
+
+        """
+        get decoded preset data
+
+        :param name - preset name (str)
+
+        :return - preset data (dict)
+        """
+
+        blob = self.raw(name)
+        if blob is None:
+            logger.error("preset not found: " + name)
+            return None
+
+        try:
+            return json.loads(blob.decode("utf-8"))
+
+        except Exception as exception_data:
+            logger.error(repr(exception_data))
+            logger.error("can`t load preset data: " + name)
+
+        return None
+
+    def presets(self):
+
+        """
+        get all encoded preset data, used to rewrite bundle
+
+        :return - preset name to encoded preset data (dict)
+        """
+
+        result = {}
+        for name in self._index:
+            result[name] = self.raw(name)
+
+        return result
@@ -0,0 +1,423 @@
+import os
+import re
+import json
+import time
+import argparse
+import multiprocessing
+from camerahudlib import constants
+from camerahudlib.private.logger import logger
+from camerahudlib.private.plugin_bundle import PluginBundle
+from camerahudlib.private.plugin_camera import PluginCamera
+from camerahudlib.private.plugin_data import PluginData
+from camerahudlib.private.plugin_draw_manager import PluginDrawManager
+
+
+class PluginBurnIn(object):
+
+    # manager index not used by scene nodes
+    kManagerIndex = -2
+
+    # camera attributes not affecting resolution gates
+    kCameraTokenAttributes = {
+        "focalLength": "$FOCAL_LENGHT",
+        "focusDistance": "$FOCUS_DISTANCE",
+    }
+
+    @staticmethod
+    def framePath(pattern, frame):
+
+        """
+        get frame image path, supports printf (%04d) and hash (####) padding
+
+        :param pattern - image path pattern (str)
+        :param frame - frame number (int)
+
+        :return - image path (str)
+        """
+
+        if "#" in pattern:
+            return re.sub("#+", lambda match: "%0*d" % (len(match.group(0)), frame), pattern)
+
+        if "%" in pattern:
+            return pattern % frame
+
+        return pattern
+
+    @staticmethod
+    def loadPreset(filename, name=None):
+
+        """
+        load exported preset from json file or bundle
+
+        :param filename - preset or bundle file path (str)
+        :param name - preset name in bundle (str)
+
+        :return - preset data (dict)
+        """
+
+        if name:
+            bundle = PluginBundle.open(filename)
+            if bundle is None:
+                return None
+
+            return bundle.preset(name)
+
+        obj = open(filename, "r")
+        data = obj.read()
+        obj.close()
+
+        try:
+            return json.loads(data)
+
+        except Exception as exception_data:
+            logger.error(exception_data)
+            logger.error("can`t load json data")
+
+        return None
+
+    def __init__(self, options):
+
+        """
+        initialize renderer
+
+        :param options - burn-in options (dict)
+        """
+
+        self._options = options
+        self._width = options["width"]
+        self._height = options["height"]
+
+        # camera attribute given as frame to value dictionary is animated
+        camera_data = {}
+        self._camera_tracks = {}
+        for key, value in (options.get("camera") or {}).items():
+            if isinstance(value, dict):
+                self._camera_tracks[key] = sorted((float(frame), value[frame]) for frame in value)
+
+            else:
+                camera_data[key] = value
+
+        self._camera = PluginCamera.fromDict(camera_data)
+        self._gates_animated = bool(set(self._camera_tracks) - set(PluginBurnIn.kCameraTokenAttributes))
+        self._gates_prepared = False
+
+        # rendered frames are known, prefetch thread would only compete with rasterizer
+        self._manager = PluginDrawManager(PluginBurnIn.kManagerIndex)
+        self._manager.setPrefetchEnabled(False)
+        self._manager.loadPreset(options["preset"], options.get("sceneFile", ""), options.get("creationTime"))
+        self._manager.setResolution(options["resolutionWidth"], options["resolutionHeight"])
+
+        self._data = PluginData()
+        self._data.manager = self._manager
+        self._data.requests = self._manager.snapshot()
+        self._data.animationStart = options["animationStart"]
+        self._data.animationEnd = options["animationEnd"]
+
+        # static requests are rasterized once into base layer
+        self._static_keys, self._dynamic_keys = self.classify()
+        self._base_layer = None
+        self._base_dirty_rects = []
+
+    def classify(self):
+
+        """
+        split drawing requests into static and frame dependent
+
+        :return - static and frame dependent request keys (tuple)
+        """
+
+        static_keys, dynamic_keys = [], []
+        for request_key in self._manager:
+            request = self._manager[request_key]
+            if not request.uiDraw:
+                continue
+
+            dynamic = self._gates_animated or request.uiTextFrameDependent
+            if not dynamic and request.uiType == constants.kText:
+                for attribute, token in PluginBurnIn.kCameraTokenAttributes.items():
+                    if attribute in self._camera_tracks and token in request.uiText:
+                        dynamic = True
+                        break
+
+            if dynamic:
+                dynamic_keys.append(request_key)
+
+            else:
+                static_keys.append(request_key)
+
+        return static_keys, dynamic_keys
+
+    def updateCamera(self, frame):
+
+        """
+        apply animated camera attributes, value is held from last key before frame
+
+        :param frame - frame number (int)
+        """
+
+        for attribute, track in self._camera_tracks.items():
+            value = track[0][1]
+            for key_frame, key_value in track:
+                if key_frame > frame:
+                    break
+
+                value = key_value
+
+            if attribute not in ("name", "panZoomEnabled", "filmFit"):
+                value = float(value)
+
+            setattr(self._camera, attribute, value)
+
+    def prepareFrame(self, frame):
+
+        """
+        prepare gates and regions for frame, static camera is prepared once
+
+        :param frame - frame number (int)
+        """
+
+        data = self._data
+        data.frame = frame
+
+        # expand frame tokens of frame dependent requests
+        self._manager.updateFrame(frame, data.animationStart, data.animationEnd)
+        data.frameText = self._manager.frameText()
+
+        if self._camera_tracks or not self._gates_prepared:
+            self.updateCamera(frame)
+            PluginDrawManager.prepareGates(data, self._camera, self._width * 0.5, self._height * 0.5, self._width, self._height)
+            PluginDrawManager.prepareRegions(data)
+            self._gates_prepared = True
+
+    def baseLayer(self):
+
+        """
+        get static requests layer, rasterized on first use
+
+        :return - static layer or None if nothing is static (QtGui.QImage)
+        """
+
+        from camerahudlib.private.qtpainter import QtPainter
+
+        if self._base_layer is None and self._static_keys:
+            painter = QtPainter(self._width, self._height)
+            PluginDrawManager.draw(painter, None, self._data, self._static_keys)
+            self._base_layer = painter.end()
+            self._base_dirty_rects = painter.dirtyRects()
+
+        return self._base_layer
+
+    def renderFrame(self, frame):
+
+        """
+        render frame overlay, composited over input frame if provided,
+        one frame is held in memory at a time
+
+        :param frame - frame number (int)
+
+        :return - written image path (str)
+        """
+
+        from camerahudlib.private.qt.Qt import QtGui
+        from camerahudlib.private.qtpainter import QtPainter
+        from camerahudlib.private.plugin_compositor import PluginCompositor
+
+        self.prepareFrame(frame)
+        base_layer = self.baseLayer()
+
+        # overlay layer starts from static layer
+        layer = None
+        if base_layer is not None:
+            layer = base_layer.copy()
+
+        painter = QtPainter(self._width, self._height, layer)
+        if self._dynamic_keys:
+            PluginDrawManager.draw(painter, None, self._data, self._dynamic_keys)
+
+        image = painter.end()
+
+        # composite overlay onto input frame inside painted areas only
+        if self._options.get("input"):
+            layer = image
+            image = QtGui.QImage(PluginBurnIn.framePath(self._options["input"], frame))
+            if image.isNull():
+                logger.error("can`t read frame " + str(frame))
+                return None
+
+            image = PluginCompositor.composite(image, layer, self._base_dirty_rects + painter.dirtyRects())
+
+        path = PluginBurnIn.framePath(self._options["output"], frame)
+        if not image.save(path):
+            logger.error("can`t write frame " + path)
+            return None
+
+        return path
+
+    def render(self, frames, processes=None, chunk_size=1):
+
+        """
+        render frames spread across process pool
+
+        :param frames - frame number list (list)
+        :param processes - worker process count, cpu count if None (int)
+        :param chunk_size - frames sent to worker at once (int)
+
+        :return - written image path list (list)
+        """
+
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+
+        processes = max(min(processes, len(frames)), 1)
+        if processes == 1:
+            return [self.renderFrame(frame) for frame in frames]
+
+        # worker entry points are module functions, python 2 can`t pickle static methods
+        pool = multiprocessing.Pool(processes, initializeWorker, (type(self), self._options))
+        try:
+            result = list(pool.imap(renderWorkerFrame, frames, chunk_size))
+            pool.close()
+
+        except BaseException:
+            pool.terminate()
+            raise
+
+        finally:
+            pool.join()
+
+        return result
+
+
+# renderer of current worker process
+_worker = None
+
+
+def initializeWorker(renderer_class, options):
+
+    """
+    initialize renderer of worker process
+
+    :param renderer_class - renderer class, PluginBurnIn or its subclass (type)
+    :param options - burn-in options (dict)
+    """
+
+    global _worker
+    _worker = renderer_class(options)
+
+
+def renderWorkerFrame(frame):
+
+    """
+    render frame with renderer of worker process
+
+    :param frame - frame number (int)
+
+    :return - written image path (str)
+    """
+
+    return _worker.renderFrame(frame)
+
+
+def parseArguments(argv=None):
+
+    """
+    get parsed burn-in options
+
+    :param argv - command line arguments (list)
+
+    :return - burn-in options (dict)
+    """
+
+    parser = argparse.ArgumentParser(description="Render CameraHUD preset overlays for frame range.")
+    parser.add_argument("preset", help="exported preset json file or preset bundle")
+    parser.add_argument("--preset-name", help="preset name when reading from bundle")
+    parser.add_argument("--camera", help="camera parameters json file, keys follow MFnCamera attribute names")
+    parser.add_argument("--start", type=int, required=True, help="first frame")
+    parser.add_argument("--end", type=int, required=True, help="last frame")
+    parser.add_argument("--step", type=int, default=1, help="frame step")
+    parser.add_argument("--animation-start", type=float, help="animation start used by frame tokens, first frame by default")
+    parser.add_argument("--animation-end", type=float, help="animation end used by frame tokens, last frame by default")
+    parser.add_argument("--output", required=True, help="output image pattern, e.g. hud.####.png")
+    parser.add_argument("--input", help="input image pattern to burn overlay onto")
+    parser.add_argument("--width", type=int, help="image width, input frame width or 1920 by default")
+    parser.add_argument("--height", type=int, help="image height, input frame height or 1080 by default")
+    parser.add_argument("--resolution", type=int, nargs=2, metavar=("WIDTH", "HEIGHT"), help="render resolution, image size by default")
+    parser.add_argument("--scene-file", default="", help="scene file used by $FILE tokens")
+    parser.add_argument("--creation-time", type=float, help="unix time used by date tokens, current time by default")
+    parser.add_argument("--processes", type=int, help="worker process count, cpu count by default")
+    parser.add_argument("--chunk-size", type=int, default=4, help="frames sent to worker at once")
+    arguments = parser.parse_args(argv)
+
+    preset = PluginBurnIn.loadPreset(arguments.preset, arguments.preset_name)
+    if not preset:
+        parser.error("can`t load preset " + arguments.preset)
+
+    camera = {}
+    if arguments.camera:
+        obj = open(arguments.camera, "r")
+        camera = json.load(obj)
+        obj.close()
+
+    width, height = arguments.width, arguments.height
+    if arguments.input and (width is None or height is None):
+        from camerahudlib.private.qt.Qt import QtGui
+        from camerahudlib.private.qtpainter import QtPainter
+
+        QtPainter.application()
+        size = QtGui.QImageReader(PluginBurnIn.framePath(arguments.input, arguments.start)).size()
+        if size.isValid():
+            width = size.width() if width is None else width
+            height = size.height() if height is None else height
+
+    width = width or 1920
+    height = height or 1080
+
+    resolution = arguments.resolution or (width, height)
+    frames = list(range(arguments.start, arguments.end + 1, max(arguments.step, 1)))
+    if not frames:
+        parser.error("empty frame range")
+
+    return {
+        "preset": preset,
+        "camera": camera,
+        "frames": frames,
+        "animationStart": arguments.start if arguments.animation_start is None else arguments.animation_start,
+        "animationEnd": arguments.end if arguments.animation_end is None else arguments.animation_end,
+        "output": arguments.output,
+        "input": arguments.input,
+        "width": width,
+        "height": height,
+        "resolutionWidth": resolution[0],
+        "resolutionHeight": resolution[1],
+        "sceneFile": arguments.scene_file,
+        "creationTime": time.time() if arguments.creation_time is None else arguments.creation_time,
+        "processes": arguments.processes,
+        "chunkSize": max(arguments.chunk_size, 1),
+    }
+
+
+def main(argv=None):
+
+    """
+    render burn-in frames from command line
+
+    :param argv - command line arguments (list)
+
+    :return - exit code (int)
+    """
+
+    options = parseArguments(argv)
+
+    output_directory = os.path.dirname(os.path.abspath(PluginBurnIn.framePath(options["output"], options["frames"][0])))
+    if not os.path.isdir(output_directory):
+        os.makedirs(output_directory)
+
+    renderer = PluginBurnIn(options)
+    result = renderer.render(options["frames"], options["processes"], options["chunkSize"])
+
+    failed = [frame for frame, path in zip(options["frames"], result) if path is None]
+    if failed:
+        logger.error("failed frames: " + ", ".join(str(frame) for frame in failed))
+        return 1
+
+    return 0
@@ -0,0 +1,322 @@
+import maya.api.OpenMaya as OpenMaya
+from camerahudlib.private.logger import logger, frame_logger
+
+
+class PluginCamera(object):
+
+    __slots__ = (
+        "name",
+        "panZoomEnabled",
+        "zoom",
+        "horizontalPan",
+        "verticalPan",
+        "lensSqueezeRatio",
+        "horizontalFilmAperture",
+        "verticalFilmAperture",
+        "focalLength",
+        "focusDistance",
+        "filmFit",
+        "overscan",
+    )
+
+    kFilmFitNames = {
+        "fill": OpenMaya.MFnCamera.kFillFilmFit,
+        "horizontal": OpenMaya.MFnCamera.kHorizontalFilmFit,
+        "vertical": OpenMaya.MFnCamera.kVerticalFilmFit,
+        "overscan": OpenMaya.MFnCamera.kOverscanFilmFit,
+    }
+
+    # camera attributes read from MFnCamera
+    kAttributeNames = (
+        "panZoomEnabled",
+        "zoom",
+        "horizontalPan",
+        "verticalPan",
+        "lensSqueezeRatio",
+        "horizontalFilmAperture",
+        "verticalFilmAperture",
+        "focalLength",
+        "focusDistance",
+        "filmFit",
+        "overscan",
+    )
+
+    # attribute messages invalidating cached camera parameters
+    kInvalidateMessages = (
+        OpenMaya.MNodeMessage.kAttributeSet |
+        OpenMaya.MNodeMessage.kConnectionMade |
+        OpenMaya.MNodeMessage.kConnectionBroken
+    )
+
+    # cached camera parameters by camera full path name
+    __cache__ = {}
+
+    # scene callbacks releasing cached cameras
+    __scene_callbacks__ = []
+
+    @staticmethod
+    def fromPath(camera_path):
+
+        """
+        get camera parameters from camera node, parameters are read once and
+        read again after camera attribute change, animated attributes are read every call,
+        entry of deleted or renamed camera is dropped even when other camera takes its path
+
+        :param camera_path - camera node path (MDagPath)
+
+        :return - camera parameters (PluginCamera)
+        """
+
+        key = camera_path.fullPathName()
+        node = camera_path.node()
+        entry = PluginCamera.__cache__.get(key)
+        if entry is not None and not (entry["handle"].isValid() and entry["handle"] == OpenMaya.MObjectHandle(node)):
+            PluginCamera.evict(key)
+            entry = None
+
+        if entry is None:
+            entry = {"camera": None, "animated": (), "handle": OpenMaya.MObjectHandle(node), "callbacks": []}
+            try:
+                entry["callbacks"].append(OpenMaya.MNodeMessage.addAttributeChangedCallback(node, PluginCamera.attributeChanged, key))
+                entry["callbacks"].append(OpenMaya.MNodeMessage.addNodeAboutToDeleteCallback(node, PluginCamera.nodeRemoved, key))
+                for name_node in (node, camera_path.transform()):
+                    entry["callbacks"].append(OpenMaya.MNodeMessage.addNameChangedCallback(name_node, PluginCamera.nodeRenamed, key))
+
+                PluginCamera.__cache__[key] = entry
+
+            except Exception as exception_data:
+                logger.error(repr(exception_data))
+                logger.error("can`t add camera callbacks")
+
+                # camera without callbacks isn't cached, it's read on every call
+                PluginCamera.removeCallbacks(entry["callbacks"])
+
+        if entry["camera"] is None:
+            entry["camera"] = PluginCamera.read(camera_path)
+            entry["animated"] = PluginCamera.animatedAttributes(camera_path)
+
+        elif entry["animated"]:
+            camera = OpenMaya.MFnCamera(camera_path)
+            for attribute in entry["animated"]:
+                setattr(entry["camera"], attribute, getattr(camera, attribute))
+
+        return entry["camera"]
+
+    @staticmethod
+    def evict(key):
+
+        """
+        remove cached camera and its callbacks
+
+        :param key - camera full path name (str)
+        """
+
+        entry = PluginCamera.__cache__.pop(key, None)
+        if entry is not None:
+            PluginCamera.removeCallbacks(entry["callbacks"])
+
+    @staticmethod
+    def removeCallbacks(callbacks):
+
+        """
+        remove camera callbacks
+
+        :param callbacks - callback ids (list)
+        """
+
+        for callback in callbacks:
+            try:
+                OpenMaya.MMessage.removeCallback(callback)
+
+            except Exception as exception_data:
+                logger.error(repr(exception_data))
+                logger.error("can`t remove camera callback")
+
+    @staticmethod
+    def nodeRemoved(node, modifier, client_data):
+
+        """
+        camera about to be deleted callback, cached camera is dropped
+
+        :param node - deleted camera (OpenMaya.MObject)
+        :param modifier - delete modifier (OpenMaya.MDGModifier)
+        :param client_data - camera full path name (str)
+        """
+
+        PluginCamera.evict(client_data)
+
+    @staticmethod
+    def nodeRenamed(node, previous_name, client_data):
+
+        """
+        camera or its transform renamed callback, cached camera is dropped as its path changed
+
+        :param node - renamed node (OpenMaya.MObject)
+        :param previous_name - previous node name (str)
+        :param client_data - camera full path name (str)
+        """
+
+        PluginCamera.evict(client_data)
+
+    @staticmethod
+    def read(camera_path):
+
+        """
+        read camera parameters from camera node
+
+        :param camera_path - camera node path (MDagPath)
+
+        :return - camera parameters (PluginCamera)
+        """
+
+        camera = OpenMaya.MFnCamera(camera_path)
+
+        result = PluginCamera()
+        result.name = camera_path.fullPathName().rsplit("|", 2)[1]
+        for attribute in PluginCamera.kAttributeNames:
+            setattr(result, attribute, getattr(camera, attribute))
+
+        return result
+
+    @staticmethod
+    def animatedAttributes(camera_path):
+
+        """
+        get camera attributes driven by connection, such as animation curve or expression
+
+        :param camera_path - camera node path (MDagPath)
+
+        :return - driven attribute names (tuple)
+        """
+
+        node = OpenMaya.MFnDependencyNode(camera_path.node())
+
+        result = []
+        for attribute in PluginCamera.kAttributeNames:
+            try:
+                if node.findPlug(attribute, False).isDestination:
+                    result.append(attribute)
+
+            except Exception as exception_data:
+                frame_logger.error(repr(exception_data))
+                frame_logger.error("can`t read camera attribute " + attribute)
+
+        return tuple(result)
+
+    @staticmethod
+    def attributeChanged(message, plug, other_plug, client_data):
+
+        """
+        camera attribute changed callback, cached parameters are read again on next use
+
+        :param message - attribute message (OpenMaya.MNodeMessage.AttributeMessage)
+        :param plug - changed plug (OpenMaya.MPlug)
+        :param other_plug - connected plug (OpenMaya.MPlug)
+        :param client_data - camera full path name (str)
+        """
+
+        if message & PluginCamera.kInvalidateMessages:
+            entry = PluginCamera.__cache__.get(client_data)
+            if entry is not None:
+                entry["camera"] = None
+
+    @staticmethod
+    def release(*args):
+
+        """
+        remove cached cameras and their callbacks
+        """
+
+        for key in list(PluginCamera.__cache__):
+            PluginCamera.evict(key)
+
+    @staticmethod
+    def initializeCallbacks():
+
+        """
+        release cached cameras before scene is replaced
+        """
+
+        for message in (OpenMaya.MSceneMessage.kBeforeNew, OpenMaya.MSceneMessage.kBeforeOpen):
+            PluginCamera.__scene_callbacks__.append(OpenMaya.MSceneMessage.addCallback(message, PluginCamera.release))
+
+    @staticmethod
+    def uninitializeCallbacks():
+
+        """
+        remove scene callbacks and cached cameras
+        """
+
+        for callback in PluginCamera.__scene_callbacks__:
+            OpenMaya.MMessage.removeCallback(callback)
+
+        del PluginCamera.__scene_callbacks__[:]
+        PluginCamera.release()
+
+    @staticmethod
+    def fromDict(data):
+
+        """
+        get camera parameters from dictionary, missing keys keep defaults
+
+        :param data - camera parameters, film fit may be given by name (dict)
+
+        :return - camera parameters (PluginCamera)
+        """
+
+        result = PluginCamera()
+        for key in PluginCamera.__slots__:
+            if key in data:
+                value = data[key]
+                if key not in ("name", "panZoomEnabled", "filmFit"):
+                    value = float(value)
+
+                setattr(result, key, value)
+
+        if result.filmFit in PluginCamera.kFilmFitNames:
+            result.filmFit = PluginCamera.kFilmFitNames[result.filmFit]
+
+        return result
+
+    def __init__(self):
+
+        """
+        initialize camera parameters with maya camera defaults
+        """
+
+        self.name = "camera"
+        self.panZoomEnabled = False
+        self.zoom = 1.0
+        self.horizontalPan = 0.0
+        self.verticalPan = 0.0
+        self.lensSqueezeRatio = 1.0
+        self.horizontalFilmAperture = 1.41732
+        self.verticalFilmAperture = 0.94488
+        self.focalLength = 35.0
+        self.focusDistance = 5.0
+        self.filmFit = OpenMaya.MFnCamera.kFillFilmFit
+        self.overscan = 1.0
+
+    def fingerprint(self):
+
+        """
+        get camera parameters as comparable value
+
+        :return - camera parameter values (tuple)
+        """
+
+        return tuple(getattr(self, key) for key in PluginCamera.__slots__)
+
+    def toDict(self):
+
+        """
+        get camera parameters as dictionary
+
+        :return - camera parameters (dict)
+        """
+
+        result = {}
+        for key in PluginCamera.__slots__:
+            result[key] = getattr(self, key)
+
+        return result
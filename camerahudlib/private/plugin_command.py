@@ -2,7 +2,13 @@ import os
 import json
 import maya.api.OpenMaya as OpenMaya
 import maya.cmds as cmds
+from camerahudlib import constants
 from camerahudlib.private.logger import logger
+from camerahudlib.private.plugin_bundle import PluginBundle
+from camerahudlib.private.plugin_fonts import PluginFonts
+from camerahudlib.private.plugin_profiler import PluginProfiler
+from camerahudlib.private.plugin_text_cache import PluginTextCache
+from camerahudlib.private.plugin_trace import PluginTrace
 
 
 class PluginCommand(OpenMaya.MPxCommand):
@@ -13,6 +19,33 @@ class PluginCommand(OpenMaya.MPxCommand):
     kImport = "-im"
     kImportLong = "-import"
 
+    kExportBundle = "-eb"
+    kExportBundleLong = "-exportBundle"
+
+    kImportBundle = "-ib"
+    kImportBundleLong = "-importBundle"
+
+    kPreset = "-pr"
+    kPresetLong = "-preset"
+
+    kListPresets = "-lp"
+    kListPresetsLong = "-listPresets"
+
+    kStats = "-st"
+    kStatsLong = "-stats"
+
+    kTrace = "-tr"
+    kTraceLong = "-trace"
+
+    kTraceFrames = "-tf"
+    kTraceFramesLong = "-traceFrames"
+
+    kProfile = "-pf"
+    kProfileLong = "-profile"
+
+    kProfileDraws = "-pd"
+    kProfileDrawsLong = "-profileDraws"
+
     @staticmethod
     def cmdCreator():
 
@@ -32,6 +65,15 @@ class PluginCommand(OpenMaya.MPxCommand):
         syntax = OpenMaya.MSyntax()
         syntax.addFlag(PluginCommand.kExport, PluginCommand.kExportLong, OpenMaya.MSyntax.kString)
         syntax.addFlag(PluginCommand.kImport, PluginCommand.kImportLong, OpenMaya.MSyntax.kString)
+        syntax.addFlag(PluginCommand.kExportBundle, PluginCommand.kExportBundleLong, OpenMaya.MSyntax.kString)
+        syntax.addFlag(PluginCommand.kImportBundle, PluginCommand.kImportBundleLong, OpenMaya.MSyntax.kString)
+        syntax.addFlag(PluginCommand.kPreset, PluginCommand.kPresetLong, OpenMaya.MSyntax.kString)
+        syntax.addFlag(PluginCommand.kListPresets, PluginCommand.kListPresetsLong, OpenMaya.MSyntax.kString)
+        syntax.addFlag(PluginCommand.kStats, PluginCommand.kStatsLong)
+        syntax.addFlag(PluginCommand.kTrace, PluginCommand.kTraceLong, OpenMaya.MSyntax.kString)
+        syntax.addFlag(PluginCommand.kTraceFrames, PluginCommand.kTraceFramesLong, OpenMaya.MSyntax.kLong)
+        syntax.addFlag(PluginCommand.kProfile, PluginCommand.kProfileLong, OpenMaya.MSyntax.kString)
+        syntax.addFlag(PluginCommand.kProfileDraws, PluginCommand.kProfileDrawsLong, OpenMaya.MSyntax.kLong)
         syntax.setObjectType(OpenMaya.MSyntax.kStringObjects)
 
         return syntax
@@ -53,85 +95,39 @@ class PluginCommand(OpenMaya.MPxCommand):
         result = []
         args_data, kwargs_data = self.parseArgument(arg_list)
 
+        # list bundle presets
+        if "listPresets" in kwargs_data:
+            bundle = PluginBundle.open(kwargs_data["listPresets"])
+            if bundle is not None:
+                result = bundle.names()
+
+        # trace next frames, empty file name writes running trace
+        if "trace" in kwargs_data:
+            if kwargs_data["trace"]:
+                PluginTrace.start(kwargs_data["trace"], kwargs_data.get("traceFrames"))
+                result = kwargs_data["trace"]
+
+            else:
+                result = PluginTrace.stop()
+
+        # profile next draws, empty file name writes running profile
+        if "profile" in kwargs_data:
+            if kwargs_data["profile"]:
+                PluginProfiler.start(kwargs_data["profile"], kwargs_data.get("profileDraws"))
+                result = kwargs_data["profile"]
+
+            else:
+                result = PluginProfiler.stop()
+
+        # node statistics as json, all nodes when none given
+        if "stats" in kwargs_data:
+            result = self.statsData(args_data or cmds.ls(type=constants.kName) or [])
+
         if args_data:
             # export node
             if "export" in kwargs_data:
                 filename = kwargs_data["export"]
-                data = {}
-                for node in args_data:
-                    if node:
-                        if cmds.objExists(node):
-                            result.append(node)
-                            data["name"] = node
-                            ui = {}
-                            data["ui"] = ui
-
-                            indexList = cmds.getAttr(node + ".ui", multiIndices=True)
-                            size = cmds.getAttr(node + ".ui", size=True)
-                            i = 0
-                            while i < size:
-                                index = indexList[i]
-                                attribute = node + ".ui[" + str(index) + "]"
-                                alias_name = cmds.aliasAttr(attribute, q=True)
-                                if not alias_name:
-                                    alias_name = None
-
-                                ui_item = dict()
-                                ui[attribute] = ui_item
-                                ui_item["name"] = alias_name
-
-                                ui_item["draw"] = cmds.getAttr(attribute + ".draw")
-                                ui_item["gateDraw"] = cmds.getAttr(attribute + ".gateDraw")
-                                ui_item["uiType"] = cmds.getAttr(attribute + ".uiType")
-                                ui_item["resolutionGate"] = cmds.getAttr(attribute + ".resolutionGate")
-                                ui_item["horizontalAttach"] = cmds.getAttr(attribute + ".horizontalAttach")
-                                ui_item["verticalAttach"] = cmds.getAttr(attribute + ".verticalAttach")
-                                ui_item["textBackgroundColor"] = cmds.getAttr(attribute + ".textBackgroundColor")[0]
-                                ui_item["textBackgroundTransparency"] = cmds.getAttr(attribute + ".textBackgroundTransparency")
-                                ui_item["fontStyle"] = cmds.getAttr(attribute + ".fontStyle", asString=True)
-                                ui_item["text"] = cmds.getAttr(attribute + ".text")
-                                ui_item["fontWeight"] = cmds.getAttr(attribute + ".fontWeight")
-                                ui_item["textIncline"] = cmds.getAttr(attribute + ".textIncline")
-                                ui_item["fontLine"] = cmds.getAttr(attribute + ".fontLine")
-                                ui_item["verticalAlignment"] = cmds.getAttr(attribute + ".verticalAlignment")
-                                ui_item["horizontalAlignment"] = cmds.getAttr(attribute + ".horizontalAlignment")
-                                ui_item["fontSize"] = cmds.getAttr(attribute + ".fontSize")
-                                ui_item["fontStretch"] = cmds.getAttr(attribute + ".fontStretch")
-                                ui_item["size"] = cmds.getAttr(attribute + ".size")
-                                ui_item["lineWidth"] = cmds.getAttr(attribute + ".lineWidth")
-                                ui_item["fitToResolutionGate"] = cmds.getAttr(attribute + ".fitToResolutionGate")
-                                ui_item["radius"] = cmds.getAttr(attribute + ".radius")
-                                ui_item["filled"] = cmds.getAttr(attribute + ".filled")
-                                ui_item["regionColor"] = cmds.getAttr(attribute + ".regionColor")[0]
-                                ui_item["regionTransparency"] = cmds.getAttr(attribute + ".regionTransparency")
-                                ui_item["color"] = cmds.getAttr(attribute + ".color")[0]
-                                ui_item["transparency"] = cmds.getAttr(attribute + ".transparency")
-                                ui_item["region"] = cmds.getAttr(attribute + ".region")[0]
-                                ui_item["regionPosition"] = cmds.getAttr(attribute + ".regionPosition")[0]
-                                ui_item["regionDraw"] = cmds.getAttr(attribute + ".regionDraw")
-                                ui_item["regionIsFilled"] = cmds.getAttr(attribute + ".regionIsFilled")
-
-                                positions = []
-                                ui_item["position"] = positions
-                                position_size = cmds.getAttr(attribute + ".position", size=True)
-                                if position_size == 0:
-                                    position_size = 1
-
-                                positions_indexes = cmds.getAttr(attribute + ".position", multiIndices=True)
-                                if not positions_indexes:
-                                    positions_indexes = [0]
-
-                                n = 0
-                                while n < position_size:
-                                    index = positions_indexes[i]
-                                    position = cmds.getAttr(attribute + ".position[" + str(index) + "]")
-                                    if position:
-                                        position = position[0]
-                                        positions.append(position)
-
-                                    n += 1
-
-                                i += 1
+                data = self.exportData(args_data, result)
 
                 # write to file
                 try:
@@ -150,6 +146,25 @@ class PluginCommand(OpenMaya.MPxCommand):
                     obj.write(data)
                     obj.close()
 
+            # export node to bundle preset
+            if "exportBundle" in kwargs_data:
+                filename = kwargs_data["exportBundle"]
+                data = self.exportData(args_data, result)
+                name = kwargs_data.get("preset") or data.get("name")
+                if name:
+                    # keep other presets encoded, only exported one is replaced
+                    presets = {}
+                    if os.path.isfile(filename):
+                        bundle = PluginBundle.open(filename)
+                        if bundle is not None:
+                            presets = bundle.presets()
+
+                    presets[name] = data
+                    PluginBundle.write(filename, presets)
+
+                else:
+                    logger.error("preset name not provided")
+
             # import node
             if "import" in kwargs_data:
                 filename = kwargs_data["import"]
@@ -169,149 +184,293 @@ class PluginCommand(OpenMaya.MPxCommand):
                                 data = {}
 
                             if data:
-                                for node_name in args_data:
-                                    # create node
-                                    name = data["name"]
-                                    node = cmds.createNode("CameraHUD", name=name + "#")
-                                    if name:
-                                        node = cmds.rename(node, node_name)
-                                        result.append(node)
+                                self.importData(data, args_data, result)
+
+            # import node from bundle preset, only requested preset is decoded
+            if "importBundle" in kwargs_data:
+                filename = kwargs_data["importBundle"]
+                name = kwargs_data.get("preset")
+                if filename and name:
+                    bundle = PluginBundle.open(filename)
+                    if bundle is not None:
+                        data = bundle.preset(name)
+                        if data:
+                            self.importData(data, args_data, result)
 
-                                    cmds.connectAttr("defaultResolution.width", node + ".uiResolution0")
-                                    cmds.connectAttr("defaultResolution.height", node + ".uiResolution1")
+                else:
+                    logger.error("bundle or preset name not provided")
 
-                                    # load attribute data
-                                    index = 0
-                                    for attribute_key in data["ui"]:
-                                        attribute = node + ".ui[" + str(index) + "]"
-                                        ui_item = data["ui"][attribute_key]
-                                        attribute_name = None
-                                        if "name" in ui_item:
-                                            attribute_name = ui_item["name"]
-                                            del ui_item["name"]
+        self.setResult(result)
 
-                                        for ui_attribute in ui_item:
-                                            if ui_attribute == "draw":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+    def statsData(self, node_list):
 
-                                            elif ui_attribute == "gateDraw":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+        """
+        get node statistics
 
-                                            elif ui_attribute == "uiType":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+        :param node_list - node names (list)
 
-                                            elif ui_attribute == "resolutionGate":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+        :return - rolling averages by node name as json (str)
+        """
 
-                                            elif ui_attribute == "horizontalAttach":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+        data = {}
+        for node in node_list:
+            try:
+                selection = OpenMaya.MSelectionList()
+                selection.add(node)
+                instance = OpenMaya.MFnDependencyNode(selection.getDependNode(0)).userNode()
 
-                                            elif ui_attribute == "verticalAttach":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+            except Exception as exception_data:
+                logger.error(repr(exception_data))
+                logger.error("can`t find node " + node)
+                continue
 
-                                            elif ui_attribute == "textBackgroundColor":
-                                                value = ui_item[ui_attribute]
-                                                cmds.setAttr(attribute + "." + ui_attribute, value[0], value[1], value[2], type="double3")
+            if instance is None or not hasattr(instance, "stats"):
+                continue
 
-                                            elif ui_attribute == "textBackgroundTransparency":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+            node_data = instance.stats().asDict()
+            manager = instance.drawManager()
+            if manager is not None:
+                node_data["hudIndex"] = manager.index()
+                node_data["degradationLevel"] = manager.scheduler().level()
+                node_data["textCache"] = manager.textCache().asDict()
 
-                                            elif ui_attribute == "fontStyle":
-                                                active_item = ui_item[ui_attribute]
-                                                item_list = cmds.attributeQuery("fontStyle", node=node, listEnum=True)
-                                                active_item_index = 0
-                                                if item_list:
-                                                    item_list = item_list[0]
-                                                    item_list = item_list.split(":")
-                                                    item_index = 0
-                                                    for item in item_list:
-                                                        if item == active_item:
-                                                            active_item_index = item_index
-                                                            break
+            node_data["textureCache"] = PluginTextCache.textures().asDict()
+            data[node] = node_data
 
-                                                        item_index += 1
+        return json.dumps(data, sort_keys=True)
 
-                                                cmds.setAttr(attribute + "." + ui_attribute, active_item_index)
+    def exportData(self, node_list, result):
 
-                                            elif ui_attribute == "text":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute], type="string")
+        """
+        get exported node data
 
-                                            elif ui_attribute == "fontWeight":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+        :param node_list - node name list (list)
+        :param result - command result list (list)
 
-                                            elif ui_attribute == "textIncline":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+        :return - exported data (dict)
+        """
 
-                                            elif ui_attribute == "fontLine":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+        data = {}
+        for node in node_list:
+            if node:
+                if cmds.objExists(node):
+                    result.append(node)
+                    data["name"] = node
+                    ui = {}
+                    data["ui"] = ui
+
+                    indexList = cmds.getAttr(node + ".ui", multiIndices=True)
+                    size = cmds.getAttr(node + ".ui", size=True)
+                    i = 0
+                    while i < size:
+                        index = indexList[i]
+                        attribute = node + ".ui[" + str(index) + "]"
+                        alias_name = cmds.aliasAttr(attribute, q=True)
+                        if not alias_name:
+                            alias_name = None
+
+                        ui_item = dict()
+                        ui[attribute] = ui_item
+                        ui_item["name"] = alias_name
+
+                        ui_item["draw"] = cmds.getAttr(attribute + ".draw")
+                        ui_item["gateDraw"] = cmds.getAttr(attribute + ".gateDraw")
+                        ui_item["uiType"] = cmds.getAttr(attribute + ".uiType")
+                        ui_item["resolutionGate"] = cmds.getAttr(attribute + ".resolutionGate")
+                        ui_item["horizontalAttach"] = cmds.getAttr(attribute + ".horizontalAttach")
+                        ui_item["verticalAttach"] = cmds.getAttr(attribute + ".verticalAttach")
+                        ui_item["textBackgroundColor"] = cmds.getAttr(attribute + ".textBackgroundColor")[0]
+                        ui_item["textBackgroundTransparency"] = cmds.getAttr(attribute + ".textBackgroundTransparency")
+                        ui_item["fontStyle"] = cmds.getAttr(attribute + ".fontStyle", asString=True)
+                        ui_item["text"] = cmds.getAttr(attribute + ".text")
+                        ui_item["fontWeight"] = cmds.getAttr(attribute + ".fontWeight")
+                        ui_item["textIncline"] = cmds.getAttr(attribute + ".textIncline")
+                        ui_item["fontLine"] = cmds.getAttr(attribute + ".fontLine")
+                        ui_item["verticalAlignment"] = cmds.getAttr(attribute + ".verticalAlignment")
+                        ui_item["horizontalAlignment"] = cmds.getAttr(attribute + ".horizontalAlignment")
+                        ui_item["fontSize"] = cmds.getAttr(attribute + ".fontSize")
+                        ui_item["fontStretch"] = cmds.getAttr(attribute + ".fontStretch")
+                        ui_item["size"] = cmds.getAttr(attribute + ".size")
+                        ui_item["lineWidth"] = cmds.getAttr(attribute + ".lineWidth")
+                        ui_item["fitToResolutionGate"] = cmds.getAttr(attribute + ".fitToResolutionGate")
+                        ui_item["radius"] = cmds.getAttr(attribute + ".radius")
+                        ui_item["filled"] = cmds.getAttr(attribute + ".filled")
+                        ui_item["regionColor"] = cmds.getAttr(attribute + ".regionColor")[0]
+                        ui_item["regionTransparency"] = cmds.getAttr(attribute + ".regionTransparency")
+                        ui_item["color"] = cmds.getAttr(attribute + ".color")[0]
+                        ui_item["transparency"] = cmds.getAttr(attribute + ".transparency")
+                        ui_item["region"] = cmds.getAttr(attribute + ".region")[0]
+                        ui_item["regionPosition"] = cmds.getAttr(attribute + ".regionPosition")[0]
+                        ui_item["regionDraw"] = cmds.getAttr(attribute + ".regionDraw")
+                        ui_item["regionIsFilled"] = cmds.getAttr(attribute + ".regionIsFilled")
+                        ui_item["priority"] = cmds.getAttr(attribute + ".priority")
+
+                        positions = []
+                        ui_item["position"] = positions
+                        position_size = cmds.getAttr(attribute + ".position", size=True)
+                        if position_size == 0:
+                            position_size = 1
+
+                        positions_indexes = cmds.getAttr(attribute + ".position", multiIndices=True)
+                        if not positions_indexes:
+                            positions_indexes = [0]
+
+                        n = 0
+                        while n < position_size:
+                            index = positions_indexes[i]
+                            position = cmds.getAttr(attribute + ".position[" + str(index) + "]")
+                            if position:
+                                position = position[0]
+                                positions.append(position)
+
+                            n += 1
+
+                        i += 1
+
+        return data
+
+    def importData(self, data, node_list, result):
 
-                                            elif ui_attribute == "verticalAlignment":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+        """
+        create nodes from exported data
 
-                                            elif ui_attribute == "horizontalAlignment":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+        :param data - exported data (dict)
+        :param node_list - node name list (list)
+        :param result - command result list (list)
+        """
 
-                                            elif ui_attribute == "fontSize":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+        for node_name in node_list:
+            # create node
+            name = data["name"]
+            node = cmds.createNode("CameraHUD", name=name + "#")
+            if name:
+                node = cmds.rename(node, node_name)
+                result.append(node)
 
-                                            elif ui_attribute == "fontStretch":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+            cmds.connectAttr("defaultResolution.width", node + ".uiResolution0")
+            cmds.connectAttr("defaultResolution.height", node + ".uiResolution1")
 
-                                            elif ui_attribute == "size":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+            # load attribute data
+            index = 0
+            for attribute_key in data["ui"]:
+                attribute = node + ".ui[" + str(index) + "]"
+                ui_item = data["ui"][attribute_key]
+                attribute_name = None
+                if "name" in ui_item:
+                    attribute_name = ui_item["name"]
+                    del ui_item["name"]
 
-                                            elif ui_attribute == "lineWidth":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+                for ui_attribute in ui_item:
+                    if ui_attribute == "draw":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                            elif ui_attribute == "fitToResolutionGate":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+                    elif ui_attribute == "gateDraw":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                            elif ui_attribute == "radius":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+                    elif ui_attribute == "uiType":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                            elif ui_attribute == "filled":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+                    elif ui_attribute == "resolutionGate":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                            elif ui_attribute == "regionColor":
-                                                value = ui_item[ui_attribute]
-                                                cmds.setAttr(attribute + "." + ui_attribute, value[0], value[1], value[2], type="double3")
+                    elif ui_attribute == "horizontalAttach":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                            elif ui_attribute == "regionTransparency":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+                    elif ui_attribute == "verticalAttach":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                            elif ui_attribute == "color":
-                                                value = ui_item[ui_attribute]
-                                                cmds.setAttr(attribute + "." + ui_attribute, value[0], value[1], value[2], type="double3")
+                    elif ui_attribute == "textBackgroundColor":
+                        value = ui_item[ui_attribute]
+                        cmds.setAttr(attribute + "." + ui_attribute, value[0], value[1], value[2], type="double3")
 
-                                            elif ui_attribute == "transparency":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+                    elif ui_attribute == "textBackgroundTransparency":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                            elif ui_attribute == "regionDraw":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+                    elif ui_attribute == "fontStyle":
+                        # enum fields follow plugin font list
+                        active_item_index = max(PluginFonts.index(ui_item[ui_attribute]), 0)
+                        cmds.setAttr(attribute + "." + ui_attribute, active_item_index)
 
-                                            elif ui_attribute == "regionIsFilled":
-                                                cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+                    elif ui_attribute == "text":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute], type="string")
 
-                                            elif ui_attribute == "region":
-                                                value = ui_item[ui_attribute]
-                                                cmds.setAttr(attribute + "." + ui_attribute, value[0], value[1], type="double2")
+                    elif ui_attribute == "fontWeight":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                            elif ui_attribute == "regionPosition":
-                                                value = ui_item[ui_attribute]
-                                                cmds.setAttr(attribute + "." + ui_attribute, value[0], value[1], type="double2")
+                    elif ui_attribute == "textIncline":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                            elif ui_attribute == "position":
-                                                position_index = 0
-                                                for position_value in ui_item[ui_attribute]:
-                                                    cmds.setAttr(attribute + "." + ui_attribute + "[" + str(position_index) + "]", position_value[0], position_value[1], type="double2")
-                                                    position_index += 1
+                    elif ui_attribute == "fontLine":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                        if attribute_name:
-                                            cmds.aliasAttr(attribute_name, attribute)
+                    elif ui_attribute == "verticalAlignment":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-                                        index += 1
+                    elif ui_attribute == "horizontalAlignment":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
 
-        self.setResult(result)
+                    elif ui_attribute == "fontSize":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "fontStretch":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "size":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "lineWidth":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "fitToResolutionGate":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "radius":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "filled":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "regionColor":
+                        value = ui_item[ui_attribute]
+                        cmds.setAttr(attribute + "." + ui_attribute, value[0], value[1], value[2], type="double3")
+
+                    elif ui_attribute == "regionTransparency":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "color":
+                        value = ui_item[ui_attribute]
+                        cmds.setAttr(attribute + "." + ui_attribute, value[0], value[1], value[2], type="double3")
+
+                    elif ui_attribute == "transparency":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "regionDraw":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "regionIsFilled":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "priority":
+                        cmds.setAttr(attribute + "." + ui_attribute, ui_item[ui_attribute])
+
+                    elif ui_attribute == "region":
+                        value = ui_item[ui_attribute]
+                        cmds.setAttr(attribute + "." + ui_attribute, value[0], value[1], type="double2")
+
+                    elif ui_attribute == "regionPosition":
+                        value = ui_item[ui_attribute]
+                        cmds.setAttr(attribute + "." + ui_attribute, value[0], value[1], type="double2")
+
+                    elif ui_attribute == "position":
+                        position_index = 0
+                        for position_value in ui_item[ui_attribute]:
+                            cmds.setAttr(attribute + "." + ui_attribute + "[" + str(position_index) + "]", position_value[0], position_value[1], type="double2")
+                            position_index += 1
+
+                if attribute_name:
+                    cmds.aliasAttr(attribute_name, attribute)
+
+                index += 1
 
     def parseArgument(self, arg_list):
 
@@ -329,6 +488,41 @@ class PluginCommand(OpenMaya.MPxCommand):
             filename = arg_data.flagArgumentString(PluginCommand.kImport, 0)
             result_kwargs["import"] = filename
 
+        if arg_data.isFlagSet(PluginCommand.kExportBundle):
+            filename = arg_data.flagArgumentString(PluginCommand.kExportBundle, 0)
+            result_kwargs["exportBundle"] = filename
+
+        if arg_data.isFlagSet(PluginCommand.kImportBundle):
+            filename = arg_data.flagArgumentString(PluginCommand.kImportBundle, 0)
+            result_kwargs["importBundle"] = filename
+
+        if arg_data.isFlagSet(PluginCommand.kPreset):
+            name = arg_data.flagArgumentString(PluginCommand.kPreset, 0)
+            result_kwargs["preset"] = name
+
+        if arg_data.isFlagSet(PluginCommand.kListPresets):
+            filename = arg_data.flagArgumentString(PluginCommand.kListPresets, 0)
+            result_kwargs["listPresets"] = filename
+
+        if arg_data.isFlagSet(PluginCommand.kTrace):
+            filename = arg_data.flagArgumentString(PluginCommand.kTrace, 0)
+            result_kwargs["trace"] = filename
+
+        if arg_data.isFlagSet(PluginCommand.kTraceFrames):
+            frame_count = arg_data.flagArgumentInt(PluginCommand.kTraceFrames, 0)
+            result_kwargs["traceFrames"] = frame_count
+
+        if arg_data.isFlagSet(PluginCommand.kProfile):
+            filename = arg_data.flagArgumentString(PluginCommand.kProfile, 0)
+            result_kwargs["profile"] = filename
+
+        if arg_data.isFlagSet(PluginCommand.kProfileDraws):
+            draw_count = arg_data.flagArgumentInt(PluginCommand.kProfileDraws, 0)
+            result_kwargs["profileDraws"] = draw_count
+
+        if arg_data.isFlagSet(PluginCommand.kStats):
+            result_kwargs["stats"] = True
+
         result_args = arg_data.getObjectStrings()
         result_args = list(result_args)
 
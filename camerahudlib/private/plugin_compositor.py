@@ -0,0 +1,147 @@
+import sys
+from camerahudlib.private.qt import Qt
+from camerahudlib.private.qt.Qt import QtCore, QtGui
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
+
+class PluginCompositor(object):
+
+    # byte index of alpha channel in premultiplied argb32 pixel
+    kAlphaIndex = 3 if sys.byteorder == "little" else 0
+
+    @staticmethod
+    def isAccelerated():
+
+        """
+        numpy compositing is available
+
+        :return - numpy is available (bool)
+        """
+
+        return numpy is not None
+
+    @staticmethod
+    def mergeRects(rects, width, height):
+
+        """
+        merge overlapping rectangles and clamp them to image
+
+        :param rects - rectangles as (x, y, width, height) (list)
+        :param width - image width (int)
+        :param height - image height (int)
+
+        :return - merged rectangles as (left, top, right, bottom) (list)
+        """
+
+        result = []
+        for x, y, rect_width, rect_height in rects:
+            left, top = max(x, 0), max(y, 0)
+            right, bottom = min(x + rect_width, width), min(y + rect_height, height)
+            if right > left and bottom > top:
+                result.append([left, top, right, bottom])
+
+        merged = True
+        while merged:
+            merged = False
+            i = 0
+            while i < len(result):
+                rect = result[i]
+                n = i + 1
+                while n < len(result):
+                    other = result[n]
+                    if rect[0] <= other[2] and other[0] <= rect[2] and rect[1] <= other[3] and other[1] <= rect[3]:
+                        rect[0], rect[1] = min(rect[0], other[0]), min(rect[1], other[1])
+                        rect[2], rect[3] = max(rect[2], other[2]), max(rect[3], other[3])
+                        del result[n]
+                        merged = True
+
+                    else:
+                        n += 1
+
+                i += 1
+
+        return [tuple(rect) for rect in result]
+
+    @staticmethod
+    def imageArray(image):
+
+        """
+        get pixel array sharing memory with image
+
+        :param image - premultiplied argb32 image (QtGui.QImage)
+
+        :return - pixel array with (height, width, 4) shape (numpy.ndarray)
+        """
+
+        width, height = image.width(), image.height()
+        bytes_per_line = image.bytesPerLine()
+        pointer = image.bits()
+        if Qt.IsPyQt4 or Qt.IsPyQt5:
+            pointer.setsize(bytes_per_line * height)
+
+        array = numpy.frombuffer(pointer, numpy.uint8, bytes_per_line * height)
+        return array.reshape(height, bytes_per_line)[:, :width * 4].reshape(height, width, 4)
+
+    @staticmethod
+    def composite(image, layer, rects):
+
+        """
+        composite premultiplied layer over image inside painted rectangles
+
+        :param image - target image, modified in place (QtGui.QImage)
+        :param layer - overlay layer of image size (QtGui.QImage)
+        :param rects - painted rectangles as (x, y, width, height) (list)
+
+        :return - composited image (QtGui.QImage)
+        """
+
+        premultiplied = QtGui.QImage.Format_ARGB32_Premultiplied
+        if image.format() != premultiplied:
+            image = image.convertToFormat(premultiplied)
+
+        if layer.format() != premultiplied:
+            layer = layer.convertToFormat(premultiplied)
+
+        rects = PluginCompositor.mergeRects(rects, min(image.width(), layer.width()), min(image.height(), layer.height()))
+        if not rects:
+            return image
+
+        if numpy is None:
+            painter = QtGui.QPainter(image)
+            for left, top, right, bottom in rects:
+                rect = QtCore.QRect(left, top, right - left, bottom - top)
+                painter.drawImage(rect.topLeft(), layer, rect)
+
+            painter.end()
+            return image
+
+        # bindings exposing read-only image memory get composited copy
+        target = PluginCompositor.imageArray(image)
+        copied = not target.flags.writeable
+        if copied:
+            target = target.copy()
+
+        source = PluginCompositor.imageArray(layer)
+        alpha = PluginCompositor.kAlphaIndex
+
+        # out = source + target * (1 - source alpha), rounded in 16 bit integers
+        for left, top, right, bottom in rects:
+            source_block = source[top:bottom, left:right]
+            target_block = target[top:bottom, left:right]
+
+            inverse_alpha = 255 - source_block[:, :, alpha:alpha + 1].astype(numpy.uint16)
+            block = target_block * inverse_alpha
+            block += 127
+            block //= 255
+            block += source_block
+            target_block[...] = block
+
+        if copied:
+            image = QtGui.QImage(target.tobytes(), image.width(), image.height(), image.width() * 4, premultiplied).copy()
+
+        return image
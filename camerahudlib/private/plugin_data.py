@@ -1,6 +1,7 @@
 import maya.api.OpenMaya as OpenMaya
 from camerahudlib import constants
 from camerahudlib.private.canvas import Canvas
+from camerahudlib.private.plugin_text_cache import PluginTextCache
 
 
 class PluginData(OpenMaya.MUserData):
@@ -19,6 +20,9 @@ class PluginData(OpenMaya.MUserData):
         self.camera = ""
         self.cameraFocalLenght = 0
         self.cameraFocusDistance = 0
+        self.frame = None
+        self.animationStart = None
+        self.animationEnd = None
         self.resolutionWidth = 0.0
         self.resolutionHeight = 0.0
         self.height = 0.0
@@ -35,6 +39,24 @@ class PluginData(OpenMaya.MUserData):
         self.renderSafeTitle = Canvas(0, 0, 0, 0)
         self.renderSafeAction = Canvas(0, 0, 0, 0)
 
+        # drawing requests published when data was prepared and their regions in this viewport,
+        # request key -> (region rectangle, region position list)
+        self.requests = None
+        self.regions = {}
+
+        # text of time dependent requests expanded for drawn frame
+        self.frameText = {}
+
+        # layout and painter commands are reused while inputs stay the same
+        self.fingerprint = None
+        self.inputFingerprint = None
+        self.layoutKey = None
+        self.displayLists = {}
+        self.displayListKey = None
+
+        # painter commands of frame dependent items by request key and frame key
+        self.frameDisplayLists = PluginTextCache(PluginTextCache.textSize())
+
     def gate(self, key):
 
         """
@@ -0,0 +1,112 @@
+def recordingMethod(name):
+
+    """
+    create painter method recording its call
+
+    :param name - painter method name (str)
+
+    :return - recording method (function)
+    """
+
+    def record(self, *args, **kwargs):
+        self._commands.append((name, args, kwargs or None))
+        if self._painter is not None:
+            getattr(self._painter, name)(*args, **kwargs)
+
+    record.__name__ = name
+    return record
+
+
+class PluginDisplayList(object):
+
+    # painter methods captured by display list
+    kPainterMethods = (
+        "beginDrawable",
+        "endDrawable",
+        "setColor",
+        "setFontSize",
+        "setFontIncline",
+        "setFontWeight",
+        "setFontStretch",
+        "setFontLine",
+        "setFontName",
+        "setPointSize",
+        "setLineWidth",
+        "setLineStyle",
+        "line2d",
+        "point2d",
+        "rect2d",
+        "circle2d",
+        "text2d",
+    )
+
+    def __init__(self, painter=None):
+
+        """
+        initialize recording painter
+
+        :param painter - painter receiving recorded calls while recording (GLPainter or OpenMayaRender.MUIDrawManager)
+        """
+
+        self._painter = painter
+        self._commands = []
+        self._text_count = 0
+
+        # text prefetch of upcoming frames is recorded only for painters supporting it,
+        # so replay on other painters never calls it
+        if hasattr(painter, "prefetchText"):
+            self.prefetchText = recordingMethod("prefetchText").__get__(self)
+
+    def __len__(self):
+
+        """
+        get recorded command count
+
+        :return - recorded command count (int)
+        """
+
+        return len(self._commands)
+
+    def detach(self):
+
+        """
+        stop forwarding recorded calls to painter
+        """
+
+        self._painter = None
+        self._text_count = sum(1 for command in self._commands if command[0] == "text2d")
+
+    def textCount(self):
+
+        """
+        get recorded text draw count, counted on detach
+
+        :return - recorded text2d command count (int)
+        """
+
+        return self._text_count
+
+    def replay(self, painter):
+
+        """
+        issue recorded commands on painter
+
+        :param painter - target painter (GLPainter or OpenMayaRender.MUIDrawManager)
+        """
+
+        method_cache = {}
+        for name, args, kwargs in self._commands:
+            method = method_cache.get(name)
+            if method is None:
+                method = getattr(painter, name)
+                method_cache[name] = method
+
+            if kwargs is None:
+                method(*args)
+
+            else:
+                method(*args, **kwargs)
+
+
+for method_name in PluginDisplayList.kPainterMethods:
+    setattr(PluginDisplayList, method_name, recordingMethod(method_name))
@@ -1,10 +1,20 @@
+import time
 import datetime
 import maya.api.OpenMaya as OpenMaya
 import maya.api.OpenMayaUI as OpenMayaUI
 import maya.cmds as cmds
 from camerahudlib import constants
 from camerahudlib.private.canvas import Canvas
+from camerahudlib.private.logger import logger
+from camerahudlib.private.plugin_camera import PluginCamera
 from camerahudlib.private.plugin_data import PluginData
+from camerahudlib.private.plugin_display_list import PluginDisplayList
+from camerahudlib.private.plugin_fonts import PluginFonts
+from camerahudlib.private.plugin_gates import PluginGates
+from camerahudlib.private.plugin_prefetch import PluginPrefetch
+from camerahudlib.private.plugin_scheduler import PluginScheduler
+from camerahudlib.private.plugin_text_cache import PluginTextCache
+from camerahudlib.private.plugin_trace import PluginTrace
 from camerahudlib.private.plugin_draw_request import PluginDrawRequest
 
 
@@ -29,7 +39,7 @@ class PluginDrawManager(object):
                 used_index_list.append(existing_index)
 
         # remove unknown index data
-        for cache_index in PluginDrawManager.__cache__.keys():
+        for cache_index in list(PluginDrawManager.__cache__.keys()):
             if cache_index not in used_index_list:
                 del PluginDrawManager.__cache__[cache_index]
 
@@ -60,7 +70,7 @@ class PluginDrawManager(object):
             instance = PluginDrawManager.__cache__[next_index]
 
         else:
-            instance = super(PluginDrawManager, cls).__new__(cls, next_index)
+            instance = super(PluginDrawManager, cls).__new__(cls)
             instance._requested_index = next_index
 
         return instance
@@ -79,9 +89,120 @@ class PluginDrawManager(object):
         if index not in PluginDrawManager.__cache__:
             PluginDrawManager.__cache__[index] = self
             self._requested_index = index
-            self._request_data = {}
             self._resolution = [256, 256]
 
+            # published drawing requests, dictionary and requests in it are never changed,
+            # edited copies are published by replacing whole dictionary so draw reading
+            # it from other thread sees either previous or next state
+            self._request_data = {}
+
+            # published text of time dependent requests expanded for current frame,
+            # request index -> (request version, frame key, expanded text)
+            self._frame_text = {}
+
+            # expanded text by request index, request version and frame key, revisited
+            # frames of looped playback or scrubbing aren't expanded again
+            self._text_cache = PluginTextCache(PluginTextCache.textSize())
+
+            # last expanded frame and frames prefetched after it with playback range,
+            # (upcoming frames, animation start, animation end)
+            self._previous_frame = None
+            self._prefetch = ((), 0.0, 0.0)
+            self._prefetch_enabled = True
+
+            # frame and playback range text was last expanded for
+            self._frame_state = (0.0, 0.0, 0.0)
+
+            # increased on every drawing request or resolution change
+            self._version = 0
+            self._observers = []
+            self._frame_dependent = False
+            self._frame_dependent_version = -1
+
+            # draw time budget of all nodes using this manager
+            self._scheduler = PluginScheduler("hud " + str(index))
+
+    def scheduler(self):
+
+        """
+        get draw time scheduler
+
+        :return - draw time scheduler (PluginScheduler)
+        """
+
+        return self._scheduler
+
+    def textCache(self):
+
+        """
+        get expanded text cache
+
+        :return - expanded text cache (PluginTextCache)
+        """
+
+        return self._text_cache
+
+    def version(self):
+
+        """
+        get drawing data version
+
+        :return - version increased on every change (int)
+        """
+
+        return self._version
+
+    def touch(self, index=None):
+
+        """
+        mark drawing data as changed and notify observers
+
+        :param index - changed draw request index, whole manager if None (int)
+        """
+
+        self._version += 1
+        self.notify(index)
+
+    def notify(self, index=None):
+
+        """
+        notify observers about changed drawing data, called on request publish,
+        request removal and resolution change, never on frame change
+
+        :param index - changed draw request index, whole manager if None (int)
+        """
+
+        for callback in list(self._observers):
+            try:
+                callback(self, index)
+
+            except Exception as exception_data:
+                logger.error(repr(exception_data))
+                logger.error("can`t notify draw manager observer")
+
+    def addObserver(self, callback):
+
+        """
+        add change observer, called as callback(manager, index) where index
+        is changed draw request index or None when whole manager changed
+
+        :param callback - observer callback (function)
+        """
+
+        if callback not in self._observers:
+            self._observers.append(callback)
+
+    def removeObserver(self, callback):
+
+        """
+        remove change observer
+
+        :param callback - observer callback (function)
+        """
+
+        if callback in self._observers:
+            self._observers.remove(callback)
+
     def setResolution(self, width, height):
 
         """
@@ -91,8 +212,10 @@ class PluginDrawManager(object):
         :param height - resolution gate height (int)
         """
 
-        self._resolution[0] = width
-        self._resolution[1] = height
+        if self._resolution[0] != width or self._resolution[1] != height:
+            self._resolution[0] = width
+            self._resolution[1] = height
+            self.touch()
 
     def setWidth(self, width):
 
@@ -102,7 +225,9 @@ class PluginDrawManager(object):
         :param width - resolution gate width (int)
         """
 
-        self._resolution[0] = width
+        if self._resolution[0] != width:
+            self._resolution[0] = width
+            self.touch()
 
     def setHeight(self, height):
 
@@ -112,7 +237,9 @@ class PluginDrawManager(object):
         :param height - resolution gate height (int)
         """
 
-        self._resolution[1] = height
+        if self._resolution[1] != height:
+            self._resolution[1] = height
+            self.touch()
 
     def width(self):
 
@@ -164,12 +291,10 @@ class PluginDrawManager(object):
         :return - draw request (PluginDrawRequest)
         """
 
-        if index not in self._request_data:
+        result = self._request_data.get(index)
+        if result is None:
             result = PluginDrawRequest()
-            self._request_data[index] = result
-
-        else:
-            result = self._request_data[index]
+            self.publish(index, result)
 
         return result
 
@@ -182,7 +307,57 @@ class PluginDrawManager(object):
         """
 
         if index in self._request_data:
-            del self._request_data[index]
+            request_data = dict(self._request_data)
+            del request_data[index]
+            self._request_data = request_data
+            self.touch(index)
+
+    def edit(self, index):
+
+        """
+        get writable copy of draw request, changes are visible to draw after publish
+
+        :param index - draw request index (int)
+
+        :return - writable draw request (PluginDrawRequest)
+        """
+
+        request = self._request_data.get(index)
+        if request is None:
+            return PluginDrawRequest()
+
+        return request.copy()
+
+    def publish(self, index, request):
+
+        """
+        publish edited draw request, request becomes read only and replaces
+        previous one with single reference swap
+
+        :param index - draw request index (int)
+        :param request - edited draw request (PluginDrawRequest)
+        """
+
+        # request version is unique within manager, re-created request never repeats it
+        self._version += 1
+        request.version = self._version
+        request.freeze()
+
+        request_data = dict(self._request_data)
+        request_data[index] = request
+        self._request_data = request_data
+
+        self.notify(index)
+
+    def snapshot(self):
+
+        """
+        get published draw requests, returned dictionary is never changed
+
+        :return - draw request by index (dict)
+        """
+
+        return self._request_data
 
     def __iter__(self):
 
@@ -221,6 +396,127 @@ class PluginDrawManager(object):
 
         return result
 
+    def isFrameDependent(self):
+
+        """
+        drawn text uses frame or animation range tokens
+
+        :return - drawing changes with frame (bool)
+        """
+
+        if self._frame_dependent_version != self._version:
+            self._frame_dependent = False
+            for request in self._request_data.values():
+                if request.uiDraw and request.uiTextTimeDependent:
+                    self._frame_dependent = True
+                    break
+
+            self._frame_dependent_version = self._version
+
+        return self._frame_dependent
+
+    def loadPreset(self, data, scene_file="", creation_time=None):
+
+        """
+        fill drawing requests from exported preset, used outside of dependency graph
+
+        :param data - exported preset data (dict)
+        :param scene_file - scene file name used by $FILE tokens (str)
+        :param creation_time - creation unix time used by date tokens, current time if None (float)
+        """
+
+        self._request_data = {}
+        self.touch()
+
+        if creation_time is None:
+            creation_time = time.time()
+
+        date = datetime.datetime.fromtimestamp(creation_time)
+
+        for index, attribute_key in enumerate(data.get("ui", {})):
+            ui_item = data["ui"][attribute_key]
+            request = self.edit(index)
+
+            # update scene info and creation date
+            request.file = scene_file or ""
+            request.year = "%04d" % date.year
+            request.month = "%02d" % date.month
+            request.day = "%02d" % date.day
+            request.hour = "%02d" % date.hour
+            request.minute = "%02d" % date.minute
+
+            request.uiType = ui_item.get("uiType", constants.kText)
+            request.uiSize = ui_item.get("size", 1.0)
+            request.uiFilled = bool(ui_item.get("filled", False))
+            request.uiRadius = ui_item.get("radius", 5.0)
+
+            color = ui_item.get("color", (0.0, 1.0, 1.0))
+            request.uiColor = OpenMaya.MColor([color[0], color[1], color[2]])
+            request.uiColor.a = 1.0 - ui_item.get("transparency", 0.0)
+
+            request.uiResolutionGate = ui_item.get("resolutionGate", constants.kFilmGate)
+
+            position = ui_item.get("regionPosition", (0.0, 0.0))
+            request.uiRegionPosition = OpenMaya.MPoint(position[0], position[1], 0.0, 1.0)
+
+            size = ui_item.get("region", (0.0, 1.0))
+            request.uiRegion = OpenMaya.MVector(size[0], size[1], 0.0)
+
+            request.uiDrawRegion = bool(ui_item.get("regionDraw", False))
+            request.uiDrawResolutionGate = bool(ui_item.get("gateDraw", False))
+            request.uiHorisontalAttach = ui_item.get("horizontalAttach", constants.kAttachHorizontalLeft)
+            request.uiVerticalAttach = ui_item.get("verticalAttach", constants.kAttachVerticalTop)
+            request.uiHorisontalAlignment = ui_item.get("horizontalAlignment", constants.kHorizontalAlignmentLeft)
+            request.uiVerticalAlignment = ui_item.get("verticalAlignment", constants.kVerticalAlignmentTop)
+            request.uiRegionIsFilled = bool(ui_item.get("regionIsFilled", False))
+            request.uiDraw = bool(ui_item.get("draw", False))
+
+            color = ui_item.get("regionColor", (0.0, 1.0, 1.0))
+            request.uiRegionColor = OpenMaya.MColor([color[0], color[1], color[2]])
+            request.uiRegionColor.a = 1.0 - ui_item.get("regionTransparency", 0.0)
+
+            # get position data, text uses first position only
+            position_list = ui_item.get("position") or [(0.0, 0.0)]
+            if request.uiType == constants.kText:
+                position_list = position_list[:1]
+
+            request.uiPositionList = []
+            for position in position_list:
+                request.uiPositionList.append(OpenMaya.MPoint(position[0], position[1], 0.0, 1.0))
+
+            # get text data
+            request.uiFontStyleLine = constants.kFontStyleLineNone
+            request.uiTextFrameDependent = False
+            if request.uiType == constants.kText:
+                request.uiText = ui_item.get("text") or ""
+                request.uiTextFrameDependent = PluginDrawManager.hasFrameTokens(request.uiText)
+                request.uiTextDynamic = bool(ui_item.get("textDynamic", False))
+                request.uiFitToResolutionGate = bool(ui_item.get("fitToResolutionGate", False))
+                request.uiFontStyleLine = ui_item.get("fontLine", constants.kFontStyleLineNone)
+                request.uiFontStyleIncline = ui_item.get("textIncline", constants.kFontStyleInclineNormal)
+                request.uiFontStyleWeight = ui_item.get("fontWeight", constants.kFontStyleWeightLight)
+                request.uiFontStyleSize = ui_item.get("fontSize", request.uiFontStyleSize)
+                request.uiFontStyleStretch = ui_item.get("fontStretch", request.uiFontStyleStretch)
+                request.uiFontStyle = ui_item.get("fontStyle") or None
+
+                alpha = 1.0 - ui_item.get("textBackgroundTransparency", 1.0)
+                if alpha > 0.0:
+                    color = ui_item.get("textBackgroundColor", (0.0, 1.0, 1.0))
+                    request.uiTextBackgroundColor = OpenMaya.MColor([color[0], color[1], color[2]])
+                    request.uiTextBackgroundColor.a = alpha
+
+                else:
+                    request.uiTextBackgroundColor = None
+
+            request.uiLineStyle = ui_item.get("lineStyle", constants.kLineSolid)
+            request.uiLineWidth = ui_item.get("lineWidth", 2.0)
+            request.uiPriority = ui_item.get("priority", constants.kPriorityNormal)
+
+            # frame tokens are expanded again by updateFrame
+            PluginDrawManager.prepareText(request, 0.0, 0.0, 0.0)
+
+            self.publish(index, request)
+
     @staticmethod
     def compute(instance, plug, datablock):
 
@@ -242,6 +538,11 @@ class PluginDrawManager(object):
         creation_time = time_index_handle.asDouble()
         time_index_handle.setClean()
 
+        # get scene name, written by scene callbacks
+        scene_name_handle = datablock.inputValue(Plugin.aSceneName)
+        scene_name = scene_name_handle.asString()
+        scene_name_handle.setClean()
+
         # get manager instance
         hud_index_handle = datablock.inputValue(Plugin.aHudIndex)
         hud_index = hud_index_handle.asShort()
@@ -286,12 +587,11 @@ class PluginDrawManager(object):
 
         # compute drawing request data
         if active_request_index is not None:
-            request = manager[active_request_index]
+            # edit copy of published request, draw keeps reading published one
+            request = manager.edit(active_request_index)
 
             # update scene info
-            request.file = cmds.file(q=True, sn=True)
-            if not request.file:
-                request.file = ""
+            request.file = scene_name or ""
 
             # update creation date
             date = datetime.datetime.fromtimestamp(creation_time)
@@ -442,10 +742,12 @@ class PluginDrawManager(object):
 
             # get text data
             request.uiFontStyleLine = constants.kFontStyleLineNone
+            request.uiTextFrameDependent = False
             if request.uiType == constants.kText:
                 # get text string
                 data_handle = ui_compound_handle.child(Plugin.aText)
                 request.uiText = data_handle.asString()
+                request.uiTextFrameDependent = PluginDrawManager.hasFrameTokens(request.uiText)
 
                 # get text is dynamic
                 data_handle = ui_compound_handle.child(Plugin.aTextDynamic)
@@ -482,9 +784,9 @@ class PluginDrawManager(object):
 
                 # get font style
                 data_handle = ui_compound_handle.child(Plugin.aFontStyleName)
-                font_style_index =  data_handle.asShort()
-                if 0 <= font_style_index < len(Plugin.uiFontStyleList):
-                    request.uiFontStyle = Plugin.uiFontStyleList[font_style_index]
+                font_style = PluginFonts.name(data_handle.asShort())
+                if font_style is not None:
+                    request.uiFontStyle = font_style
 
                 data_handle.setClean()
 
@@ -513,11 +815,271 @@ class PluginDrawManager(object):
             request.uiLineWidth = data_handle.asFloat()
             data_handle.setClean()
 
+            # get draw priority
+            data_handle = ui_compound_handle.child(Plugin.aPriority)
+            request.uiPriority = data_handle.asShort()
+            data_handle.setClean()
+
             ui_compound_handle.setClean()
             ui_compound_array_handle.setClean()
 
+            # time inputs only affect frame state, frame tokens use last expanded frame and
+            # are expanded again by updateFrame when frame state is computed
+            frame, animation_start, animation_end = manager.frameState()
+            PluginDrawManager.prepareText(request, frame, animation_start, animation_end)
+            manager.publish(active_request_index, request)
+
+    @staticmethod
+    def computeFrame(instance, datablock):
+
+        """
+        expand text of time dependent drawing requests after time or playback range change,
+        other requests aren't touched
+
+        :param instance - plugin node instance (Plugin)
+        :param datablock - attribute data handle (OpenMaya.MDataBlock)
+        """
+
+        from camerahudlib.private.plugin import Plugin
+
+        # get manager instance
+        hud_index_handle = datablock.inputValue(Plugin.aHudIndex)
+        hud_index = hud_index_handle.asShort()
+        hud_index_handle.setClean()
+        manager = PluginDrawManager(hud_index)
+
+        frame, animation_start, animation_end = PluginDrawManager.datablockTime(datablock)
+        manager.updateFrame(frame, animation_start, animation_end)
+
+        frame_state_handle = datablock.outputValue(Plugin.aFrameState)
+        frame_state_handle.setDouble(frame)
+        frame_state_handle.setClean()
+
+    @staticmethod
+    def datablockTime(datablock):
+
+        """
+        get frame and playback range from node scene inputs in datablock
+
+        :param datablock - attribute data handle (OpenMaya.MDataBlock)
+
+        :return - frame, animation start and animation end in ui time unit (tuple)
+        """
+
+        from camerahudlib.private.plugin import Plugin
+
+        unit = OpenMaya.MTime.uiUnit()
+        result = []
+        for attribute in (Plugin.aTime, Plugin.aAnimationStart, Plugin.aAnimationEnd):
+            data_handle = datablock.inputValue(attribute)
+            result.append(data_handle.asTime().asUnits(unit))
+            data_handle.setClean()
+
+        return tuple(result)
+
+    def updateFrame(self, frame, animation_start, animation_end):
+
+        """
+        expand text of time dependent drawing requests for frame, published as separate
+        dictionary so requests, manager version and layout stay the same
+
+        :param frame - current frame (float)
+        :param animation_start - playback range start (float)
+        :param animation_end - playback range end (float)
+        """
+
+        self._frame_state = (frame, animation_start, animation_end)
+
+        previous_frame_text = self._frame_text
+        frame_text = {}
+        changed = False
+        for index, request in self._request_data.items():
+            if not request.uiTextTimeDependent:
+                continue
+
+            frame_key = PluginDrawManager.textFrameKey(request, frame, animation_start, animation_end)
+            if request.uiTextFrameKey == frame_key:
+                changed = changed or index in previous_frame_text
+                continue
+
+            entry = previous_frame_text.get(index)
+            if entry is None or entry[0] != request.version or entry[1] != frame_key:
+                cache_key = (index, request.version, frame_key)
+                text = self._text_cache.get(cache_key)
+                if text is None:
+                    text = PluginDrawManager.expandText(request, request.uiText, frame, animation_start, animation_end)
+                    self._text_cache.set(cache_key, text)
+
+                entry = (request.version, frame_key, text)
+                changed = True
+
+            frame_text[index] = entry
+
+        if changed or len(frame_text) != len(previous_frame_text):
+            self._frame_text = frame_text
+
+        if frame != self._previous_frame:
+            frames = ()
+            if self._prefetch_enabled:
+                frames = PluginPrefetch.nextFrames(frame, self._previous_frame, animation_start, animation_end)
+
+            self._previous_frame = frame
+            self._prefetch = (frames, animation_start, animation_end)
+            requests = [(index, request) for index, request in self._request_data.items() if request.uiTextFrameDependent]
+            if frames and requests:
+                PluginPrefetch.submit(
+                    ("text", self.index(), frames),
+                    PluginDrawManager.prefetchText,
+                    self._text_cache,
+                    requests,
+                    frames,
+                    animation_start,
+                    animation_end
+                )
+
+    @staticmethod
+    def prefetchText(text_cache, requests, frames, animation_start, animation_end):
+
+        """
+        expand text of time dependent requests for upcoming frames, runs on prefetch
+        thread, requests are published snapshots which are never changed
+
+        :param text_cache - expanded text cache of drawing manager (PluginTextCache)
+        :param requests - request index and time dependent request pairs (list)
+        :param frames - upcoming frames (tuple)
+        :param animation_start - playback range start (float)
+        :param animation_end - playback range end (float)
+        """
+
+        for frame in frames:
+            for index, request in requests:
+                frame_key = PluginDrawManager.textFrameKey(request, frame, animation_start, animation_end)
+                cache_key = (index, request.version, frame_key)
+                if not text_cache.contains(cache_key):
+                    text = PluginDrawManager.expandText(request, request.uiText, frame, animation_start, animation_end)
+                    text_cache.set(cache_key, text)
+
+                    # hand interpreter lock back, draw thread never waits for whole job
+                    PluginPrefetch.yieldThread()
+
+    def upcomingText(self, request_key, request):
+
+        """
+        get text of time dependent request already expanded for upcoming frames
+
+        :param request_key - request index (int)
+        :param request - published draw request (PluginDrawRequest)
+
+        :return - expanded text of upcoming frames, frames not expanded yet are left out (list)
+        """
+
+        frames, animation_start, animation_end = self._prefetch
+        result = []
+        for frame in frames:
+            frame_key = PluginDrawManager.textFrameKey(request, frame, animation_start, animation_end)
+            text = self._text_cache.peek((request_key, request.version, frame_key))
+            if text is not None and text not in result:
+                result.append(text)
+
+        return result
+
+    def setPrefetchEnabled(self, enabled):
+
+        """
+        enable text prefetch of upcoming frames, offline managers render requested
+        frames only and don't start prefetch thread
+
+        :param enabled - prefetch is enabled (bool)
+        """
+
+        self._prefetch_enabled = bool(enabled)
+        if not self._prefetch_enabled:
+            self._prefetch = ((), 0.0, 0.0)
+
+    def frameState(self):
+
+        """
+        get frame and playback range text was last expanded for
+
+        :return - frame, animation start and animation end (tuple)
+        """
+
+        return self._frame_state
+
+    def frameText(self):
+
+        """
+        get published text of time dependent requests, returned dictionary is never changed
+
+        :return - request version, frame key and expanded text by request index (dict)
+        """
+
+        return self._frame_text
+
+    @staticmethod
+    def requestText(data, request_key, request):
+
+        """
+        get expanded text of request drawn with user data
+
+        :param data - user data (PluginData)
+        :param request_key - draw request index (int)
+        :param request - draw request (PluginDrawRequest)
+
+        :return - frame key and text with scene, date and frame tokens expanded (tuple)
+        """
+
+        entry = data.frameText.get(request_key)
+        if entry is not None and entry[0] == request.version:
+            return entry[1], entry[2]
+
+        return request.uiTextFrameKey, request.uiTextExpanded
+
+    @staticmethod
+    def textFrameKey(request, frame, animation_start, animation_end):
+
+        """
+        get frame values text of request depends on
+
+        :param request - draw request (PluginDrawRequest)
+        :param frame - current frame (float)
+        :param animation_start - playback range start (float)
+        :param animation_end - playback range end (float)
+
+        :return - frame key, None if text doesn't use frame tokens (tuple)
+        """
+
+        if not request.uiTextTimeDependent:
+            return None
+
+        if not request.uiTextFrameDependent:
+            frame = None
+
+        return frame, animation_start, animation_end
+
     @staticmethod
-    def prepareForDraw(path, camera_path, frame_context, previous_data, viewport_version):
+    def prepareText(request, frame, animation_start, animation_end):
+
+        """
+        expand scene, date and frame tokens of text request, camera tokens are left for draw
+
+        :param request - writable draw request (PluginDrawRequest)
+        :param frame - current frame (float)
+        :param animation_start - playback range start (float)
+        :param animation_end - playback range end (float)
+        """
+
+        text = ""
+        if request.uiType == constants.kText:
+            text = request.uiText or ""
+
+        request.uiTextTimeDependent = "$FRAME" in text
+        request.uiTextCameraDependent = PluginDrawManager.hasCameraTokens(text)
+        request.uiTextFrameKey = PluginDrawManager.textFrameKey(request, frame, animation_start, animation_end)
+        request.uiTextExpanded = PluginDrawManager.expandText(request, text, frame, animation_start, animation_end)
+
+    @staticmethod
+    def prepareForDraw(path, camera_path, frame_context, previous_data, viewport_version, manager=None):
 
         """
         prepare for draw
@@ -527,6 +1089,7 @@ class PluginDrawManager(object):
         :param frame_context - frame context (OpenMayaRender.MFrameContext)
         :param previous_data - user data (OpenMayaRender.MUserData)
         :param viewport_version - viewport version (int)
+        :param manager - drawing manager of node, read from hud index if None (PluginDrawManager)
         """
 
         from camerahudlib.private.plugin import Plugin
@@ -542,34 +1105,154 @@ class PluginDrawManager(object):
             return None
 
         # get render manager
-        plug = OpenMaya.MPlug(node, Plugin.aHudIndex)
-        hud_index = plug.asInt()
-        if hud_index < 0:
-            return None
+        if manager is None:
+            hud_index = OpenMaya.MPlug(node, Plugin.aHudIndex).asInt()
+            if hud_index < 0:
+                return None
 
-        manager = PluginDrawManager(hud_index)
+            manager = PluginDrawManager(hud_index)
+
+        hud_index = manager.index()
         data.manager = manager
-        resolution_width = manager.width()
-        resolution_height = manager.height()
-        resolution_aspect = float(resolution_width) / float(resolution_height)
-        vertical_resolution_aperture = 1.0
-        horizontal_resolution_aperture = 1.0
-        data.resolutionWidth = resolution_width
-        data.resolutionHeight = resolution_height
+
+        # scene time inputs used by frame tokens
+        data.frame, data.animationStart, data.animationEnd = PluginDrawManager.sceneTime(node)
+
+        # draw reads requests published before this point, compute can publish others meanwhile
+        version = manager.version()
+        data.requests = manager.snapshot()
+        data.frameText = manager.frameText()
 
         # update viewport canvas rectangle
+        viewport_x, viewport_y, viewport_width, viewport_height = PluginDrawManager.viewportRect(frame_context)
+
+        # update camera option
+        camera = PluginCamera.fromPath(camera_path)
+
+        # layout is calculated again only when drawing data, viewport or camera changed
+        data.fingerprint = (
+            viewport_x,
+            viewport_y,
+            viewport_width,
+            viewport_height,
+            data.manager.width(),
+            data.manager.height(),
+            camera.fingerprint()
+        )
+        layout_key = (hud_index, version, data.fingerprint)
+        if data.layoutKey != layout_key:
+            PluginGates.prepare(data, camera_path.fullPathName(), camera, viewport_x, viewport_y, viewport_width, viewport_height)
+            PluginDrawManager.prepareRegions(data)
+            data.layoutKey = layout_key
+
+        return data
+
+    @staticmethod
+    def viewportRect(frame_context):
+
+        """
+        get viewport rectangle
+
+        :param frame_context - frame context, active legacy view is used if None (OpenMayaRender.MFrameContext)
+
+        :return - viewport center x, center y, width and height (tuple)
+        """
+
         if frame_context is None:
             view = OpenMayaUI.M3dView.active3dView()
             viewport_width = view.portWidth()
             viewport_height = view.portHeight()
 
-            viewport_x = viewport_width * 0.5
-            viewport_y = viewport_height * 0.5
+            return viewport_width * 0.5, viewport_height * 0.5, viewport_width, viewport_height
 
-        else:
-            origin_x, origin_y, viewport_width, viewport_height = frame_context.getViewportDimensions()
-            viewport_x = origin_x + viewport_width * 0.5
-            viewport_y = origin_y + viewport_height * 0.5
+        origin_x, origin_y, viewport_width, viewport_height = frame_context.getViewportDimensions()
+        return origin_x + viewport_width * 0.5, origin_y + viewport_height * 0.5, viewport_width, viewport_height
+
+    @staticmethod
+    def updateBudget(manager, node):
+
+        """
+        apply node draw budget to manager scheduler, budget only changes scheduling
+        so it's read from own plug before reused draw data check and never dirties ui
+
+        :param manager - drawing manager of node (PluginDrawManager)
+        :param node - CameraHUD node (OpenMaya.MObject)
+        """
+
+        from camerahudlib.private.plugin import Plugin
+
+        manager.scheduler().setBudget(OpenMaya.MPlug(node, Plugin.aDrawBudget).asDouble())
+
+    @staticmethod
+    def sceneTime(node):
+
+        """
+        get frame and playback range from node scene inputs
+
+        :param node - CameraHUD node (OpenMaya.MObject)
+
+        :return - frame, animation start and animation end in ui time unit (tuple)
+        """
+
+        from camerahudlib.private.plugin import Plugin
+
+        # reading frame state evaluates node, time dependent text is expanded by its compute
+        unit = OpenMaya.MTime.uiUnit()
+        return (
+            OpenMaya.MPlug(node, Plugin.aFrameState).asDouble(),
+            OpenMaya.MPlug(node, Plugin.aAnimationStart).asMTime().asUnits(unit),
+            OpenMaya.MPlug(node, Plugin.aAnimationEnd).asMTime().asUnits(unit)
+        )
+
+    @staticmethod
+    def inputFingerprint(manager, camera_path, frame_context, node):
+
+        """
+        get fingerprint of everything prepared drawing data depends on
+
+        :param manager - drawing manager of node (PluginDrawManager)
+        :param camera_path - camera node path (MDagPath)
+        :param frame_context - frame context (OpenMayaRender.MFrameContext)
+        :param node - CameraHUD node (OpenMaya.MObject)
+
+        :return - manager version, viewport, camera and frame values (tuple)
+        """
+
+        # frame is part of fingerprint only when drawn text depends on it
+        frame_key = None
+        if manager.isFrameDependent():
+            frame_key = PluginDrawManager.sceneTime(node)
+
+        return (
+            manager.index(),
+            manager.version(),
+            PluginDrawManager.viewportRect(frame_context),
+            PluginCamera.fromPath(camera_path).fingerprint(),
+            frame_key
+        )
+
+    @staticmethod
+    def prepareGates(data, camera, viewport_x, viewport_y, viewport_width, viewport_height):
+
+        """
+        calculate resolution gates
+
+        :param data - user data with assigned manager (PluginData)
+        :param camera - camera parameters (PluginCamera)
+        :param viewport_x - viewport center x coordinate (float)
+        :param viewport_y - viewport center y coordinate (float)
+        :param viewport_width - viewport width (float)
+        :param viewport_height - viewport height (float)
+        """
+
+        manager = data.manager
+        resolution_width = manager.width()
+        resolution_height = manager.height()
+        resolution_aspect = float(resolution_width) / float(resolution_height)
+        vertical_resolution_aperture = 1.0
+        horizontal_resolution_aperture = 1.0
+        data.resolutionWidth = resolution_width
+        data.resolutionHeight = resolution_height
 
         data.width = viewport_width
         data.height = viewport_height
@@ -583,7 +1266,6 @@ class PluginDrawManager(object):
         data.port.inherit(data.viewport)
 
         # update camera option
-        camera = OpenMaya.MFnCamera(camera_path)
         if camera.panZoomEnabled:
             zoom = camera.zoom
             pan_x = camera.horizontalPan
@@ -597,7 +1279,7 @@ class PluginDrawManager(object):
         lens_squeeze_ratio = camera.lensSqueezeRatio
         horizontal_film_aperture = camera.horizontalFilmAperture
         vertical_film_aperture = camera.verticalFilmAperture
-        data.camera = camera_path.fullPathName().rsplit("|", 2)[1]
+        data.camera = camera.name
         data.cameraFocalLenght = camera.focalLength
         data.cameraFocusDistance = camera.focusDistance
 
@@ -738,10 +1420,27 @@ class PluginDrawManager(object):
             height
         )
 
-        # update region rectangle for each drawing request
-        for request_key in data.manager:
-            request = data.manager[request_key]
+    @staticmethod
+    def prepareRegions(data):
+
+        """
+        calculate region rectangle for each drawing request
+
+        :param data - user data with calculated gates (PluginData)
+        """
+
+        # regions are stored per viewport data, published requests are never written
+        requests = PluginDrawManager.requests(data)
+        previous_regions = data.regions
+        regions = {}
+
+        tracing = PluginTrace.enabled()
+        for request_key in requests:
+            request = requests[request_key]
             if request.uiDraw:
+                if tracing:
+                    PluginTrace.begin("layout", request=request_key)
+
                 gate = data.gate(request.uiResolutionGate)
                 real_x, real_y, real_width, real_height = request.uiRegionPosition.x, request.uiRegionPosition.y, request.uiRegion.x, request.uiRegion.y
 
@@ -781,8 +1480,15 @@ class PluginDrawManager(object):
                 width = int(real_width)
                 height = int(real_height)
 
+                # reuse region objects of previous layout
+                if request_key in previous_regions:
+                    region, region_position_list = previous_regions[request_key]
+
+                else:
+                    region, region_position_list = Canvas(0, 0, 0, 0), []
+
                 # apply region rectangle
-                request.region.apply(
+                region.apply(
                     x,
                     y,
                     width,
@@ -790,16 +1496,16 @@ class PluginDrawManager(object):
                 )
 
                 # update region position list
-                size = len(request.uiRegionPositionList)
+                size = len(region_position_list)
                 point_index = 0
                 for point in request.uiPositionList:
                     if point_index >= size:
                         region_point = OpenMaya.MPoint()
-                        request.uiRegionPositionList.append(region_point)
+                        region_position_list.append(region_point)
                         size += 1
 
                     else:
-                        region_point = request.uiRegionPositionList[point_index]
+                        region_point = region_position_list[point_index]
 
                     # calculate real position value
                     region_point.x = point.x * (real_width / 100.0)
@@ -807,12 +1513,33 @@ class PluginDrawManager(object):
 
                     point_index += 1
 
-                request.uiRegionPositionList = request.uiRegionPositionList[:point_index + 1]
+                del region_position_list[point_index:]
+                regions[request_key] = (region, region_position_list)
 
-        return data
+                if tracing:
+                    PluginTrace.end("layout", request=request_key)
+
+        data.regions = regions
 
     @staticmethod
-    def draw(painter, frame_context, data):
+    def requests(data):
+
+        """
+        get drawing requests drawn with user data, requests published before
+        prepare for draw or currently published ones when data wasn't prepared
+
+        :param data - user data (PluginData)
+
+        :return - draw request by index (dict)
+        """
+
+        if data.requests is not None:
+            return data.requests
+
+        return data.manager.snapshot()
+
+    @staticmethod
+    def draw(painter, frame_context, data, request_keys=None, level=None):
 
         """
         request viewport 2.0 draw
@@ -820,6 +1547,10 @@ class PluginDrawManager(object):
         :param painter - painter object (GLPainter or OpenMayaRender.MUIDrawManager)
         :param frame_context - frame context (OpenMayaRender.MFrameContext)
         :param data - user data (OpenMayaRender.MUserData)
+        :param request_keys - drawing request keys to draw, all requests if None (list)
+        :param level - degradation level, scheduler level if None (int)
+
+        :return - painter call and text draw count when drawn from display lists (tuple)
         """
 
         if not isinstance(data, PluginData):
@@ -828,13 +1559,40 @@ class PluginDrawManager(object):
         if data.manager is None:
             return None
 
-        for request_key in data.manager:
-            request = data.manager[request_key]
+        if level is None:
+            level = data.manager.scheduler().level()
+
+        if request_keys is None:
+            # lower circle detail, viewport 2.0 tessellates circles by itself
+            if hasattr(painter, "setCircleSegments"):
+                if level >= constants.kDegradeCircleDetail:
+                    painter.setCircleSegments(constants.kDegradeCircleSegments)
+
+                else:
+                    painter.setCircleSegments(0)
+
+            # replay painter commands of previous frame when nothing changed
+            if data.layoutKey is not None:
+                return PluginDrawManager.drawDisplayLists(painter, frame_context, data, level)
+
+        requests = PluginDrawManager.requests(data)
+        if request_keys is None:
+            request_keys = requests
+
+        for request_key in request_keys:
+            request = requests.get(request_key)
+            if request is None or request_key not in data.regions:
+                continue
+
+            if level >= constants.kDegradeSkipLowPriority and request.uiPriority == constants.kPriorityLow:
+                continue
+
             if request.uiDraw:
                 gate = data.gate(request.uiResolutionGate)
-                region_corner = request.region.corner(Canvas.kLeftBottom)
+                region, region_position_list = data.regions[request_key]
+                region_corner = region.corner(Canvas.kLeftBottom)
                 x, y = region_corner.x, region_corner.y
-                width, height = request.region.width(), request.region.height()
+                width, height = region.width(), region.height()
 
                 scale = request.uiSize
 
@@ -867,7 +1625,7 @@ class PluginDrawManager(object):
                     alignment_offset_x = width * 0.5
 
                 # draw resolution gate
-                if request.uiDrawResolutionGate:
+                if request.uiDrawResolutionGate and level < constants.kDegradeSkipRegions:
                     painter.beginDrawable()
                     painter.setColor(request.uiColor)
                     painter.setLineWidth(line_width)
@@ -877,20 +1635,21 @@ class PluginDrawManager(object):
                     painter.endDrawable()
 
                 # draw paint region
-                if request.uiDrawRegion:
+                if request.uiDrawRegion and level < constants.kDegradeSkipRegions:
                     painter.beginDrawable()
                     painter.setColor(request.uiRegionColor)
                     painter.setLineWidth(line_width)
                     painter.setLineStyle(request.uiLineStyle)
-                    position = request.region.position()
+                    position = region.position()
                     painter.rect2d(position, OpenMaya.MVector.kYaxisVector, width * 0.5, height * 0.5, request.uiRegionIsFilled)
                     painter.setPointSize(10)
                     painter.endDrawable()
 
-                # draw text
+                # draw text, expanded by compute except camera tokens
                 if request.uiType == constants.kText:
-                    text = request.uiText
-                    if text:
+                    text = PluginDrawManager.requestText(data, request_key, request)[1]
+                    if request.uiText:
+                        PluginTrace.begin("text", request=request_key)
                         painter.beginDrawable()
                         painter.setColor(request.uiColor)
                         if request.uiFontStyle is not None:
@@ -901,73 +1660,12 @@ class PluginDrawManager(object):
                         painter.setFontLine(request.uiFontStyleLine)
                         painter.setFontWeight(request.uiFontStyleWeight)
                         painter.setFontIncline(request.uiFontStyleIncline)
-                        point = request.uiRegionPositionList[0]
+                        point = region_position_list[0]
 
                         point = OpenMaya.MPoint(x + point.x * scale + alignment_offset_x, y + point.y * scale, 0.0, 1.0)
 
-                        # information about animation range
-                        if "$FRAME_AST" in text:
-                            text = text.replace("$FRAME_AST", "%03d" % cmds.playbackOptions(q=True, ast=True))
-
-                        if "$FRAME_AET" in text:
-                            text = text.replace("$FRAME_AET", "%03d" % cmds.playbackOptions(q=True, aet=True))
-
-                        if "$FRAME_COUNT" in text:
-                            text = text.replace("$FRAME_COUNT", "%03d" % ((cmds.playbackOptions(q=True, aet=True) - cmds.playbackOptions(q=True, ast=True)) + 1))
-
-                        if "$FRAME_REAL" in text:
-                            text = text.replace("$FRAME_REAL", "%03d" % cmds.currentTime(q=True))
-
-                        if "$FRAME" in text:
-                            text = text.replace("$FRAME", "%03d" % ((cmds.currentTime(q=True) - cmds.playbackOptions(q=True, ast=True)) + 1))
-
-                        # Information about scene
-                        if "$FILE_SHORT" in text:
-                            text = text.replace("$FILE_SHORT", request.file.rsplit("/", 1)[-1].split(".", 1)[0])
-
-                        if "$FILE" in text:
-                            text = text.replace("$FILE", request.file)
-
-                        # information about creation date
-                        if "$YEAR" in text:
-                            text = text.replace("$YEAR", request.year)
-
-                        if "$MONTH" in text:
-                            text = text.replace("$MONTH", request.month)
-
-                        if "$DAY" in text:
-                            text = text.replace("$DAY", request.day)
-
-                        if "$HOUR" in text:
-                            text = text.replace("$HOUR", request.hour)
-
-                        if "$MINUTE" in text:
-                            text = text.replace("$MINUTE", request.minute)
-
-                        # information about camera
-                        if "$CAMERA" in text:
-                            text = text.replace("$CAMERA", data.camera)
-
-                        if "$FOCAL_LENGHT" in text:
-                            digit = str(data.cameraFocalLenght)
-                            buffer = digit.split(".", 1)
-                            if buffer:
-                                digit = buffer[0] + "." + buffer[1][:2]
-
-                            text = text.replace("$FOCAL_LENGHT", digit)
-
-                        if "$FOCUS_DISTANCE" in text:
-                            digit = str(data.cameraFocusDistance)
-                            buffer = digit.split(".", 1)
-                            if buffer:
-                                digit = buffer[0] + "." + buffer[1][:2]
-
-                            text = text.replace("$FOCUS_DISTANCE", digit)
-
-                        # special symbol
-                        text = text.replace("\\n", "\n")
-                        text = text.replace("\\r", "\r")
-                        text = text.replace("\\t", "\t")
+                        if request.uiTextCameraDependent:
+                            text = PluginDrawManager.expandCameraText(data, text)
 
                         # paint
                         painter.text2d(
@@ -978,7 +1676,23 @@ class PluginDrawManager(object):
                             request.uiTextBackgroundColor,
                             request.uiTextDynamic
                         )
+
+                        # legacy painter rasterizes text of upcoming frames on prefetch thread
+                        if request.uiTextFrameDependent and hasattr(painter, "prefetchText"):
+                            texts = data.manager.upcomingText(request_key, request)
+                            if request.uiTextCameraDependent:
+                                texts = [PluginDrawManager.expandCameraText(data, item) for item in texts]
+
+                            painter.prefetchText(
+                                point,
+                                texts,
+                                request.uiHorisontalAlignment,
+                                [width, height],
+                                request.uiTextBackgroundColor
+                            )
+
                         painter.endDrawable()
+                        PluginTrace.end("text", request=request_key)
 
                 # draw point
                 elif request.uiType == constants.kPoint:
@@ -987,7 +1701,7 @@ class PluginDrawManager(object):
                     radius = request.uiRadius
                     radius *= scale
                     painter.setPointSize(radius)
-                    for point in request.uiRegionPositionList:
+                    for point in region_position_list:
                         point = OpenMaya.MPoint(x + point.x * scale + alignment_offset_x, y + point.y * scale, 0.0, 1.0)
                         painter.point2d(point)
 
@@ -1001,7 +1715,7 @@ class PluginDrawManager(object):
                     painter.setLineStyle(request.uiLineStyle)
                     radius = request.uiRadius
                     radius *= scale
-                    for point in request.uiRegionPositionList:
+                    for point in region_position_list:
                         point = OpenMaya.MPoint(x + point.x * scale + alignment_offset_x, y + point.y * scale, 0.0, 1.0)
                         painter.circle2d(point, radius, filled=request.uiFilled)
 
@@ -1014,7 +1728,7 @@ class PluginDrawManager(object):
                     painter.setLineWidth(line_width)
                     painter.setLineStyle(request.uiLineStyle)
                     previous_point = None
-                    for point in request.uiRegionPositionList:
+                    for point in region_position_list:
                         point = OpenMaya.MPoint(x + point.x * scale + alignment_offset_x, y + point.y * scale, 0.0, 1.0)
                         if previous_point is None:
                             previous_point = point
@@ -1025,3 +1739,228 @@ class PluginDrawManager(object):
                             previous_point = point
 
                     painter.endDrawable()
+
+    @staticmethod
+    def drawDisplayLists(painter, frame_context, data, level=constants.kDegradeNone):
+
+        """
+        draw requests replaying painter commands recorded on previous draw,
+        commands are recorded again after viewport, camera or request change,
+        text with frame tokens also after frame change, draw time is reported
+        to manager scheduler
+
+        :param painter - painter object (GLPainter or OpenMayaRender.MUIDrawManager)
+        :param frame_context - frame context (OpenMayaRender.MFrameContext)
+        :param data - user data with calculated layout (PluginData)
+        :param level - degradation level (int)
+
+        :return - painter call and text draw count (tuple)
+        """
+
+        start_time = PluginScheduler.now()
+        call_count = 0
+        text_count = 0
+
+        manager = data.manager
+        display_list_key = (manager.index(), data.fingerprint, level)
+        if data.displayListKey != display_list_key:
+            data.displayLists = {}
+            data.frameDisplayLists.clear()
+            data.displayListKey = display_list_key
+
+        tracing = PluginTrace.enabled()
+        requests = PluginDrawManager.requests(data)
+        for request_key in requests:
+            request = requests[request_key]
+            if not request.uiDraw:
+                continue
+
+            if level >= constants.kDegradeSkipLowPriority and request.uiPriority == constants.kPriorityLow:
+                continue
+
+            if tracing:
+                PluginTrace.begin("paint", request=request_key)
+
+            cached = data.displayLists.get(request_key)
+
+            key = request.version
+            if request.uiTextTimeDependent:
+                # reuse text of previous frame while over draw budget
+                if level >= constants.kDegradeReuseText and cached is not None and cached[0][0] == key:
+                    cached[1].replay(painter)
+                    call_count += len(cached[1])
+                    text_count += cached[1].textCount()
+                    if tracing:
+                        PluginTrace.end("paint", request=request_key, replayed=True)
+
+                    continue
+
+                key = (request.version, PluginDrawManager.requestText(data, request_key, request)[0])
+
+            replayed = cached is not None and cached[0] == key
+            if not replayed and request.uiTextTimeDependent:
+                # frame revisited by looped playback or scrubbing
+                display_list = data.frameDisplayLists.get((request_key, key))
+                if display_list is not None:
+                    cached = (key, display_list)
+                    data.displayLists[request_key] = cached
+                    replayed = True
+
+            if replayed:
+                display_list = cached[1]
+                display_list.replay(painter)
+
+            else:
+                display_list = PluginDisplayList(painter)
+                PluginDrawManager.draw(display_list, frame_context, data, [request_key], level)
+                display_list.detach()
+                data.displayLists[request_key] = (key, display_list)
+                if request.uiTextTimeDependent:
+                    data.frameDisplayLists.set((request_key, key), display_list)
+
+            call_count += len(display_list)
+            text_count += display_list.textCount()
+            if tracing:
+                PluginTrace.end("paint", request=request_key, replayed=replayed)
+
+        manager.scheduler().update(PluginScheduler.now() - start_time)
+
+        return call_count, text_count
+
+    @staticmethod
+    def expandText(request, text, frame, animation_start, animation_end):
+
+        """
+        expand scene, date and frame text tokens
+
+        :param request - draw request (PluginDrawRequest)
+        :param text - text with tokens (str)
+        :param frame - current frame (float)
+        :param animation_start - playback range start (float)
+        :param animation_end - playback range end (float)
+
+        :return - expanded text (str)
+        """
+
+        if not text:
+            return ""
+
+        # information about animation range
+        if "$FRAME_AST" in text:
+            text = text.replace("$FRAME_AST", "%03d" % animation_start)
+
+        if "$FRAME_AET" in text:
+            text = text.replace("$FRAME_AET", "%03d" % animation_end)
+
+        if "$FRAME_COUNT" in text:
+            text = text.replace("$FRAME_COUNT", "%03d" % ((animation_end - animation_start) + 1))
+
+        if "$FRAME_REAL" in text:
+            text = text.replace("$FRAME_REAL", "%03d" % frame)
+
+        if "$FRAME" in text:
+            text = text.replace("$FRAME", "%03d" % ((frame - animation_start) + 1))
+
+        # Information about scene
+        if "$FILE_SHORT" in text:
+            text = text.replace("$FILE_SHORT", request.file.rsplit("/", 1)[-1].split(".", 1)[0])
+
+        if "$FILE" in text:
+            text = text.replace("$FILE", request.file)
+
+        # information about creation date
+        if "$YEAR" in text:
+            text = text.replace("$YEAR", request.year)
+
+        if "$MONTH" in text:
+            text = text.replace("$MONTH", request.month)
+
+        if "$DAY" in text:
+            text = text.replace("$DAY", request.day)
+
+        if "$HOUR" in text:
+            text = text.replace("$HOUR", request.hour)
+
+        if "$MINUTE" in text:
+            text = text.replace("$MINUTE", request.minute)
+
+        # special symbol
+        text = text.replace("\\n", "\n")
+        text = text.replace("\\r", "\r")
+        text = text.replace("\\t", "\t")
+
+        return text
+
+    @staticmethod
+    def expandCameraText(data, text):
+
+        """
+        expand camera text tokens
+
+        :param data - user data with drawing camera values (PluginData)
+        :param text - text with tokens (str)
+
+        :return - expanded text (str)
+        """
+
+        # information about camera
+        if "$CAMERA" in text:
+            text = text.replace("$CAMERA", data.camera)
+
+        if "$FOCAL_LENGHT" in text:
+            digit = str(data.cameraFocalLenght)
+            buffer = digit.split(".", 1)
+            if buffer:
+                digit = buffer[0] + "." + buffer[1][:2]
+
+            text = text.replace("$FOCAL_LENGHT", digit)
+
+        if "$FOCUS_DISTANCE" in text:
+            digit = str(data.cameraFocusDistance)
+            buffer = digit.split(".", 1)
+            if buffer:
+                digit = buffer[0] + "." + buffer[1][:2]
+
+            text = text.replace("$FOCUS_DISTANCE", digit)
+
+        return text
+
+    @staticmethod
+    def hasCameraTokens(text):
+
+        """
+        text contains tokens changing with drawing camera
+
+        :param text - text with tokens (str)
+
+        :return - text is camera dependent (bool)
+        """
+
+        for token in constants.kCameraTokens:
+            if token in text:
+                return True
+
+        return False
+
+    @staticmethod
+    def hasFrameTokens(text):
+
+        """
+        text contains tokens changing every frame
+
+        :param text - text with tokens (str)
+
+        :return - text is frame dependent (bool)
+        """
+
+        if not text or "$FRAME" not in text:
+            return False
+
+        for token in constants.kAnimationRangeTokens:
+            text = text.replace(token, "")
+
+        for token in constants.kFrameTokens:
+            if token in text:
+                return True
+
+        return False
@@ -1,7 +1,6 @@
 import maya.api.OpenMaya as OpenMaya
 import maya.api.OpenMayaRender as OpenMayaRender
 from camerahudlib import constants
-from camerahudlib.private.canvas import Canvas
 
 
 class PluginDrawRequest(object):
@@ -13,7 +12,6 @@ class PluginDrawRequest(object):
         "uiColor",
         "uiResolutionGate",
         "uiDrawResolutionGate",
-        "region",
         "uiRegion",
         "uiRegionPosition",
         "uiRegionColor",
@@ -28,10 +26,15 @@ class PluginDrawRequest(object):
         "uiFilled",
         "uiLineStyle",
         "uiLineWidth",
+        "uiPriority",
         "uiPositionList",
-        "uiRegionPositionList",
         "uiText",
         "uiTextDynamic",
+        "uiTextFrameDependent",
+        "uiTextTimeDependent",
+        "uiTextCameraDependent",
+        "uiTextExpanded",
+        "uiTextFrameKey",
         "uiFitToResolutionGate",
         "uiFontStyle",
         "uiFontStyleSize",
@@ -45,6 +48,8 @@ class PluginDrawRequest(object):
         "day",
         "hour",
         "minute",
+        "version",
+        "_frozen",
     )
 
     def __init__(self):
@@ -53,6 +58,9 @@ class PluginDrawRequest(object):
         Initialize camera render ui manager draw request.
         """
 
+        # published request is read only, see freeze
+        object.__setattr__(self, "_frozen", False)
+
         self.uiDraw = False
         self.uiType = constants.kText
         self.uiSize = 1.0
@@ -61,7 +69,6 @@ class PluginDrawRequest(object):
         self.uiResolutionGate = constants.kViewportGate
         self.uiDrawResolutionGate = True
 
-        self.region = Canvas(0, 0, 0, 0)
         self.uiRegion = OpenMaya.MVector(0.0, 0.0, 0.0)
         self.uiRegionPosition = OpenMaya.MPoint(0.0, 0.0, 0.0)
         self.uiRegionColor = OpenMaya.MColor([0.0, 0.0, 0.0])
@@ -79,12 +86,19 @@ class PluginDrawRequest(object):
         self.uiFilled = 1.0
         self.uiLineStyle = constants.kLineSolid
         self.uiLineWidth = 2.0
+        self.uiPriority = constants.kPriorityNormal
 
         self.uiPositionList = []
-        self.uiRegionPositionList = []
 
         self.uiText = "Text"
         self.uiTextDynamic = False
+        self.uiTextFrameDependent = False
+        self.uiTextTimeDependent = False
+        self.uiTextCameraDependent = False
+
+        # text with scene, date and frame tokens expanded for frame key values
+        self.uiTextExpanded = ""
+        self.uiTextFrameKey = None
         self.uiFitToResolutionGate = True
         self.uiFontStyle = None
         self.uiFontStyleSize = OpenMayaRender.MUIDrawManager.kDefaultFontSize
@@ -100,3 +114,55 @@ class PluginDrawRequest(object):
         self.hour = ""
         self.minute = ""
 
+        # draw manager version of last change
+        self.version = 0
+
+    def __setattr__(self, name, value):
+
+        """
+        set attribute of request not published yet
+
+        :param name - attribute name (str)
+        :param value - attribute value (object)
+        """
+
+        if self._frozen:
+            raise AttributeError("published drawing request is read only, edit copy instead")
+
+        object.__setattr__(self, name, value)
+
+    def freeze(self):
+
+        """
+        make request read only, done when request is published to draw
+        """
+
+        object.__setattr__(self, "_frozen", True)
+
+    def isFrozen(self):
+
+        """
+        request is read only
+
+        :return - request is published (bool)
+        """
+
+        return self._frozen
+
+    def copy(self):
+
+        """
+        get writable copy, values are shared until replaced, nested values
+        are always replaced by new objects before they are changed
+
+        :return - writable request copy (PluginDrawRequest)
+        """
+
+        result = PluginDrawRequest.__new__(PluginDrawRequest)
+        object.__setattr__(result, "_frozen", False)
+        for name in PluginDrawRequest.__slots__:
+            if name != "_frozen":
+                object.__setattr__(result, name, getattr(self, name))
+
+        return result
+
@@ -0,0 +1,255 @@
+import os
+import sys
+import json
+import maya.api.OpenMaya as OpenMaya
+import maya.api.OpenMayaRender as OpenMayaRender
+from camerahudlib.private.logger import logger
+from camerahudlib.private.plugin_bundle import PluginBundle
+
+
+class PluginFonts(object):
+
+    # environment variable with font list cache file name
+    kCacheVariable = "CAMERAHUD_FONT_CACHE"
+
+    # font list cache file name, placed in maya application directory
+    kCacheName = "camerahud_fonts.json"
+
+    # cache file format version
+    kCacheVersion = 1
+
+    # system font names and font name to index
+    __fonts__ = None
+    __index__ = {}
+
+    @staticmethod
+    def fontDirectories():
+
+        """
+        get system and user font directories
+
+        :return - font directories (list)
+        """
+
+        home = os.path.expanduser("~")
+        if sys.platform.startswith("win"):
+            return [
+                os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+                os.path.join(os.environ.get("LOCALAPPDATA", home), "Microsoft", "Windows", "Fonts"),
+            ]
+
+        if sys.platform == "darwin":
+            return [
+                "/System/Library/Fonts",
+                "/Library/Fonts",
+                os.path.join(home, "Library", "Fonts"),
+            ]
+
+        return [
+            "/usr/share/fonts",
+            "/usr/local/share/fonts",
+            os.path.join(home, ".fonts"),
+            os.path.join(home, ".local", "share", "fonts"),
+        ]
+
+    @staticmethod
+    def fingerprint():
+
+        """
+        get fingerprint of font directories, modification time of every nested
+        directory changes when font is installed or removed in it, file count
+        of directory tree is kept as well
+
+        :return - font directories fingerprint (list)
+        """
+
+        def walkError(exception_data):
+            logger.error(repr(exception_data))
+            logger.error("can`t read font directory " + str(exception_data.filename))
+
+        result = [OpenMaya.MGlobal.apiVersion()]
+        for directory in PluginFonts.fontDirectories():
+            if not os.path.isdir(directory):
+                continue
+
+            # walk uses scandir where available, flat font directories aren't stat per file
+            file_count = 0
+            for path, directory_names, file_names in os.walk(directory, onerror=walkError):
+                directory_names.sort()
+                file_count += len(file_names)
+
+                try:
+                    result.append([path, os.stat(path).st_mtime])
+
+                except OSError as exception_data:
+                    walkError(exception_data)
+
+            # file count catches changes on shares that don't update directory modification time
+            result.append([directory, file_count])
+
+        return result
+
+    @staticmethod
+    def cacheFile():
+
+        """
+        get font list cache file name
+
+        :return - cache file name (str)
+        """
+
+        filename = os.environ.get(PluginFonts.kCacheVariable)
+        if filename:
+            return filename
+
+        directory = os.environ.get("MAYA_APP_DIR") or os.path.expanduser("~")
+        return os.path.join(directory, PluginFonts.kCacheName)
+
+    @staticmethod
+    def readCache(filename, fingerprint):
+
+        """
+        read cached font list
+
+        :param filename - cache file name (str)
+        :param fingerprint - current font directories fingerprint (list)
+
+        :return - cached font names, None when cache is missing or outdated (list)
+        """
+
+        if not os.path.isfile(filename):
+            return None
+
+        try:
+            obj = open(filename, "r")
+            data = json.load(obj)
+            obj.close()
+
+        except Exception as exception_data:
+            logger.error(repr(exception_data))
+            logger.error("can`t read font cache " + filename)
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != PluginFonts.kCacheVersion:
+            return None
+
+        if data.get("fingerprint") != fingerprint:
+            return None
+
+        fonts = data.get("fonts")
+        if not isinstance(fonts, list) or not fonts:
+            return None
+
+        return fonts
+
+    @staticmethod
+    def writeCache(filename, fingerprint, fonts):
+
+        """
+        write font list cache
+
+        :param filename - cache file name (str)
+        :param fingerprint - font directories fingerprint (list)
+        :param fonts - font names (list)
+        """
+
+        # write next to cache and rename over it, concurrent loads never read missing or partial file
+        temp_filename = "%s.%d.tmp" % (filename, os.getpid())
+        try:
+            directory = os.path.dirname(filename)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            obj = open(temp_filename, "w")
+            try:
+                json.dump({"version": PluginFonts.kCacheVersion, "fingerprint": fingerprint, "fonts": fonts}, obj)
+
+            finally:
+                obj.close()
+
+            PluginBundle.replace(temp_filename, filename)
+
+        except Exception as exception_data:
+            logger.error(repr(exception_data))
+            logger.error("can`t write font cache " + filename)
+            if os.path.isfile(temp_filename):
+                os.remove(temp_filename)
+
+    @staticmethod
+    def fontList():
+
+        """
+        get system font names, read from cache file while font directories
+        don't change, enumerated by maya otherwise
+
+        :return - font names (list)
+        """
+
+        if PluginFonts.__fonts__ is not None:
+            return PluginFonts.__fonts__
+
+        filename = PluginFonts.cacheFile()
+        fingerprint = PluginFonts.fingerprint()
+
+        # json has no tuples, compare in its form
+        fingerprint = json.loads(json.dumps(fingerprint))
+
+        fonts = PluginFonts.readCache(filename, fingerprint)
+        if fonts is None:
+            try:
+                fonts = list(OpenMayaRender.MUIDrawManager.getFontList())
+
+            except Exception as exception_data:
+                fonts = []
+                logger.error(repr(exception_data))
+                logger.error("can`t read font list")
+
+            if fonts:
+                PluginFonts.writeCache(filename, fingerprint, fonts)
+
+        PluginFonts.setFontList(fonts)
+        return PluginFonts.__fonts__
+
+    @staticmethod
+    def setFontList(fonts):
+
+        """
+        set font names and rebuild font index
+
+        :param fonts - font names (list)
+        """
+
+        PluginFonts.__fonts__ = list(fonts)
+        PluginFonts.__index__ = {}
+        for index, name in enumerate(PluginFonts.__fonts__):
+            PluginFonts.__index__.setdefault(name, index)
+
+    @staticmethod
+    def index(name):
+
+        """
+        get font index
+
+        :param name - font name (str)
+
+        :return - font index, -1 when font is unknown (int)
+        """
+
+        return PluginFonts.__index__.get(name, -1)
+
+    @staticmethod
+    def name(index):
+
+        """
+        get font name
+
+        :param index - font index (int)
+
+        :return - font name, None when index is out of range (str)
+        """
+
+        fonts = PluginFonts.__fonts__
+        if fonts is None or index < 0 or index >= len(fonts):
+            return None
+
+        return fonts[index]
@@ -0,0 +1,116 @@
+class PluginGates(object):
+
+    # gates shared by nodes drawn through the same camera and viewport
+    __cache__ = {}
+
+    # maximum cached gate count
+    kCacheSize = 64
+
+    # gate canvases of PluginData
+    kCanvasNames = (
+        "port",
+        "viewport",
+        "film",
+        "image",
+        "render",
+        "safeAction",
+        "safeTitle",
+        "renderSafeTitle",
+        "renderSafeAction",
+    )
+
+    # gate values of PluginData
+    kValueNames = (
+        "resolutionWidth",
+        "resolutionHeight",
+        "width",
+        "height",
+        "camera",
+        "cameraFocalLenght",
+        "cameraFocusDistance",
+        "fit",
+        "pixelScale",
+        "pixelResolutionScale",
+        "scale",
+    )
+
+    @staticmethod
+    def prepare(data, camera_path_name, camera, viewport_x, viewport_y, viewport_width, viewport_height):
+
+        """
+        apply resolution gates to data, gates are calculated once per camera,
+        viewport and resolution and reused by every node
+
+        :param data - user data with assigned manager (PluginData)
+        :param camera_path_name - camera node full path name (str)
+        :param camera - camera parameters (PluginCamera)
+        :param viewport_x - viewport center x coordinate (float)
+        :param viewport_y - viewport center y coordinate (float)
+        :param viewport_width - viewport width (float)
+        :param viewport_height - viewport height (float)
+
+        :return - gates were taken from cache (bool)
+        """
+
+        from camerahudlib.private.plugin_draw_manager import PluginDrawManager
+
+        key = (
+            camera_path_name,
+            viewport_x,
+            viewport_y,
+            viewport_width,
+            viewport_height,
+            data.manager.width(),
+            data.manager.height(),
+            camera.fingerprint()
+        )
+
+        gates = PluginGates.__cache__.get(key)
+        if gates is not None:
+            gates.apply(data)
+            return True
+
+        PluginDrawManager.prepareGates(data, camera, viewport_x, viewport_y, viewport_width, viewport_height)
+
+        if len(PluginGates.__cache__) >= PluginGates.kCacheSize:
+            PluginGates.__cache__.clear()
+
+        PluginGates.__cache__[key] = PluginGates(data)
+        return False
+
+    @staticmethod
+    def clear():
+
+        """
+        remove cached gates
+        """
+
+        PluginGates.__cache__.clear()
+
+    def __init__(self, data):
+
+        """
+        initialize gates from calculated data
+
+        :param data - user data with calculated gates (PluginData)
+        """
+
+        self._values = tuple(getattr(data, name) for name in PluginGates.kValueNames)
+        self._canvases = []
+        for name in PluginGates.kCanvasNames:
+            canvas = getattr(data, name)
+            self._canvases.append((canvas.x(), canvas.y(), canvas.width(), canvas.height()))
+
+    def apply(self, data):
+
+        """
+        apply gates to data
+
+        :param data - target user data (PluginData)
+        """
+
+        for name, value in zip(PluginGates.kValueNames, self._values):
+            setattr(data, name, value)
+
+        for name, rect in zip(PluginGates.kCanvasNames, self._canvases):
+            getattr(data, name).apply(*rect)
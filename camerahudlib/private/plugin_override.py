@@ -1,7 +1,13 @@
+import maya.api.OpenMaya as OpenMaya
 import maya.api.OpenMayaRender as OpenMayaRender
 from camerahudlib import constants
-from camerahudlib.private.logger import logger
+from camerahudlib.private.logger import frame_logger
+from camerahudlib.private.plugin_data import PluginData
 from camerahudlib.private.plugin_draw_manager import PluginDrawManager
+from camerahudlib.private.plugin_profiler import PluginProfiler
+from camerahudlib.private.plugin_scheduler import PluginScheduler
+from camerahudlib.private.plugin_stats import PluginStats
+from camerahudlib.private.plugin_trace import PluginTrace
 
 
 class PluginOverride(OpenMayaRender.MPxDrawOverride):
@@ -36,6 +42,9 @@ class PluginOverride(OpenMayaRender.MPxDrawOverride):
 
         OpenMayaRender.MPxDrawOverride.__init__(self, obj, PluginOverride.draw)
 
+        # drawn node instance
+        self._node = OpenMaya.MFnDependencyNode(obj).userNode()
+
     def supportedDrawAPIs(self):
 
         """
@@ -99,11 +108,46 @@ class PluginOverride(OpenMayaRender.MPxDrawOverride):
         :param frame_context - frame context (OpenMayaRender.MFrameContext)
         :param previous_data - user data (OpenMayaRender.MUserData)
 
-        :return -
+        :return - prepared user data (PluginData)
         """
 
-        # manager prepare for draw
-        data = PluginDrawManager.prepareForDraw(path, camera_path, frame_context, previous_data, constants.kViewport)
+        manager = None
+        if self._node is not None:
+            manager = self._node.drawManager()
+
+        if manager is None:
+            return None
+
+        # profiler and trace phases are closed even when prepare raises
+        PluginProfiler.begin()
+        try:
+            start_time = PluginScheduler.now()
+            PluginTrace.begin("prepareForDraw")
+            data = None
+            try:
+                # budget isn't part of fingerprint, reused data still applies changed budget
+                PluginDrawManager.updateBudget(manager, path.node())
+
+                # previous data is still valid when nothing it depends on changed
+                fingerprint = PluginDrawManager.inputFingerprint(manager, camera_path, frame_context, path.node())
+
+                if isinstance(previous_data, PluginData) and previous_data.inputFingerprint == fingerprint:
+                    data = previous_data
+
+                else:
+                    # manager prepare for draw
+                    data = PluginDrawManager.prepareForDraw(path, camera_path, frame_context, previous_data, constants.kViewport, manager)
+                    if data is not None:
+                        data.inputFingerprint = fingerprint
+
+            finally:
+                PluginTrace.end("prepareForDraw", reused=data is previous_data)
+
+            self._node.stats().add(PluginStats.kPrepareTime, PluginScheduler.now() - start_time)
+
+        finally:
+            PluginProfiler.end()
+
         return data
 
     def addUIDrawables(self, path, painter, frame_context, data):
@@ -118,7 +162,24 @@ class PluginOverride(OpenMayaRender.MPxDrawOverride):
         """
 
         if data is not None:
-            PluginDrawManager.draw(painter, frame_context, data)
+            PluginTrace.frame(path.fullPathName())
+            PluginProfiler.begin()
+            try:
+                start_time = PluginScheduler.now()
+                PluginTrace.begin("draw")
+                try:
+                    counts = PluginDrawManager.draw(painter, frame_context, data)
+
+                finally:
+                    PluginTrace.end("draw")
+
+                if self._node is not None:
+                    self._node.stats().addDraw(PluginScheduler.now() - start_time, counts)
+
+            finally:
+                PluginProfiler.end()
+
+            PluginProfiler.draw()
 
         else:
-            logger.warning("drawing data not provided")
+            frame_logger.warning("drawing data not provided")
@@ -0,0 +1,186 @@
+import os
+import time
+import threading
+from camerahudlib.private.logger import logger
+
+try:
+    import queue
+
+except ImportError:
+    import Queue as queue
+
+
+class PluginPrefetch(object):
+
+    # environment variable with prefetched frame count, 0 disables prefetch
+    kFramesVariable = "CAMERAHUD_PREFETCH_FRAMES"
+
+    # frames prefetched ahead of drawn frame
+    kFrames = 8
+
+    # queued job count, jobs are dropped while queue is full so draw never waits
+    kQueueSize = 256
+
+    # worker thread, job queue and keys of queued jobs
+    __thread__ = None
+    __queue__ = None
+    __pending__ = set()
+    __lock__ = threading.Lock()
+
+    @staticmethod
+    def frameCount():
+
+        """
+        get prefetched frame count, read from environment when set
+
+        :return - frame count (int)
+        """
+
+        value = os.environ.get(PluginPrefetch.kFramesVariable)
+        if value:
+            try:
+                return max(int(value), 0)
+
+            except ValueError as exception_data:
+                logger.error(repr(exception_data))
+                logger.error("can`t read " + PluginPrefetch.kFramesVariable)
+
+        return PluginPrefetch.kFrames
+
+    @staticmethod
+    def nextFrames(frame, previous_frame, animation_start, animation_end):
+
+        """
+        get frames played after current frame, playback direction and step are taken
+        from previous frame, frames after playback range end wrap to its start
+
+        :param frame - current frame (float)
+        :param previous_frame - previously expanded frame, None if unknown (float)
+        :param animation_start - playback range start (float)
+        :param animation_end - playback range end (float)
+
+        :return - upcoming frames, empty when frame doesn't move forward (tuple)
+        """
+
+        if previous_frame is None:
+            return ()
+
+        step = frame - previous_frame
+        if step <= 0.0:
+            return ()
+
+        result = []
+        next_frame = frame
+        for _ in range(PluginPrefetch.frameCount()):
+            next_frame += step
+            if animation_end > animation_start and next_frame > animation_end:
+                next_frame = animation_start + (next_frame - animation_end - step)
+
+            if next_frame == frame:
+                break
+
+            result.append(next_frame)
+
+        return tuple(result)
+
+    @staticmethod
+    def yieldThread():
+
+        """
+        let waiting threads run, called by jobs between work items so python
+        draw thread doesn't wait whole interpreter switch interval for the lock
+        """
+
+        time.sleep(0)
+
+    @staticmethod
+    def submit(key, function, *args):
+
+        """
+        queue job on worker thread, job with same key waiting in queue isn't queued again
+
+        :param key - job key (tuple)
+        :param function - job function (function)
+        :param args - job function arguments (list)
+
+        :return - job was queued (bool)
+        """
+
+        with PluginPrefetch.__lock__:
+            if key in PluginPrefetch.__pending__:
+                return False
+
+            if PluginPrefetch.__thread__ is None:
+                PluginPrefetch.__queue__ = queue.Queue(PluginPrefetch.kQueueSize)
+                PluginPrefetch.__thread__ = threading.Thread(target=PluginPrefetch.run, name="CameraHUD prefetch")
+                PluginPrefetch.__thread__.daemon = True
+                PluginPrefetch.__thread__.start()
+
+            try:
+                PluginPrefetch.__queue__.put_nowait((key, function, args))
+
+            except queue.Full:
+                return False
+
+            PluginPrefetch.__pending__.add(key)
+            return True
+
+    @staticmethod
+    def run():
+
+        """
+        worker thread loop, runs queued jobs until None is queued
+        """
+
+        job_queue = PluginPrefetch.__queue__
+        while True:
+            job = job_queue.get()
+            if job is None:
+                job_queue.task_done()
+                break
+
+            key, function, args = job
+            try:
+                function(*args)
+
+            except Exception as exception_data:
+                logger.error(repr(exception_data))
+                logger.error("can`t prefetch " + repr(key))
+
+            with PluginPrefetch.__lock__:
+                PluginPrefetch.__pending__.discard(key)
+
+            job_queue.task_done()
+
+    @staticmethod
+    def wait():
+
+        """
+        wait until queued jobs are done
+        """
+
+        job_queue = PluginPrefetch.__queue__
+        if job_queue is not None:
+            job_queue.join()
+
+    @staticmethod
+    def stop():
+
+        """
+        finish queued jobs and stop worker thread
+        """
+
+        with PluginPrefetch.__lock__:
+            thread = PluginPrefetch.__thread__
+            job_queue = PluginPrefetch.__queue__
+            PluginPrefetch.__thread__ = None
+            PluginPrefetch.__queue__ = None
+
+        if thread is None:
+            return None
+
+        job_queue.put(None)
+        thread.join()
+
+        with PluginPrefetch.__lock__:
+            PluginPrefetch.__pending__.clear()
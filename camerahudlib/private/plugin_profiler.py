@@ -0,0 +1,241 @@
+import os
+import io
+from camerahudlib.private.logger import logger
+
+
+class PluginProfiler(object):
+
+    # profiled draw count used when not provided
+    kDefaultDraws = 100
+
+    # reported function and allocation site count
+    kReportLines = 40
+
+    # profiler is armed, checked before every profiled call
+    __enabled__ = False
+
+    # active profiler
+    __profile__ = None
+
+    # allocation sites reported by tracemalloc
+    kAllocationFilter = "*camerahudlib*"
+
+    # memory snapshots taken before first and after last profiled draw
+    __snapshot__ = None
+    __lastSnapshot__ = None
+
+    # report file name and remaining draw count
+    __filename__ = ""
+    __draws__ = 0
+
+    # tracemalloc was started by profiler
+    __tracemalloc__ = False
+
+    @staticmethod
+    def tracemalloc():
+
+        """
+        get tracemalloc module, not available in python 2
+
+        :return - tracemalloc module or None (module)
+        """
+
+        try:
+            import tracemalloc
+
+        except ImportError:
+            tracemalloc = None
+
+        return tracemalloc
+
+    @staticmethod
+    def snapshot():
+
+        """
+        take memory snapshot of plugin allocations, profiler own allocations are skipped
+
+        :return - filtered snapshot, None if tracemalloc isn't tracing (tracemalloc.Snapshot)
+        """
+
+        tracemalloc = PluginProfiler.tracemalloc()
+        if tracemalloc is None or not tracemalloc.is_tracing():
+            return None
+
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(True, PluginProfiler.kAllocationFilter),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    @staticmethod
+    def start(filename, draw_count=None):
+
+        """
+        arm profiler for next draws, previous report is written first
+
+        :param filename - report file name (str)
+        :param draw_count - profiled draw count, report is written after it (int)
+        """
+
+        if PluginProfiler.__enabled__:
+            PluginProfiler.stop()
+
+        if draw_count is None or draw_count <= 0:
+            draw_count = PluginProfiler.kDefaultDraws
+
+        # profiler modules are imported on first use, plugin load doesn't pay for them
+        import cProfile
+        tracemalloc = PluginProfiler.tracemalloc()
+
+        PluginProfiler.__filename__ = filename
+        PluginProfiler.__draws__ = draw_count
+        PluginProfiler.__profile__ = cProfile.Profile()
+
+        # snapshots are taken around profiled draws, allocations before first draw aren't reported
+        PluginProfiler.__snapshot__ = None
+        PluginProfiler.__lastSnapshot__ = None
+        PluginProfiler.__tracemalloc__ = False
+        if tracemalloc is not None and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            PluginProfiler.__tracemalloc__ = True
+
+        PluginProfiler.__enabled__ = True
+        logger.warning("profiling next %d draws to %s" % (draw_count, filename))
+
+    @staticmethod
+    def stop():
+
+        """
+        disarm profiler and write report
+
+        :return - written file name, empty if nothing was written (str)
+        """
+
+        if not PluginProfiler.__enabled__:
+            return ""
+
+        import pstats
+        tracemalloc = PluginProfiler.tracemalloc()
+
+        PluginProfiler.__enabled__ = False
+        filename = PluginProfiler.__filename__
+        profile = PluginProfiler.__profile__
+        PluginProfiler.__profile__ = None
+
+        # memory difference between first and last profiled draw
+        allocation_lines = []
+        if PluginProfiler.__snapshot__ is not None:
+            snapshot = PluginProfiler.__lastSnapshot__
+            if snapshot is None:
+                snapshot = PluginProfiler.snapshot()
+
+            for stat in snapshot.compare_to(PluginProfiler.__snapshot__, "lineno")[:PluginProfiler.kReportLines]:
+                allocation_lines.append(str(stat))
+
+        if PluginProfiler.__tracemalloc__:
+            tracemalloc.stop()
+
+        PluginProfiler.__snapshot__ = None
+        PluginProfiler.__lastSnapshot__ = None
+        PluginProfiler.__tracemalloc__ = False
+
+        # pstats can't read profile without calls, report is written with allocation part only
+        captured = bool(profile.getstats())
+        if tracemalloc is None:
+            allocation_message = "tracemalloc is not available"
+
+        elif not captured:
+            allocation_message = "no draws were profiled"
+
+        else:
+            allocation_message = "no plugin allocations"
+
+        try:
+            stream = io.StringIO() if str is not bytes else io.BytesIO()
+            if captured:
+                stats = pstats.Stats(profile, stream=stream)
+                stats.sort_stats("cumulative").print_stats(PluginProfiler.kReportLines)
+                stats.sort_stats("tottime").print_stats(PluginProfiler.kReportLines)
+
+            else:
+                stream.write("no draws were profiled\n")
+
+            directory = os.path.dirname(filename)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            obj = open(filename, "w")
+            obj.write(stream.getvalue())
+            obj.write("\ntop allocation sites\n\n")
+            if allocation_lines:
+                obj.write("\n".join(allocation_lines))
+
+            else:
+                obj.write(allocation_message)
+
+            obj.write("\n")
+            obj.close()
+
+            # raw profile for snakeviz or pstats
+            if captured:
+                profile.dump_stats(filename + ".prof")
+
+        except Exception as exception_data:
+            logger.error(repr(exception_data))
+            logger.error("can`t write profile " + filename)
+            return ""
+
+        if not captured:
+            logger.warning("no draws were profiled, profile written to " + filename + " without call statistics")
+            return filename
+
+        logger.warning("profile written to " + filename)
+        return filename
+
+    @staticmethod
+    def enabled():
+
+        """
+        profiler is armed
+
+        :return - profiler is armed (bool)
+        """
+
+        return PluginProfiler.__enabled__
+
+    @staticmethod
+    def begin():
+
+        """
+        resume profiling of profiled call, first call takes memory snapshot
+        """
+
+        if PluginProfiler.__enabled__:
+            if PluginProfiler.__snapshot__ is None:
+                PluginProfiler.__snapshot__ = PluginProfiler.snapshot()
+
+            PluginProfiler.__profile__.enable()
+
+    @staticmethod
+    def end():
+
+        """
+        pause profiling after profiled call
+        """
+
+        if PluginProfiler.__enabled__:
+            PluginProfiler.__profile__.disable()
+
+    @staticmethod
+    def draw():
+
+        """
+        account profiled draw, report is written after requested draw count
+        """
+
+        if not PluginProfiler.__enabled__:
+            return None
+
+        PluginProfiler.__draws__ -= 1
+        if PluginProfiler.__draws__ <= 0:
+            PluginProfiler.__lastSnapshot__ = PluginProfiler.snapshot()
+            PluginProfiler.stop()
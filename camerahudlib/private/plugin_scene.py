@@ -0,0 +1,162 @@
+import maya.api.OpenMaya as OpenMaya
+import maya.api.OpenMayaAnim as OpenMayaAnim
+from camerahudlib import constants
+from camerahudlib.private.logger import logger
+
+
+class PluginScene(object):
+
+    # time node driving node time input
+    kTimeNode = "time1"
+
+    # events sent after playback range change
+    kRangeEvents = ("playbackRangeChanged", "playbackRangeSliderChanged")
+
+    # scene messages sent after scene name change
+    kSceneMessages = (
+        OpenMaya.MSceneMessage.kAfterNew,
+        OpenMaya.MSceneMessage.kAfterOpen,
+        OpenMaya.MSceneMessage.kAfterSave,
+    )
+
+    # registered event and scene callbacks
+    __callbacks__ = []
+
+    @staticmethod
+    def sceneName():
+
+        """
+        get current scene file name
+
+        :return - scene file name, empty for unsaved scene (str)
+        """
+
+        if OpenMaya.MFileIO.isNewFile():
+            return ""
+
+        return OpenMaya.MFileIO.currentFile()
+
+    @staticmethod
+    def nodes():
+
+        """
+        get CameraHUD nodes of current scene
+
+        :return - CameraHUD nodes (list)
+        """
+
+        result = []
+        iterator = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kPluginLocatorNode)
+        while not iterator.isDone():
+            node = iterator.thisNode()
+            if OpenMaya.MFnDependencyNode(node).typeId == constants.kId:
+                result.append(node)
+
+            iterator.next()
+
+        return result
+
+    @staticmethod
+    def update(node=None):
+
+        """
+        write scene name and playback range into node inputs
+
+        :param node - updated node, all CameraHUD nodes if None (OpenMaya.MObject)
+        """
+
+        from camerahudlib.private.plugin import Plugin
+
+        scene_name = PluginScene.sceneName()
+        animation_start = OpenMayaAnim.MAnimControl.animationStartTime()
+        animation_end = OpenMayaAnim.MAnimControl.animationEndTime()
+
+        for item in ([node] if node is not None else PluginScene.nodes()):
+            try:
+                plug = OpenMaya.MPlug(item, Plugin.aSceneName)
+                if plug.asString() != scene_name:
+                    plug.setString(scene_name)
+
+                OpenMaya.MPlug(item, Plugin.aAnimationStart).setMTime(animation_start)
+                OpenMaya.MPlug(item, Plugin.aAnimationEnd).setMTime(animation_end)
+
+            except Exception as exception_data:
+                logger.error(repr(exception_data))
+                logger.error("can`t update scene inputs")
+
+    @staticmethod
+    def attach(node):
+
+        """
+        connect node time input to scene time and write scene inputs
+
+        :param node - CameraHUD node (OpenMaya.MObject)
+        """
+
+        from camerahudlib.private.plugin import Plugin
+
+        try:
+            time_plug = OpenMaya.MPlug(node, Plugin.aTime)
+            if not time_plug.isDestination:
+                selection = OpenMaya.MSelectionList()
+                selection.add(PluginScene.kTimeNode)
+                source_plug = OpenMaya.MFnDependencyNode(selection.getDependNode(0)).findPlug("outTime", False)
+
+                modifier = OpenMaya.MDGModifier()
+                modifier.connect(source_plug, time_plug)
+                modifier.doIt()
+
+        except Exception as exception_data:
+            logger.error(repr(exception_data))
+            logger.error("can`t connect time input")
+
+        PluginScene.update(node)
+
+    @staticmethod
+    def nodeAdded(node, client_data):
+
+        """
+        CameraHUD node added callback, node is in graph already, called again on redo
+        of its creation while undo deletes node with its connection
+
+        :param node - added node (OpenMaya.MObject)
+        :param client_data - unused client data
+        """
+
+        PluginScene.attach(node)
+
+    @staticmethod
+    def changed(*args):
+
+        """
+        playback range or scene name changed callback
+        """
+
+        PluginScene.update()
+
+    @staticmethod
+    def initializeCallbacks():
+
+        """
+        connect time of added nodes, update node inputs after playback range or scene name change
+        """
+
+        PluginScene.__callbacks__.append(OpenMaya.MDGMessage.addNodeAddedCallback(PluginScene.nodeAdded, constants.kName))
+
+        for event in PluginScene.kRangeEvents:
+            PluginScene.__callbacks__.append(OpenMaya.MEventMessage.addEventCallback(event, PluginScene.changed))
+
+        for message in PluginScene.kSceneMessages:
+            PluginScene.__callbacks__.append(OpenMaya.MSceneMessage.addCallback(message, PluginScene.changed))
+
+    @staticmethod
+    def uninitializeCallbacks():
+
+        """
+        remove event and scene callbacks
+        """
+
+        for callback in PluginScene.__callbacks__:
+            OpenMaya.MMessage.removeCallback(callback)
+
+        del PluginScene.__callbacks__[:]
@@ -0,0 +1,177 @@
+import os
+import time
+from camerahudlib import constants
+from camerahudlib.private.logger import logger, frame_logger
+
+
+class PluginScheduler(object):
+
+    # environment variable with global draw budget in milliseconds
+    kBudgetVariable = "CAMERAHUD_DRAW_BUDGET"
+
+    # consecutive frames over budget before next degradation level
+    kDegradeFrames = 2
+
+    # consecutive frames under half budget before previous degradation level
+    kRecoverFrames = 24
+
+    # global draw budget in milliseconds used by nodes without own budget, 0 disables
+    __budget__ = None
+
+    @staticmethod
+    def now():
+
+        """
+        get high resolution time, python 2 falls back to wall clock
+
+        :return - time in milliseconds (float)
+        """
+
+        if hasattr(time, "perf_counter"):
+            return time.perf_counter() * 1000.0
+
+        return time.time() * 1000.0
+
+    @staticmethod
+    def globalBudget():
+
+        """
+        get global draw budget, read from environment on first use
+
+        :return - draw budget in milliseconds (float)
+        """
+
+        if PluginScheduler.__budget__ is None:
+            budget = 0.0
+            try:
+                budget = max(float(os.environ.get(PluginScheduler.kBudgetVariable, 0.0)), 0.0)
+
+            except ValueError as exception_data:
+                logger.error(repr(exception_data))
+                logger.error("can`t read " + PluginScheduler.kBudgetVariable)
+
+            PluginScheduler.__budget__ = budget
+
+        return PluginScheduler.__budget__
+
+    @staticmethod
+    def setGlobalBudget(budget):
+
+        """
+        set global draw budget
+
+        :param budget - draw budget in milliseconds, 0 disables (float)
+        """
+
+        PluginScheduler.__budget__ = max(float(budget), 0.0)
+
+    def __init__(self, name=""):
+
+        """
+        initialize scheduler
+
+        :param name - reported owner name (str)
+        """
+
+        self._name = name
+        self._budget = 0.0
+        self._level = constants.kDegradeNone
+        self._over_budget_frames = 0
+        self._under_budget_frames = 0
+
+        # instrumentation
+        self.lastTime = 0.0
+        self.degradedFrames = 0
+        self.levelChanges = 0
+
+    def budget(self):
+
+        """
+        get effective draw budget, own budget or global budget
+
+        :return - draw budget in milliseconds, 0 when disabled (float)
+        """
+
+        if self._budget > 0.0:
+            return self._budget
+
+        return PluginScheduler.globalBudget()
+
+    def setBudget(self, budget):
+
+        """
+        set own draw budget
+
+        :param budget - draw budget in milliseconds, 0 uses global budget (float)
+        """
+
+        self._budget = max(float(budget), 0.0)
+
+    def level(self):
+
+        """
+        get active degradation level
+
+        :return - degradation level (int)
+        """
+
+        return self._level
+
+    def update(self, elapsed):
+
+        """
+        account draw time and choose degradation level for next frame
+
+        :param elapsed - draw time in milliseconds (float)
+        """
+
+        self.lastTime = elapsed
+        if self._level != constants.kDegradeNone:
+            self.degradedFrames += 1
+
+        budget = self.budget()
+        if budget <= 0.0:
+            if self._level != constants.kDegradeNone:
+                self.setLevel(constants.kDegradeNone)
+
+            return None
+
+        if elapsed > budget:
+            self._under_budget_frames = 0
+            self._over_budget_frames += 1
+            if self._over_budget_frames >= PluginScheduler.kDegradeFrames and self._level < constants.kDegradeSkipLowPriority:
+                self._over_budget_frames = 0
+                self.setLevel(self._level + 1)
+
+        elif elapsed < budget * 0.5:
+            self._over_budget_frames = 0
+            self._under_budget_frames += 1
+            if self._under_budget_frames >= PluginScheduler.kRecoverFrames and self._level > constants.kDegradeNone:
+                self._under_budget_frames = 0
+                self.setLevel(self._level - 1)
+
+        else:
+            self._over_budget_frames = 0
+            self._under_budget_frames = 0
+
+    def setLevel(self, level):
+
+        """
+        set degradation level and report change
+
+        :param level - degradation level (int)
+        """
+
+        if level > self._level:
+            frame_logger.warning(
+                "%s draw time %.2fms exceeds budget %.2fms, degradation level %d" % (self._name, self.lastTime, self.budget(), level),
+                "%s degraded %d" % (self._name, level)
+            )
+
+        else:
+            frame_logger.info("%s draw time recovered, degradation level %d" % (self._name, level), "%s recovered %d" % (self._name, level))
+
+        self._level = level
+        self._over_budget_frames = 0
+        self._under_budget_frames = 0
+        self.levelChanges += 1
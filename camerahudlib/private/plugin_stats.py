@@ -0,0 +1,119 @@
+import collections
+
+
+class PluginStats(object):
+
+    # averaged sample count
+    kWindow = 30
+
+    # measured values, times are in milliseconds
+    kComputeTime = "computeTime"
+    kPrepareTime = "prepareTime"
+    kDrawTime = "drawTime"
+    kPainterCalls = "painterCalls"
+    kTextCommands = "textCommands"
+    kTextRasterizations = "textRasterizations"
+
+    kNames = (
+        kComputeTime,
+        kPrepareTime,
+        kDrawTime,
+        kPainterCalls,
+        kTextCommands,
+        kTextRasterizations,
+    )
+
+    def __init__(self):
+
+        """
+        initialize rolling averages
+        """
+
+        self._samples = dict((name, collections.deque(maxlen=PluginStats.kWindow)) for name in PluginStats.kNames)
+        self._sums = dict((name, 0.0) for name in PluginStats.kNames)
+
+    def add(self, name, value):
+
+        """
+        add sample, oldest sample is dropped when window is full
+
+        :param name - measured value name (str)
+        :param value - sample value (float)
+        """
+
+        samples = self._samples[name]
+        if len(samples) == samples.maxlen:
+            self._sums[name] -= samples[0]
+
+        samples.append(value)
+        self._sums[name] += value
+
+    def addDraw(self, elapsed, counts=None, rasterizations=None):
+
+        """
+        add draw samples
+
+        :param elapsed - draw time in milliseconds (float)
+        :param counts - painter call and text command count, not counted draw if None (tuple)
+        :param rasterizations - text rasterized by painter, None when painter doesn't rasterize text (int)
+        """
+
+        self.add(PluginStats.kDrawTime, elapsed)
+        if counts is not None:
+            self.add(PluginStats.kPainterCalls, counts[0])
+            self.add(PluginStats.kTextCommands, counts[1])
+
+        if rasterizations is not None:
+            self.add(PluginStats.kTextRasterizations, rasterizations)
+
+    def average(self, name):
+
+        """
+        get rolling average
+
+        :param name - measured value name (str)
+
+        :return - average of kept samples, 0 without samples (float)
+        """
+
+        samples = self._samples[name]
+        if not samples:
+            return 0.0
+
+        return self._sums[name] / len(samples)
+
+    def last(self, name):
+
+        """
+        get last sample
+
+        :param name - measured value name (str)
+
+        :return - last sample, 0 without samples (float)
+        """
+
+        samples = self._samples[name]
+        if not samples:
+            return 0.0
+
+        return samples[-1]
+
+    def reset(self):
+
+        """
+        drop all samples
+        """
+
+        for name in PluginStats.kNames:
+            self._samples[name].clear()
+            self._sums[name] = 0.0
+
+    def asDict(self):
+
+        """
+        get rolling averages
+
+        :return - average by measured value name (dict)
+        """
+
+        return dict((name, self.average(name)) for name in PluginStats.kNames)
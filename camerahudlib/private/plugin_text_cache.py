@@ -0,0 +1,187 @@
+import os
+import threading
+import collections
+from camerahudlib.private.logger import logger
+
+
+class PluginTextCache(object):
+
+    # environment variable with expanded text entry count
+    kTextSizeVariable = "CAMERAHUD_TEXT_CACHE_SIZE"
+
+    # expanded text entries kept by each drawing manager and painter command lists
+    # kept by each viewport, looped frame count times frame dependent item count should fit
+    kTextSize = 8192
+
+    # rasterized text image count shared by legacy painters, holds drawn
+    # and prefetched images of dynamic text
+    kTextureSize = 512
+
+    # shared rasterized text cache
+    __textures__ = None
+
+    @staticmethod
+    def textSize():
+
+        """
+        get expanded text entry count, read from environment when set
+
+        :return - entry count (int)
+        """
+
+        value = os.environ.get(PluginTextCache.kTextSizeVariable)
+        if value:
+            try:
+                return int(value)
+
+            except ValueError as exception_data:
+                logger.error(repr(exception_data))
+                logger.error("can`t read " + PluginTextCache.kTextSizeVariable)
+
+        return PluginTextCache.kTextSize
+
+    @staticmethod
+    def textures():
+
+        """
+        get rasterized text cache shared by legacy painters
+
+        :return - rasterized text cache (PluginTextCache)
+        """
+
+        if PluginTextCache.__textures__ is None:
+            PluginTextCache.__textures__ = PluginTextCache(PluginTextCache.kTextureSize)
+
+        return PluginTextCache.__textures__
+
+    def __init__(self, size):
+
+        """
+        initialize least recently used cache, entries are written by prefetch thread too
+
+        :param size - maximum entry count (int)
+        """
+
+        self._size = max(int(size), 1)
+        self._entries = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+
+        """
+        get cached entry count
+
+        :return - entry count (int)
+        """
+
+        return len(self._entries)
+
+    def get(self, key):
+
+        """
+        get cached value, entry becomes most recently used
+
+        :param key - entry key (tuple)
+
+        :return - cached value or None (object)
+        """
+
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is None:
+                self._misses += 1
+                return None
+
+            self._entries[key] = value
+            self._hits += 1
+            return value
+
+    def peek(self, key):
+
+        """
+        get cached value, counters and entry order stay the same
+
+        :param key - entry key (tuple)
+
+        :return - cached value or None (object)
+        """
+
+        return self._entries.get(key)
+
+    def contains(self, key):
+
+        """
+        value is cached
+
+        :param key - entry key (tuple)
+
+        :return - value is cached (bool)
+        """
+
+        return key in self._entries
+
+    def set(self, key, value):
+
+        """
+        cache value, least recently used entry is dropped when cache is full
+
+        :param key - entry key (tuple)
+        :param value - cached value, None isn't cached (object)
+        """
+
+        if value is None:
+            return None
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+
+    def hits(self):
+
+        """
+        get lookup count which found cached value
+
+        :return - hit count (int)
+        """
+
+        return self._hits
+
+    def misses(self):
+
+        """
+        get lookup count which found nothing
+
+        :return - miss count (int)
+        """
+
+        return self._misses
+
+    def clear(self):
+
+        """
+        drop cached entries and reset counters
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def asDict(self):
+
+        """
+        get cache counters
+
+        :return - hits, misses, entry count and maximum entry count (dict)
+        """
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._entries),
+            "maxSize": self._size,
+        }
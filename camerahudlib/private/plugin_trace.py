@@ -0,0 +1,212 @@
+import os
+import json
+import threading
+from camerahudlib.private.logger import logger
+from camerahudlib.private.plugin_scheduler import PluginScheduler
+
+
+class PluginTrace(object):
+
+    # environment variable with trace file name, tracing starts on plugin load when set
+    kTraceVariable = "CAMERAHUD_TRACE"
+
+    # environment variable with traced frame count
+    kTraceFramesVariable = "CAMERAHUD_TRACE_FRAMES"
+
+    # traced frame count used when not provided
+    kDefaultFrames = 100
+
+    # event category
+    kCategory = "CameraHUD"
+
+    # tracing is active, checked before every event
+    __enabled__ = False
+
+    # recorded trace events
+    __events__ = []
+
+    # trace output file name
+    __filename__ = ""
+
+    # remaining frame count and node keys drawn in current frame
+    __frames__ = 0
+    __frame_keys__ = set()
+
+    @staticmethod
+    def initialize():
+
+        """
+        start tracing when trace environment variable is set
+        """
+
+        filename = os.environ.get(PluginTrace.kTraceVariable, "")
+        if not filename:
+            return None
+
+        frame_count = PluginTrace.kDefaultFrames
+        try:
+            frame_count = int(os.environ.get(PluginTrace.kTraceFramesVariable, frame_count))
+
+        except ValueError as exception_data:
+            logger.error(repr(exception_data))
+            logger.error("can`t read " + PluginTrace.kTraceFramesVariable)
+
+        PluginTrace.start(filename, frame_count)
+
+    @staticmethod
+    def start(filename, frame_count=None):
+
+        """
+        start recording trace events, previous trace is written first
+
+        :param filename - chrome trace event json file name (str)
+        :param frame_count - traced frame count, trace is written after it (int)
+        """
+
+        if PluginTrace.__enabled__:
+            PluginTrace.stop()
+
+        if frame_count is None or frame_count <= 0:
+            frame_count = PluginTrace.kDefaultFrames
+
+        PluginTrace.__events__ = []
+        PluginTrace.__filename__ = filename
+        PluginTrace.__frames__ = frame_count
+        PluginTrace.__frame_keys__ = set()
+        PluginTrace.__enabled__ = True
+
+        PluginTrace.instant("traceStart", frames=frame_count)
+        logger.warning("tracing next %d frames to %s" % (frame_count, filename))
+
+    @staticmethod
+    def stop():
+
+        """
+        stop recording and write trace file
+
+        :return - written file name, empty if nothing was written (str)
+        """
+
+        if not PluginTrace.__enabled__:
+            return ""
+
+        PluginTrace.__enabled__ = False
+        events = PluginTrace.__events__
+        filename = PluginTrace.__filename__
+        PluginTrace.__events__ = []
+        PluginTrace.__frame_keys__ = set()
+
+        try:
+            directory = os.path.dirname(filename)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            obj = open(filename, "w")
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, obj)
+            obj.close()
+
+        except Exception as exception_data:
+            logger.error(repr(exception_data))
+            logger.error("can`t write trace " + filename)
+            return ""
+
+        logger.warning("trace written to " + filename)
+        return filename
+
+    @staticmethod
+    def enabled():
+
+        """
+        tracing is active
+
+        :return - tracing is active (bool)
+        """
+
+        return PluginTrace.__enabled__
+
+    @staticmethod
+    def event(name, phase, args):
+
+        """
+        record trace event
+
+        :param name - event name (str)
+        :param phase - chrome trace event phase (str)
+        :param args - event arguments (dict)
+        """
+
+        event = {
+            "name": name,
+            "cat": PluginTrace.kCategory,
+            "ph": phase,
+            "ts": PluginScheduler.now() * 1000.0,
+            "pid": os.getpid(),
+            "tid": threading.current_thread().ident,
+        }
+        if args:
+            event["args"] = args
+
+        PluginTrace.__events__.append(event)
+
+    @staticmethod
+    def begin(name, **kwargs):
+
+        """
+        record begin of traced phase
+
+        :param name - phase name (str)
+        :param kwargs - event arguments (dict)
+        """
+
+        if PluginTrace.__enabled__:
+            PluginTrace.event(name, "B", kwargs)
+
+    @staticmethod
+    def end(name, **kwargs):
+
+        """
+        record end of traced phase
+
+        :param name - phase name (str)
+        :param kwargs - event arguments (dict)
+        """
+
+        if PluginTrace.__enabled__:
+            PluginTrace.event(name, "E", kwargs)
+
+    @staticmethod
+    def instant(name, **kwargs):
+
+        """
+        record instant event
+
+        :param name - event name (str)
+        :param kwargs - event arguments (dict)
+        """
+
+        if PluginTrace.__enabled__:
+            PluginTrace.event(name, "i", kwargs)
+            PluginTrace.__events__[-1]["s"] = "p"
+
+    @staticmethod
+    def frame(key):
+
+        """
+        account node draw, frame ends when node is drawn again, trace is
+        written after requested frame count
+
+        :param key - drawn node key (str)
+        """
+
+        if not PluginTrace.__enabled__:
+            return None
+
+        if key in PluginTrace.__frame_keys__:
+            PluginTrace.__frame_keys__ = set()
+            PluginTrace.__frames__ -= 1
+            PluginTrace.instant("frame", remaining=PluginTrace.__frames__)
+            if PluginTrace.__frames__ <= 0:
+                PluginTrace.stop()
+                return None
+
+        PluginTrace.__frame_keys__.add(key)
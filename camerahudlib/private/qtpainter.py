@@ -0,0 +1,517 @@
+import os
+import math
+from camerahudlib import constants
+from camerahudlib.private.qt.Qt import QtCore, QtGui, QtWidgets
+
+
+class QtPainter(object):
+
+    # fonts shared by painters of this process
+    __fonts__ = {}
+
+    # gl line stipple (pattern, factor) as dash pattern in pixels
+    kLineDashPattern = {
+        constants.kLineShortDotted: [2.0, 14.0],
+        constants.kLineDotted: [1.0, 7.0],
+        constants.kLineShortDashed: [16.0, 16.0],
+        constants.kLineDashed: [8.0, 8.0],
+    }
+
+    @staticmethod
+    def application():
+
+        """
+        get qt application, created on offscreen platform when missing
+
+        :return - application instance (QtCore.QCoreApplication)
+        """
+
+        application = QtCore.QCoreApplication.instance()
+        if application is None:
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+            application = QtWidgets.QApplication([])
+
+        return application
+
+    def __init__(self, width, height, image=None):
+
+        """
+        initialize painter
+
+        :param width - image width (int)
+        :param height - image height (int)
+        :param image - target image, transparent image is created if None (QtGui.QImage)
+        """
+
+        QtPainter.application()
+
+        if image is None:
+            image = QtGui.QImage(int(width), int(height), QtGui.QImage.Format_ARGB32_Premultiplied)
+            image.fill(QtCore.Qt.transparent)
+
+        self._image = image
+        self._width = image.width()
+        self._height = image.height()
+        self._is_begin = False
+
+        self._font_size = 10.0
+        self._font_stretch = 100
+        self._font_weight = constants.kFontStyleWeightLight
+        self._font_incline = constants.kFontStyleInclineNormal
+        self._font_line = constants.kFontStyleLineNone
+        self._font_name = "Arial"
+        self._font = None
+        self._font_metric = None
+
+        self._color = QtGui.QColor(0, 0, 0)
+        self._point_size = 1.0
+        self._line_width = 1.0
+        self._line_style = constants.kLineSolid
+
+        self._painter = QtGui.QPainter()
+
+        # painted areas as (x, y, width, height) in image coordinates
+        self._dirty_rects = []
+
+        # text rasterized into image
+        self._rasterizations = 0
+
+    def image(self):
+
+        """
+        get painted image
+
+        :return - target image (QtGui.QImage)
+        """
+
+        return self._image
+
+    def beginDrawable(self, view=None):
+
+        """
+        begin paint
+
+        :param view - unused, kept for painter compatibility
+        """
+
+        if self._is_begin is False:
+            if not self._painter.isActive():
+                self._painter.begin(self._image)
+                self._painter.setRenderHint(QtGui.QPainter.Antialiasing)
+
+            self._is_begin = True
+
+    def endDrawable(self):
+
+        """
+        end paint
+        """
+
+        self._is_begin = False
+
+    def end(self):
+
+        """
+        finish painting on target image
+
+        :return - target image (QtGui.QImage)
+        """
+
+        self._is_begin = False
+        if self._painter.isActive():
+            self._painter.end()
+
+        return self._image
+
+    def markDirty(self, rect, margin=0.0):
+
+        """
+        add painted area
+
+        :param rect - painted rectangle in image coordinates (QtCore.QRectF)
+        :param margin - extra border for pen width and antialiasing (float)
+        """
+
+        margin += 1.0
+        left = max(int(math.floor(rect.left() - margin)), 0)
+        top = max(int(math.floor(rect.top() - margin)), 0)
+        right = min(int(math.ceil(rect.right() + margin)), self._width)
+        bottom = min(int(math.ceil(rect.bottom() + margin)), self._height)
+        if right > left and bottom > top:
+            self._dirty_rects.append((left, top, right - left, bottom - top))
+
+    def dirtyRects(self):
+
+        """
+        get painted areas
+
+        :return - painted rectangles as (x, y, width, height) (list)
+        """
+
+        return list(self._dirty_rects)
+
+    def rasterizations(self):
+
+        """
+        get count of text rasterized by this painter
+
+        :return - rasterized text count (int)
+        """
+
+        return self._rasterizations
+
+    def isBegin(self):
+
+        """
+        is begin
+
+        :return - is begin paint (bool)
+        """
+
+        return self._is_begin
+
+    def isValid(self):
+
+        """
+        is valid
+
+        :return - is valid (bool)
+        """
+
+        return not self._image.isNull()
+
+    def setColor(self, color):
+
+        """
+        set color
+
+        :param color - color (OpenMaya.MColor)
+        """
+
+        if self.isBegin():
+            self._color = self.qcolor(color)
+
+    def setFontSize(self, size):
+
+        """
+        set font size
+
+        :param size - font size (int)
+        """
+
+        if self.isBegin():
+            self._font_size = size
+            self._font = None
+
+    def setFontIncline(self, incline):
+
+        """
+        set font incline
+
+        :param incline - font incline (OpenMayaRender.MUIDrawManager.TextIncline)
+        """
+
+        if self.isBegin():
+            self._font_incline = incline
+            self._font = None
+
+    def setFontWeight(self, weight):
+
+        """
+        set font weight
+
+        :param weight - font weight (int)
+        """
+
+        if self.isBegin():
+            self._font_weight = weight
+            self._font = None
+
+    def setFontStretch(self, stretch):
+
+        """
+        set font stretch
+
+        :param stretch - font stretch (int)
+        """
+
+        if self.isBegin():
+            self._font_stretch = stretch
+            self._font = None
+
+    def setFontLine(self, line):
+
+        """
+        set font line
+
+        :param line - font line (OpenMayaRender.MUIDrawManager.TextLine)
+        """
+
+        if self.isBegin():
+            self._font_line = line
+            self._font = None
+
+    def setFontName(self, name):
+
+        """
+        set font name
+
+        :param name - font name (str)
+        """
+
+        if self.isBegin():
+            self._font_name = name
+            self._font = None
+
+    def setPointSize(self, size):
+
+        """
+        set point size
+
+        :param size - point size (int)
+        """
+
+        if self.isBegin():
+            self._point_size = size
+
+    def setLineWidth(self, width):
+
+        """
+        set line width
+
+        :param width - line width (int)
+        """
+
+        if self.isBegin():
+            self._line_width = width
+
+    def setLineStyle(self, style):
+
+        """
+        set line style
+
+        :param style - line style (OpenMayaRender.MUIDrawManager.LineStyle)
+        """
+
+        if self.isBegin():
+            self._line_style = style
+
+    def line2d(self, from_point, to_point):
+
+        """
+        draw line 2d
+
+        :param from_point - source point (OpenMaya.MPoint)
+        :param to_point - target point (OpenMaya.MPoint)
+        """
+
+        if self.isBegin():
+            line = QtCore.QLineF(
+                from_point.x, self._height - from_point.y,
+                to_point.x, self._height - to_point.y
+            )
+            self._painter.setPen(self.pen())
+            self._painter.drawLine(line)
+            self.markDirty(QtCore.QRectF(line.p1(), line.p2()).normalized(), self._line_width)
+
+    def point2d(self, point):
+
+        """
+        draw point 2d
+
+        :param point - point (OpenMaya.MPoint)
+        """
+
+        if self.isBegin():
+            size = max(self._point_size, 1.0)
+            rect = QtCore.QRectF(point.x - size * 0.5, self._height - point.y - size * 0.5, size, size)
+            self._painter.fillRect(rect, self._color)
+            self.markDirty(rect)
+
+    def rect2d(self, position, up, scale_x, scale_y, filled=False):
+
+        """
+        draw rectangle 2d
+
+        :param position - rectangle position (OpenMaya.MPoint)
+        :param up - position direction (OpenMaya.MVector)
+        :param scale_x - scale by x (float)
+        :param scale_y - scale by y (float)
+        :param filled - fill rectangle (bool)
+        """
+
+        if self.isBegin():
+            angle = math.atan2(up.x, up.y) * 180 / math.pi
+
+            self._painter.save()
+            self._painter.translate(position.x - scale_x, self._height - position.y + scale_y)
+            self._painter.rotate(-angle)
+
+            rect = QtCore.QRectF(0.0, -scale_y * 2.0, scale_x * 2.0, scale_y * 2.0)
+            if filled:
+                self._painter.fillRect(rect, self._color)
+
+            else:
+                self._painter.setPen(self.pen())
+                self._painter.setBrush(QtCore.Qt.NoBrush)
+                self._painter.drawRect(rect)
+
+            self.markDirty(self._painter.transform().mapRect(rect), self._line_width)
+            self._painter.restore()
+
+    def circle2d(self, position, radius, filled=False):
+
+        """
+        draw circle 2d
+
+        :param position - circle position (OpenMaya.MPoint)
+        :param radius - circle radius (float)
+        :param filled - fill circle (bool)
+        """
+
+        if self.isBegin():
+            if filled:
+                self._painter.setPen(QtCore.Qt.NoPen)
+                self._painter.setBrush(QtGui.QBrush(self._color))
+
+            else:
+                self._painter.setPen(self.pen())
+                self._painter.setBrush(QtCore.Qt.NoBrush)
+
+            center = QtCore.QPointF(position.x, self._height - position.y)
+            self._painter.drawEllipse(center, radius, radius)
+            self.markDirty(QtCore.QRectF(center.x() - radius, center.y() - radius, radius * 2.0, radius * 2.0), self._line_width)
+
+    def text2d(self, position, text, alignment=constants.kLeft, backgroundSize=None, backgroundColor=None, dynamic=False):
+
+        """
+        draw text 2d
+
+        :param position - text position (OpenMaya.MPoint)
+        :param text - text (str)
+        :param alignment - text (OpenMayaRender.MUIDrawManager.TextAlignment)
+        :param backgroundSize - text background size (int)
+        :param backgroundColor - text background color (OpenMaya.MColor)
+        :param dynamic - text is dynamic (bool)
+        """
+
+        if self.isBegin():
+            font, font_metric = self.font()
+            if not backgroundSize:
+                backgroundSize = [font_metric.width(text), font_metric.height()]
+
+            # calculate position, same placement as GlPainter.text2d
+            alignment_offset = 0.0
+            if alignment == constants.kLeft:
+                alignment = QtCore.Qt.AlignLeft
+
+            else:
+                if alignment == constants.kRight:
+                    alignment = QtCore.Qt.AlignRight
+                    alignment_offset = backgroundSize[0]
+
+                elif alignment == constants.kCenter:
+                    alignment = QtCore.Qt.AlignHCenter
+                    alignment_offset = backgroundSize[0] * 0.5
+
+                else:
+                    alignment = QtCore.Qt.AlignLeft
+
+                text_width = font_metric.width(text)
+                if text_width >= backgroundSize[0]:
+                    alignment = QtCore.Qt.AlignLeft
+
+            alignment |= QtCore.Qt.AlignVCenter
+
+            width, height = backgroundSize[0], backgroundSize[1]
+            if width > 0 and height > 0:
+                x = int(position.x - alignment_offset)
+                y = int(position.y)
+                rect = QtCore.QRectF(x, self._height - y - height, width, height)
+
+                # fill background color
+                if backgroundColor is not None:
+                    self._painter.fillRect(rect, self.qcolor(backgroundColor))
+
+                # paint text
+                self._painter.setPen(QtGui.QPen(self._color))
+                self._painter.setFont(font)
+                self._painter.drawText(rect, alignment, text)
+                self._rasterizations += 1
+                self.markDirty(rect)
+
+    def pen(self):
+
+        """
+        get pen for current color, line width and line style
+
+        :return - pen (QtGui.QPen)
+        """
+
+        pen = QtGui.QPen(self._color)
+        pen.setWidthF(self._line_width)
+        pattern = QtPainter.kLineDashPattern.get(self._line_style)
+        if pattern is not None:
+            width = max(self._line_width, 1.0)
+            pen.setDashPattern([value / width for value in pattern])
+
+        return pen
+
+    def font(self):
+
+        """
+        get font for current font state, cached per process
+
+        :return - font and font metric (tuple)
+        """
+
+        if self._font is None:
+            key = (
+                self._font_name,
+                int(self._font_size),
+                self._font_stretch,
+                self._font_weight,
+                self._font_incline,
+                self._font_line
+            )
+            if key in QtPainter.__fonts__:
+                self._font, self._font_metric = QtPainter.__fonts__[key]
+                return self._font, self._font_metric
+
+            font = QtGui.QFont(self._font_name)
+            font.setPixelSize(max(int(self._font_size), 1))
+            font.setStretch(self._font_stretch)
+            font.setItalic(self._font_incline == constants.KFontStyleInclineItalic)
+
+            if self._font_weight == constants.kFontStyleWeightLight:
+                font.setWeight(QtGui.QFont.Light)
+
+            else:
+                font.setWeight(QtGui.QFont.Bold)
+
+            font.setOverline(self._font_line == constants.kFontStyleLineOverline)
+            font.setUnderline(self._font_line == constants.KFontStyleLineUnderline)
+            font.setStrikeOut(self._font_line == constants.KFontStyleLineStrikeout)
+
+            self._font = font
+            self._font_metric = QtGui.QFontMetrics(font)
+            QtPainter.__fonts__[key] = (self._font, self._font_metric)
+
+        return self._font, self._font_metric
+
+    @staticmethod
+    def qcolor(color):
+
+        """
+        create QtGui.QColor from OpenMaya.MColor
+
+        :param color - input color (OpenMaya.MColor)
+        :return - output color (QtGui.QColor)
+        """
+
+        return QtGui.QColor(
+            int(min(max(color.r, 0.0), 1.0) * 255),
+            int(min(max(color.g, 0.0), 1.0) * 255),
+            int(min(max(color.b, 0.0), 1.0) * 255),
+            int(min(max(color.a, 0.0), 1.0) * 255)
+        )